@@ -0,0 +1,111 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["jsonschema>=4.23.0"]
+# ///
+
+"""Compare the memory held by applicant bundles as nested dicts and as bundle_model objects.
+
+Two scenarios, each holding `--count` seeded bulk applicants (generate_bulk_bundles.py) at once:
+
+- generated: the bulk builders' output kept as model objects vs. converted to dicts with
+  `to_dict()` (the shape the generators produced before the model layer);
+- loaded: NDJSON lines parsed with `json.loads` vs. parsed and turned into models with
+  `Applicant.from_dict`, which interns repeated strings. JSON parsing allocates a fresh string
+  for every value, so this is where interning matters most.
+
+Memory is the tracemalloc total still allocated once the list is built (after a gc pass), so
+it counts only what the representation keeps alive. Every model is also checked to serialize
+back to exactly the JSON it came from. Build times include tracemalloc overhead; compare them
+only with each other.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+from bundle_model import Applicant
+from generate_bulk_bundles import bulk_applicant
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=5_000, help="Applicants held in memory per case.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("-o", "--output", type=Path, help="Write the results as JSON.")
+    return parser.parse_args()
+
+
+def measure(build: Callable[[], list[Any]]) -> tuple[list[Any], int, float]:
+    """(built list, bytes it keeps allocated, seconds to build)."""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    built = build()
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return built, held, elapsed
+
+
+def print_table(results: dict[str, Any]) -> None:
+    print(f"{'case':22} {'MB':>8} {'KB/applicant':>13} {'build s':>8} {'vs dicts':>9}")
+    for name, r in results["cases"].items():
+        vs = f"{r['vs_dicts']:.2f}x" if "vs_dicts" in r else ""
+        print(f"{name:22} {r['mb']:8.1f} {r['kb_per_applicant']:13.2f} {r['build_sec']:8.2f} {vs:>9}")
+
+
+def write_json(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def main() -> None:
+    args = parse_args()
+    indexes = range(1, args.count + 1)
+    print(f"Serializing {args.count} bulk applicants (seed {args.seed}) ...", flush=True)
+    lines = [json.dumps(bulk_applicant(args.seed, index).to_dict()) for index in indexes]
+
+    cases: dict[str, Callable[[], list[Any]]] = {
+        "generated/dicts": lambda: [bulk_applicant(args.seed, index).to_dict() for index in indexes],
+        "generated/models": lambda: [bulk_applicant(args.seed, index) for index in indexes],
+        "loaded/dicts": lambda: [json.loads(line) for line in lines],
+        "loaded/models": lambda: [Applicant.from_dict(json.loads(line)) for line in lines],
+    }
+    results: dict[str, Any] = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "count": args.count,
+        "cases": {},
+    }
+    for name, build in cases.items():
+        built, held, elapsed = measure(build)
+        if name == "loaded/models":
+            mismatched = sum(json.dumps(model.to_dict()) != line for model, line in zip(built, lines))
+            if mismatched:
+                raise SystemExit(f"{mismatched} applicant(s) did not serialize back to their source JSON")
+        del built
+        case = results["cases"][name] = {
+            "bytes": held,
+            "mb": held / 2**20,
+            "kb_per_applicant": held / 1024 / args.count,
+            "build_sec": elapsed,
+        }
+        baseline = results["cases"].get(name.replace("/models", "/dicts"))
+        if name.endswith("/models") and baseline:
+            case["vs_dicts"] = held / baseline["bytes"]
+    print_table(results)
+    if args.output:
+        write_json(args.output, results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["numpy>=1.26", "pillow>=10.4.0", "reportlab>=4.2.0"]
+# ///
+
+"""Benchmark every local renderer on fixed fixture documents.
+
+Fixtures are the first document of each credit-checking Rendering_Method in the applicant
+bundle manifest and of each financial-aid render_template, rendered as-is (scale 1) and with
+their content lists repeated to stress layout and pagination. Each case reports documents/sec,
+ms/page and peak RSS; results can be saved as a baseline and later runs compared against it,
+exiting non-zero when any case's throughput drops by more than the threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import re
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+import generate_financial_aid_demo_data as fa
+import render_synthetic_documents as credit
+from render_cache import CACHE_DIR
+from render_metrics import measure, summarize
+
+BASELINE_PATH = CACHE_DIR.parent / "benchmarks" / "render_baseline.json"
+DEFAULT_SCALES = (1, 4)
+PDF_PAGE = re.compile(rb"/Type /Page\b(?!s)")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", type=Path, default=credit.DATA_PATH, help="Credit-checking bundle manifest.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed renders per case (after one warm-up render).")
+    parser.add_argument(
+        "--scales",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SCALES),
+        help="Content multipliers; 1 is the fixture as-is, larger values repeat its text lists.",
+    )
+    parser.add_argument("--only", default="", help="Run only cases whose name contains this substring.")
+    parser.add_argument("-o", "--output", type=Path, help="Write this run's results as JSON.")
+    parser.add_argument("--save-baseline", action="store_true", help="Also write the results to --baseline.")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--compare", action="store_true", help="Compare against --baseline and fail on regressions.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.15,
+        help="Allowed fractional drop in documents/sec before a case counts as a regression.",
+    )
+    return parser.parse_args()
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    name: str
+    renderer: str
+    scale: int
+    suffix: str
+    render: Callable[[Path], Any]
+
+
+def scaled(content: dict[str, Any], scale: int) -> dict[str, Any]:
+    """Copy of `content` with each top-level list (lines, courses, scores, ...) repeated `scale` times."""
+    return {key: value * scale if isinstance(value, list) else value for key, value in content.items()}
+
+
+def credit_renderer(method: str) -> str:
+    return {
+        "pristine_pdf": "render_pristine_pdf",
+        "scanned_pdf": "render_scanned_pdf",
+        "raw_text_pdf": "render_raw_text_pdf",
+        "raw_text_txt": "render_raw_text_txt",
+    }.get(method, "render_scan_webp")
+
+
+def fa_renderer(doc: dict[str, Any]) -> str:
+    if doc["format"] == "pdf":
+        return "render_pdf_document"
+    return "render_card_photo" if doc["render_template"] in {"id_card_photo", "ead_card_photo"} else "render_page_photo"
+
+
+def credit_cases(data: dict[str, Any], scales: list[int]) -> list[BenchCase]:
+    fixtures: dict[str, dict[str, Any]] = {}
+    for applicant in data["applicants"]:
+        for doc in applicant["Document_Bundle"]:
+            fixtures.setdefault(doc["Rendering_Method"], doc)
+    cases = []
+    for method, fixture in sorted(fixtures.items()):
+        for scale in scales:
+            doc = {**fixture, "Structured_Content": scaled(fixture["Structured_Content"], scale)}
+
+            def render(out_path: Path, doc: dict[str, Any] = doc) -> Any:
+                rng = credit.document_rng(42, doc["Document_ID"])
+                return credit.render_document(doc, out_path, rng, webp_backend="local", gemimg_timeout_sec=0)
+
+            suffix = Path(fixture["Output_File_Name"]).suffix
+            cases.append(BenchCase(f"credit:{method}@x{scale}", credit_renderer(method), scale, suffix, render))
+    return cases
+
+
+def fa_cases(scales: list[int]) -> list[BenchCase]:
+    fixtures: dict[str, dict[str, Any]] = {}
+    for applicant in fa.build_applicants():
+        for doc in applicant["document_bundle"]:
+            fixtures.setdefault(doc["render_template"], doc)
+    cases = []
+    for template, fixture in sorted(fixtures.items()):
+        for scale in scales:
+            doc = {**fixture, "body_lines": fixture["body_lines"] * scale}
+
+            def render(out_path: Path, doc: dict[str, Any] = doc) -> Any:
+                return fa.render_document(doc, out_path)
+
+            suffix = Path(fixture["file_name"]).suffix
+            cases.append(BenchCase(f"fa:{template}@x{scale}", fa_renderer(fixture), scale, suffix, render))
+    return cases
+
+
+def page_count(path: Path) -> int:
+    if path.suffix == ".pdf":
+        return max(1, len(PDF_PAGE.findall(path.read_bytes())))
+    pages = 1
+    while credit.scan_page_path(path, pages + 1).exists():
+        pages += 1
+    return pages
+
+
+def run_case(case: BenchCase, repeat: int, work_dir: Path) -> dict[str, Any]:
+    out_path = work_dir / f"{case.name.replace(':', '_').replace('@', '_')}{case.suffix}"
+    case.render(out_path)  # warm fonts, page templates and noise tiles
+    runs = []
+    for _ in range(max(1, repeat)):
+        out_path.unlink(missing_ok=True)
+        with measure() as metrics:
+            case.render(out_path)
+        runs.append(metrics.finish([out_path]))
+    pages = page_count(out_path)
+    total_sec = sum(run["wall_ms"] for run in runs) / 1000
+    return {
+        "renderer": case.renderer,
+        "scale": case.scale,
+        "repeat": len(runs),
+        "pages": pages,
+        "docs_per_sec": round(len(runs) / total_sec, 3) if total_sec else None,
+        "ms_per_page": round(total_sec * 1000 / (len(runs) * pages), 2),
+        "wall_ms": summarize([run["wall_ms"] for run in runs]),
+        "cpu_ms": summarize([run["cpu_ms"] for run in runs]),
+        "peak_rss_mb": max(run["peak_rss_mb"] for run in runs),
+        "output_bytes": runs[-1]["output_bytes"],
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> list[str]:
+    """Return one message per case whose documents/sec fell more than `threshold` below the baseline."""
+    regressions = []
+    for name, result in current["cases"].items():
+        before = baseline.get("cases", {}).get(name)
+        if not before or not before.get("docs_per_sec") or not result.get("docs_per_sec"):
+            continue
+        ratio = result["docs_per_sec"] / before["docs_per_sec"]
+        result["vs_baseline"] = round(ratio, 3)
+        if ratio < 1.0 - threshold:
+            regressions.append(
+                f"{name}: {result['docs_per_sec']:.2f} docs/s vs baseline {before['docs_per_sec']:.2f} "
+                f"({(1.0 - ratio) * 100:.0f}% slower)"
+            )
+    return regressions
+
+
+def print_table(results: dict[str, Any]) -> None:
+    print(f"{'case':44} {'renderer':22} {'docs/s':>8} {'ms/page':>9} {'pages':>5} {'rss MB':>7} {'vs base':>8}")
+    for name, r in results["cases"].items():
+        vs = f"{r['vs_baseline']:.2f}x" if "vs_baseline" in r else ""
+        print(
+            f"{name:44} {r['renderer']:22} {r['docs_per_sec']:8.2f} {r['ms_per_page']:9.1f} "
+            f"{r['pages']:5d} {r['peak_rss_mb']:7.1f} {vs:>8}"
+        )
+
+
+def write_json(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def main() -> None:
+    args = parse_args()
+    cases = credit_cases(credit.load_json(args.input), args.scales) + fa_cases(args.scales)
+    cases = [case for case in cases if args.only in case.name]
+    results: dict[str, Any] = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "renderer_versions": {"credit": credit.RENDERER_VERSION, "financial_aid": fa.RENDERER_VERSION},
+        "repeat": args.repeat,
+        "cases": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="render-bench-") as tmp:
+        for case in cases:
+            print(f"  {case.name} ...", end="", flush=True)
+            results["cases"][case.name] = run_case(case, args.repeat, Path(tmp))
+            print(f" {results['cases'][case.name]['docs_per_sec']:.2f} docs/s")
+
+    regressions: list[str] = []
+    if args.compare:
+        if not args.baseline.exists():
+            sys.exit(f"No baseline at {args.baseline}; run with --save-baseline first.")
+        regressions = compare(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.threshold)
+    print_table(results)
+
+    if args.output:
+        write_json(args.output, results)
+    if args.save_baseline:
+        write_json(args.baseline, results)
+        print(f"Saved baseline -> {args.baseline}")
+    if regressions:
+        print(f"Throughput regressions beyond {args.threshold:.0%}:")
+        for message in regressions:
+            print(f"  {message}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
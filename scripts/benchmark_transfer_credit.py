@@ -0,0 +1,151 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["jsonschema>=4.23.0"]
+# ///
+
+"""Benchmark the transfer-credit equivalency engine (scripts/transfer_credit.py).
+
+Two parts. Agreement: every demo bundle is evaluated and its mapped course codes are compared with
+the hand-written Expected_AI_Output (gold codes recovered, extra codes proposed, totals that match).
+The run fails if a gold code is missing or a credit total differs; extra codes are only reported,
+since the reference lists just a sample of the courses inside an evaluator's block credit.
+Throughput: `--count` seeded bulk bundles (generate_bulk_bundles.py; generation is not timed) are
+evaluated `--repeat` times with a fresh catalog each time, so the title memo starts cold, and the
+best run is reported as bundles/sec. `--min-rate` turns the result into a check as well.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator
+
+from generate_bulk_bundles import iter_applicants
+from generate_synthetic_bundles import DATA_PATH
+from transfer_credit import EquivalencyCatalog, evaluate_chunk, evaluate_many
+
+CHUNK_SIZE = 500
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--input", type=Path, default=DATA_PATH, help="Demo bundle dataset with Expected_AI_Output.")
+    parser.add_argument("--count", type=int, default=5_000, help="Bulk bundles to evaluate per timed run.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs; the fastest is reported.")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes (0 = one per CPU).")
+    parser.add_argument("--min-rate", type=float, default=0.0, help="Exit non-zero below this many bundles/sec.")
+    parser.add_argument("-o", "--output", type=Path, help="Write the results as JSON.")
+    return parser.parse_args()
+
+
+def agreement(applicants: list[dict[str, Any]]) -> dict[str, Any]:
+    gold_codes = recovered = extra = totals_matched = 0
+    per_applicant = {}
+    for applicant, derived in zip(applicants, evaluate_many(applicants, EquivalencyCatalog())):
+        expected = applicant["Expected_AI_Output"]
+        gold = {item["proposed_college_course_code"] for item in expected["Mapped_Courses"]}
+        got = {item["proposed_college_course_code"] for item in derived["Mapped_Courses"]}
+        gold_codes += len(gold)
+        recovered += len(gold & got)
+        extra += len(got - gold)
+        totals_matched += derived["Proposed_Transfer_Credits_Total"] == expected["Proposed_Transfer_Credits_Total"]
+        per_applicant[applicant["Applicant_ID"]] = {
+            "missing": sorted(gold - got),
+            "extra": sorted(got - gold),
+            "derived_total": derived["Proposed_Transfer_Credits_Total"],
+            "expected_total": expected["Proposed_Transfer_Credits_Total"],
+        }
+    return {
+        "bundles": len(applicants),
+        "gold_codes": gold_codes,
+        "gold_codes_recovered": recovered,
+        "extra_codes": extra,
+        "totals_matched": totals_matched,
+        "applicants": per_applicant,
+    }
+
+
+def chunks(items: list[dict[str, Any]], size: int) -> Iterator[list[dict[str, Any]]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def timed_run(bundles: list[dict[str, Any]], pool: ProcessPoolExecutor | None) -> tuple[float, list[dict[str, Any]]]:
+    started = time.perf_counter()
+    if pool is None:
+        results = list(evaluate_many(bundles, EquivalencyCatalog()))
+    else:
+        results = [result for chunk in pool.map(evaluate_chunk, chunks(bundles, CHUNK_SIZE)) for result in chunk]
+    return time.perf_counter() - started, results
+
+
+def main() -> None:
+    args = parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    demo = json.loads(args.input.read_text(encoding="utf-8"))["applicants"]
+    agreed = agreement(demo)
+    print(
+        f"Agreement with Expected_AI_Output on {agreed['bundles']} demo bundles: "
+        f"{agreed['gold_codes_recovered']}/{agreed['gold_codes']} gold course codes recovered, "
+        f"{agreed['extra_codes']} extra proposed, {agreed['totals_matched']} credit totals equal"
+    )
+    disagreements = []
+    for applicant_id, diff in agreed["applicants"].items():
+        if diff["missing"]:
+            disagreements.append(f"{applicant_id} missing {', '.join(diff['missing'])}")
+        if diff["derived_total"] != diff["expected_total"]:
+            disagreements.append(f"{applicant_id} total {diff['derived_total']:g}, expected {diff['expected_total']:g}")
+    for line in disagreements:
+        print(f"  {line}")
+
+    print(f"Generating {args.count} bulk bundles (seed {args.seed}) ...", flush=True)
+    bundles = list(iter_applicants(args.count, args.seed))
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        runs = []
+        for _ in range(max(1, args.repeat)):
+            elapsed, results = timed_run(bundles, pool)
+            runs.append(elapsed)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    best = min(runs)
+    rate = len(bundles) / best if best > 0 else float("inf")
+    mapped = sum(len(result["Mapped_Courses"]) for result in results)
+    credits = sum(result["Proposed_Transfer_Credits_Total"] for result in results)
+    print(
+        f"Evaluated {len(bundles)} bundles in {best * 1000:.1f} ms (best of {len(runs)}, {jobs} job(s)): "
+        f"{rate:,.0f} bundles/sec, {mapped / len(bundles):.1f} mapped courses and "
+        f"{credits / len(bundles):.1f} credits per bundle"
+    )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        summary = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "jobs": jobs,
+            "bundles": len(bundles),
+            "runs_sec": [round(run, 4) for run in runs],
+            "bundles_per_sec": round(rate, 1),
+            "agreement": agreed,
+        }
+        args.output.write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+    if disagreements:
+        sys.exit(f"Disagrees with Expected_AI_Output on {len(disagreements)} check(s); see above")
+    if rate < args.min_rate:
+        sys.exit(f"Throughput {rate:,.0f} bundles/sec is below --min-rate {args.min_rate:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
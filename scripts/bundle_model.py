@@ -0,0 +1,375 @@
+"""Slotted, typed in-memory model of applicant bundles: applicants, documents, courses, scores.
+
+The generators used to build every record as nested dicts, and a 100k-applicant dataset held in
+memory was mostly per-key dict overhead plus one copy of each issuer, grade and term label per
+occurrence. These classes use `__slots__` (no per-instance `__dict__`), and strings that repeat
+across a dataset are passed through `sys.intern`, so every "Completed", "Fall" or "Department of
+Defense" is one object. Leaf records (courses, scores, ACE recommendations, visual profiles,
+mappings) are never modified after construction, so profiles and documents share them instead of
+deep-copying. They are not `frozen`: a frozen dataclass sets every field through
+`object.__setattr__`, which made building one about three times slower.
+
+`to_dict()` produces exactly the JSON shape the schema describes (same keys, same order,
+optional keys omitted when empty), and `from_dict()` reads it back, interning as it goes.
+`Structured_Content`, `Persona` and `Expected_AI_Output` stay dicts, since their keys vary by
+document type or archetype; the courses, scores, ACE recommendations, mapping hints and visual
+profile inside them are model objects. `to_dict()` converts those and shares the remaining plain
+values rather than copying them, so treat its result as read-only. `as_json` converts any mix of
+models, dicts and lists to plain JSON values.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from typing import Any
+
+
+def intern(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
+class Course:
+    course_code: str
+    course_title: str
+    term_label: str
+    year: int
+    credits: float
+    grade: str | None
+    status: str = "Completed"
+    level: str | None = None
+    source_system: str | None = None
+    notes: str | None = None
+
+    def __post_init__(self) -> None:
+        self.course_code = intern(self.course_code)
+        self.course_title = intern(self.course_title)
+        self.term_label = intern(self.term_label)
+        self.grade = intern(self.grade)
+        self.status = intern(self.status)
+        self.level = intern(self.level)
+        self.source_system = intern(self.source_system)
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "course_code": self.course_code,
+            "course_title": self.course_title,
+            "term_label": self.term_label,
+            "year": self.year,
+            "credits": self.credits,
+            "grade": self.grade,
+            "status": self.status,
+        }
+        if self.level:
+            out["level"] = self.level
+        if self.source_system:
+            out["source_system"] = self.source_system
+        if self.notes:
+            out["notes"] = self.notes
+        return out
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Course:
+        return cls(
+            data["course_code"],
+            data["course_title"],
+            data["term_label"],
+            data["year"],
+            data["credits"],
+            data["grade"],
+            status=data.get("status", "Completed"),
+            level=data.get("level"),
+            source_system=data.get("source_system"),
+            notes=data.get("notes"),
+        )
+
+
+@dataclass(slots=True)
+class Score:
+    test_name: str
+    section: str
+    score: float
+    scale: str
+    test_date: str
+
+    def __post_init__(self) -> None:
+        self.test_name = intern(self.test_name)
+        self.section = intern(self.section)
+        self.scale = intern(self.scale)
+        self.test_date = intern(self.test_date)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "test_name": self.test_name,
+            "section": self.section,
+            "score": self.score,
+            "scale": self.scale,
+            "test_date": self.test_date,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Score:
+        return cls(data["test_name"], data["section"], data["score"], data["scale"], data["test_date"])
+
+
+@dataclass(slots=True)
+class AceRecommendation:
+    experience_or_training: str
+    subject: str
+    lower_division_credits: float
+    upper_division_credits: float
+    recommendation_basis: str
+
+    def __post_init__(self) -> None:
+        self.experience_or_training = intern(self.experience_or_training)
+        self.subject = intern(self.subject)
+        self.recommendation_basis = intern(self.recommendation_basis)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "experience_or_training": self.experience_or_training,
+            "subject": self.subject,
+            "lower_division_credits": self.lower_division_credits,
+            "upper_division_credits": self.upper_division_credits,
+            "recommendation_basis": self.recommendation_basis,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AceRecommendation:
+        return cls(
+            data["experience_or_training"],
+            data["subject"],
+            data["lower_division_credits"],
+            data["upper_division_credits"],
+            data["recommendation_basis"],
+        )
+
+
+@dataclass(slots=True)
+class VisualProfile:
+    style: str
+    paper_tone: str
+    artifact_level: str
+    rotation_degrees: float = 0.0
+    blur_px: float = 0.0
+    perspective_skew: float = 0.0
+    notes: str = ""
+
+    def __post_init__(self) -> None:
+        self.style = intern(self.style)
+        self.paper_tone = intern(self.paper_tone)
+        self.artifact_level = intern(self.artifact_level)
+        self.notes = intern(self.notes)
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "style": self.style,
+            "paper_tone": self.paper_tone,
+            "artifact_level": self.artifact_level,
+        }
+        if self.rotation_degrees:
+            out["rotation_degrees"] = self.rotation_degrees
+        if self.blur_px:
+            out["blur_px"] = self.blur_px
+        if self.perspective_skew:
+            out["perspective_skew"] = self.perspective_skew
+        if self.notes:
+            out["notes"] = self.notes
+        return out
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> VisualProfile:
+        return cls(
+            data["style"],
+            data["paper_tone"],
+            data["artifact_level"],
+            rotation_degrees=data.get("rotation_degrees", 0.0),
+            blur_px=data.get("blur_px", 0.0),
+            perspective_skew=data.get("perspective_skew", 0.0),
+            notes=data.get("notes", ""),
+        )
+
+
+@dataclass(slots=True)
+class CourseMapping:
+    source_evidence: str
+    proposed_college_course_code: str
+    proposed_college_course_title: str
+    credits: float
+    rationale: str
+
+    def __post_init__(self) -> None:
+        self.proposed_college_course_code = intern(self.proposed_college_course_code)
+        self.proposed_college_course_title = intern(self.proposed_college_course_title)
+        self.rationale = intern(self.rationale)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "source_evidence": self.source_evidence,
+            "proposed_college_course_code": self.proposed_college_course_code,
+            "proposed_college_course_title": self.proposed_college_course_title,
+            "credits": self.credits,
+            "rationale": self.rationale,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> CourseMapping:
+        return cls(
+            data["source_evidence"],
+            data["proposed_college_course_code"],
+            data["proposed_college_course_title"],
+            data["credits"],
+            data["rationale"],
+        )
+
+
+# Structured_Content keys holding model lists, and the one holding a single model.
+STRUCTURED_LISTS: dict[str, type] = {
+    "courses": Course,
+    "scores": Score,
+    "ace_recommendations": AceRecommendation,
+    "ai_mapping_hints": CourseMapping,
+}
+STRUCTURED_ITEMS: dict[str, type] = {"visual_profile": VisualProfile}
+
+
+def structured_to_dict(content: dict[str, Any]) -> dict[str, Any]:
+    """JSON form of a Structured_Content dict; other values are plain JSON already and are shared, not copied."""
+    out: dict[str, Any] = {}
+    for key, value in content.items():
+        if key in STRUCTURED_LISTS:
+            value = [item.to_dict() for item in value]
+        elif key in STRUCTURED_ITEMS:
+            value = value.to_dict()
+        out[key] = value
+    return out
+
+
+def structured_from_dict(content: dict[str, Any]) -> dict[str, Any]:
+    out: dict[str, Any] = {}
+    for key, value in content.items():
+        if key in STRUCTURED_LISTS:
+            value = [STRUCTURED_LISTS[key].from_dict(item) for item in value]
+        elif key in STRUCTURED_ITEMS:
+            value = STRUCTURED_ITEMS[key].from_dict(value)
+        out[intern(key)] = value
+    return out
+
+
+@dataclass(slots=True)
+class Document:
+    document_id: str
+    document_type: str
+    title: str
+    issuer: str
+    issue_date: str
+    document_format: str
+    rendering_method: str
+    output_file_name: str
+    page_count: int
+    structured_content: dict[str, Any]
+    gemimg_prompt: str | None = None
+
+    def __post_init__(self) -> None:
+        self.document_type = intern(self.document_type)
+        self.title = intern(self.title)
+        self.issuer = intern(self.issuer)
+        self.document_format = intern(self.document_format)
+        self.rendering_method = intern(self.rendering_method)
+
+    def to_dict(self) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "Document_ID": self.document_id,
+            "Document_Type": self.document_type,
+            "Title": self.title,
+            "Issuing_Organization": self.issuer,
+            "Issue_Date": self.issue_date,
+            "Document_Format": self.document_format,
+            "Rendering_Method": self.rendering_method,
+            "Output_File_Name": self.output_file_name,
+            "Page_Count": self.page_count,
+            "Structured_Content": structured_to_dict(self.structured_content),
+        }
+        if self.gemimg_prompt:
+            out["Gemimg_Prompt"] = self.gemimg_prompt
+        return out
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Document:
+        return cls(
+            data["Document_ID"],
+            data["Document_Type"],
+            data["Title"],
+            data["Issuing_Organization"],
+            data["Issue_Date"],
+            data["Document_Format"],
+            data["Rendering_Method"],
+            data["Output_File_Name"],
+            data["Page_Count"],
+            structured_from_dict(data["Structured_Content"]),
+            data.get("Gemimg_Prompt"),
+        )
+
+
+@dataclass(slots=True)
+class Applicant:
+    applicant_id: str
+    archetype_code: str
+    archetype_label: str
+    persona: dict[str, Any]
+    target_program: str
+    admissions_term: str
+    documents: list[Document]
+    expected_output: dict[str, Any]  # Expected_AI_Output; Mapped_Courses holds CourseMapping objects
+
+    def __post_init__(self) -> None:
+        self.archetype_code = intern(self.archetype_code)
+        self.archetype_label = intern(self.archetype_label)
+        self.target_program = intern(self.target_program)
+        self.admissions_term = intern(self.admissions_term)
+
+    def to_dict(self) -> dict[str, Any]:
+        expected = dict(self.expected_output)
+        if "Mapped_Courses" in expected:
+            expected["Mapped_Courses"] = [item.to_dict() for item in expected["Mapped_Courses"]]
+        return {
+            "Applicant_ID": self.applicant_id,
+            "Archetype_Code": self.archetype_code,
+            "Archetype_Label": self.archetype_label,
+            "Persona": self.persona,
+            "Target_Program": self.target_program,
+            "Admissions_Term": self.admissions_term,
+            "Document_Bundle": [doc.to_dict() for doc in self.documents],
+            "Expected_AI_Output": expected,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Applicant:
+        expected = {intern(key): value for key, value in data["Expected_AI_Output"].items()}
+        if "Mapped_Courses" in expected:
+            expected["Mapped_Courses"] = [CourseMapping.from_dict(item) for item in expected["Mapped_Courses"]]
+        return cls(
+            data["Applicant_ID"],
+            data["Archetype_Code"],
+            data["Archetype_Label"],
+            {intern(key): value for key, value in data["Persona"].items()},
+            data["Target_Program"],
+            data["Admissions_Term"],
+            [Document.from_dict(doc) for doc in data["Document_Bundle"]],
+            expected,
+        )
+
+
+MODELS = (Course, Score, AceRecommendation, VisualProfile, CourseMapping, Document, Applicant)
+
+
+def as_json(value: Any) -> Any:
+    """Plain JSON value for `value`, converting models wherever they sit in dicts and lists."""
+    if isinstance(value, MODELS):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: as_json(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [as_json(item) for item in value]
+    return value
@@ -0,0 +1,387 @@
+"""Indexed SQLite catalog of the generated datasets and render results, for ops queries.
+
+Questions like "which WEBP scans fell back from gemimg" or "applicants with a TOEFL total below
+90" used to mean loading a whole manifest and scanning it. The generators now also export what
+they write into `.cache/catalog.sqlite3`:
+
+- credit-checking bundles: applicants, documents, courses, scores, mapped_courses
+- render_manifest.json: render_results (engine, status and output per document)
+- financial-aid all_applicants.json: fa_applicants, fa_documents, chat_turns, form_updates
+
+Updates are incremental. Each record (an applicant, or an applicant's render results) is stored
+with a digest of its canonical JSON; a load rewrites only records whose digest changed and drops
+records that disappeared, in one transaction, so re-exporting an unchanged 100k-applicant
+dataset is a digest pass. Rows carry the dataset_id of the file they came from, so the demo and
+bulk datasets (which reuse applicant IDs) sit side by side. Standard library only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import chain
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+ROOT = Path(__file__).resolve().parents[1]
+CATALOG_PATH = ROOT / ".cache" / "catalog.sqlite3"
+CATALOG_VERSION = 1  # bump when TABLES change; an older catalog is rebuilt from the next loads
+
+Row = tuple[str, dict[str, Any]]
+
+TABLES: dict[str, tuple[str, ...]] = {
+    "datasets": ("source", "dataset_id", "path", "generated_on", "record_count", "updated_at"),
+    "loaded": ("source", "dataset_id", "record_id", "digest"),
+    "applicants": (
+        "dataset_id", "applicant_id", "archetype_code", "archetype_label", "full_name", "preferred_name",
+        "target_program", "admissions_term", "target_pathway", "transfer_credits_total", "document_count",
+    ),
+    "documents": (
+        "dataset_id", "document_id", "applicant_id", "document_type", "document_format", "rendering_method",
+        "title", "issuing_organization", "issue_date", "page_count", "output_file_name",
+    ),
+    "courses": (
+        "dataset_id", "applicant_id", "document_id", "course_code", "course_title", "credits", "grade",
+        "level", "source_system", "status", "term_label", "year",
+    ),
+    "scores": ("dataset_id", "applicant_id", "document_id", "test_name", "section", "score", "scale", "test_date"),
+    "mapped_courses": (
+        "dataset_id", "applicant_id", "course_code", "course_title", "credits", "source_evidence", "rationale",
+    ),
+    "render_results": (
+        "dataset_id", "document_id", "applicant_id", "document_type", "document_format", "rendering_method",
+        "engine", "status", "output_file", "wall_ms",
+    ),
+    "fa_applicants": (
+        "dataset_id", "applicant_id", "full_name", "folder_name", "aid_year", "dependency_status",
+        "household_size", "sai_estimate", "outcome_status", "final_owner", "completion_percent", "chat_turn_count",
+    ),
+    "fa_documents": (
+        "dataset_id", "doc_id", "applicant_id", "doc_type", "title", "format", "document_role", "issuer",
+        "issue_date", "render_template", "file_name", "quality_flags",
+    ),
+    "chat_turns": (
+        "dataset_id", "applicant_id", "turn", "timestamp", "speaker", "language", "intent", "sentiment", "message",
+    ),
+    "form_updates": (
+        "dataset_id", "applicant_id", "turn", "form_id", "field_id", "field_label", "new_value", "source", "confidence",
+    ),
+}
+PRIMARY_KEYS = {
+    "datasets": ("source", "dataset_id"),
+    "loaded": ("source", "dataset_id", "record_id"),
+    "applicants": ("dataset_id", "applicant_id"),
+    "documents": ("dataset_id", "document_id"),
+    "render_results": ("dataset_id", "document_id"),
+    "fa_applicants": ("dataset_id", "applicant_id"),
+    "fa_documents": ("dataset_id", "doc_id"),
+}
+INDEXES = {
+    "documents": [("dataset_id", "applicant_id"), ("document_type",), ("rendering_method",)],
+    "courses": [("dataset_id", "applicant_id"), ("course_code",)],
+    "scores": [("dataset_id", "applicant_id"), ("test_name", "section", "score")],
+    "mapped_courses": [("dataset_id", "applicant_id"), ("course_code",)],
+    "render_results": [("dataset_id", "applicant_id"), ("status", "engine"), ("rendering_method",)],
+    "fa_documents": [("dataset_id", "applicant_id"), ("doc_type",)],
+    "chat_turns": [("dataset_id", "applicant_id"), ("intent",)],
+    "form_updates": [("dataset_id", "applicant_id"), ("form_id", "field_id")],
+    "fa_applicants": [("outcome_status",)],
+}
+
+
+def cell(value: Any) -> Any:
+    """SQLite value for a JSON value; lists and objects are stored as JSON text."""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def credit_rows(applicant: dict[str, Any]) -> Iterator[Row]:
+    applicant_id = applicant["Applicant_ID"]
+    persona = applicant.get("Persona", {})
+    expected = applicant.get("Expected_AI_Output", {})
+    yield "applicants", {
+        "applicant_id": applicant_id,
+        "archetype_code": applicant.get("Archetype_Code"),
+        "archetype_label": applicant.get("Archetype_Label"),
+        "full_name": persona.get("full_name"),
+        "preferred_name": persona.get("preferred_name"),
+        "target_program": applicant.get("Target_Program"),
+        "admissions_term": applicant.get("Admissions_Term"),
+        "target_pathway": expected.get("Target_Pathway"),
+        "transfer_credits_total": expected.get("Proposed_Transfer_Credits_Total"),
+        "document_count": len(applicant.get("Document_Bundle", [])),
+    }
+    for doc in applicant.get("Document_Bundle", []):
+        owner = {"applicant_id": applicant_id, "document_id": doc["Document_ID"]}
+        yield "documents", {
+            **owner,
+            "document_type": doc.get("Document_Type"),
+            "document_format": doc.get("Document_Format"),
+            "rendering_method": doc.get("Rendering_Method"),
+            "title": doc.get("Title"),
+            "issuing_organization": doc.get("Issuing_Organization"),
+            "issue_date": doc.get("Issue_Date"),
+            "page_count": doc.get("Page_Count"),
+            "output_file_name": doc.get("Output_File_Name"),
+        }
+        content = doc.get("Structured_Content", {})
+        for course in content.get("courses", []):
+            yield "courses", {**owner, **course}
+        for score in content.get("scores", []):
+            yield "scores", {**owner, **score}
+    for mapped in expected.get("Mapped_Courses", []):
+        yield "mapped_courses", {
+            "applicant_id": applicant_id,
+            "course_code": mapped.get("proposed_college_course_code"),
+            "course_title": mapped.get("proposed_college_course_title"),
+            "credits": mapped.get("credits"),
+            "source_evidence": mapped.get("source_evidence"),
+            "rationale": mapped.get("rationale"),
+        }
+
+
+def render_rows(record: dict[str, Any]) -> Iterator[Row]:
+    """Rows for one applicant entry of render_manifest.json."""
+    for doc in record.get("Documents", []):
+        yield "render_results", {
+            "applicant_id": record["Applicant_ID"],
+            "document_id": doc["Document_ID"],
+            "document_type": doc.get("Document_Type"),
+            "document_format": doc.get("Document_Format"),
+            "rendering_method": doc.get("Rendering_Method"),
+            "engine": doc.get("Render_Engine"),
+            "status": doc.get("Render_Status"),
+            "output_file": doc.get("Output_File"),
+            "wall_ms": doc.get("Render_Metrics", {}).get("wall_ms"),
+        }
+
+
+def financial_aid_rows(applicant: dict[str, Any]) -> Iterator[Row]:
+    applicant_id = applicant["applicant_id"]
+    profile = applicant.get("profile", {})
+    context = applicant.get("financial_aid_context", {})
+    outcome = applicant.get("conversation_outcome", {})
+    chat = applicant.get("chat_conversation", [])
+    yield "fa_applicants", {
+        "applicant_id": applicant_id,
+        "full_name": profile.get("full_name"),
+        "folder_name": applicant.get("folder_name"),
+        "aid_year": context.get("aid_year"),
+        "dependency_status": context.get("dependency_status"),
+        "household_size": context.get("household_size"),
+        "sai_estimate": context.get("sai_estimate"),
+        "outcome_status": outcome.get("status"),
+        "final_owner": outcome.get("final_owner"),
+        "completion_percent": outcome.get("completion_percent_before_handoff"),
+        "chat_turn_count": len(chat),
+    }
+    for doc in applicant.get("document_bundle", []):
+        yield "fa_documents", {
+            "applicant_id": applicant_id,
+            "doc_id": doc["doc_id"],
+            "doc_type": doc.get("doc_type"),
+            "title": doc.get("title"),
+            "format": doc.get("format"),
+            "document_role": doc.get("document_role"),
+            "issuer": doc.get("issuer"),
+            "issue_date": doc.get("issue_date"),
+            "render_template": doc.get("render_template"),
+            "file_name": doc.get("file_name"),
+            "quality_flags": ",".join(doc.get("quality_flags", [])),
+        }
+    for turn in chat:
+        yield "chat_turns", {"applicant_id": applicant_id, **turn}
+        for update in turn.get("form_updates", []):
+            yield "form_updates", {"applicant_id": applicant_id, "turn": turn.get("turn"), **update}
+
+
+@dataclass(frozen=True)
+class Source:
+    name: str
+    id_field: str
+    tables: tuple[str, ...]
+    rows: Callable[[dict[str, Any]], Iterator[Row]]
+
+
+SOURCES = {
+    source.name: source
+    for source in (
+        Source("credit", "Applicant_ID", ("applicants", "documents", "courses", "scores", "mapped_courses"), credit_rows),
+        Source("render", "Applicant_ID", ("render_results",), render_rows),
+        Source("financial_aid", "applicant_id", ("fa_applicants", "fa_documents", "chat_turns", "form_updates"), financial_aid_rows),
+    )
+}
+
+
+def detect_source(record: dict[str, Any]) -> str:
+    """Which SOURCES entry a dataset's applicant records belong to, from their keys."""
+    if "Document_Bundle" in record:
+        return "credit"
+    if "Documents" in record:
+        return "render"
+    if "document_bundle" in record:
+        return "financial_aid"
+    raise ValueError(f"Unrecognised applicant record with keys {sorted(record)[:8]}")
+
+
+def record_digest(record: dict[str, Any]) -> str:
+    payload = json.dumps(record, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class UpdateStats:
+    added: int = 0
+    changed: int = 0
+    removed: int = 0
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.added + self.changed + self.unchanged
+
+    def summary(self) -> str:
+        return f"{self.total} records ({self.added} added, {self.changed} changed, {self.removed} removed)"
+
+
+class Catalog:
+    def __init__(self, path: Path = CATALOG_PATH, *, readonly: bool = False) -> None:
+        self.path = path
+        if readonly:
+            if not path.exists():
+                raise FileNotFoundError(f"No catalog at {path}; run a generator or `query_catalog.py load` first")
+            self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(path)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.create()
+        self.inserts = {
+            table: f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+            for table, columns in TABLES.items()
+        }
+
+    def __enter__(self) -> Catalog:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def create(self) -> None:
+        (version,) = self.conn.execute("PRAGMA user_version").fetchone()
+        with self.conn:
+            if version != CATALOG_VERSION:
+                for table in TABLES:
+                    self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+            for table, columns in TABLES.items():
+                key = f", PRIMARY KEY ({', '.join(PRIMARY_KEYS[table])})" if table in PRIMARY_KEYS else ""
+                self.conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(columns)}{key})")
+            for table, indexes in INDEXES.items():
+                for columns in indexes:
+                    name = f"{table}__{'_'.join(columns)}"
+                    self.conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+            self.conn.execute(f"PRAGMA user_version = {CATALOG_VERSION}")
+
+    def delete_record(self, source: Source, dataset_id: str, record_id: str) -> None:
+        for table in source.tables:
+            self.conn.execute(f"DELETE FROM {table} WHERE dataset_id = ? AND applicant_id = ?", (dataset_id, record_id))
+
+    def insert_record(self, source: Source, dataset_id: str, record: dict[str, Any]) -> None:
+        grouped: dict[str, list[tuple[Any, ...]]] = {}
+        for table, row in source.rows(record):
+            row["dataset_id"] = dataset_id
+            grouped.setdefault(table, []).append(tuple(cell(row.get(column)) for column in TABLES[table]))
+        for table, rows in grouped.items():
+            self.conn.executemany(self.inserts[table], rows)
+
+    def update(
+        self,
+        header: dict[str, Any],
+        records: Iterable[dict[str, Any]],
+        source_name: str | None = None,
+        path: Path | None = None,
+    ) -> UpdateStats:
+        """Bring one dataset's rows in line with `records`, rewriting only records whose digest changed.
+
+        `source_name` defaults to what the first record looks like (see `detect_source`).
+        """
+        iterator = iter(records)
+        first = next(iterator, None)
+        if source_name is None:
+            if first is None:
+                return UpdateStats()
+            source_name = detect_source(first)
+        source = SOURCES[source_name]
+        dataset_id = header["dataset_id"]
+        stats = UpdateStats()
+        with self.conn:
+            known = dict(
+                self.conn.execute(
+                    "SELECT record_id, digest FROM loaded WHERE source = ? AND dataset_id = ?", (source.name, dataset_id)
+                )
+            )
+            seen: set[str] = set()
+            for record in chain([first] if first is not None else [], iterator):
+                record_id = record[source.id_field]
+                digest = record_digest(record)
+                seen.add(record_id)
+                previous = known.get(record_id)
+                if previous == digest:
+                    stats.unchanged += 1
+                    continue
+                if previous is None:
+                    stats.added += 1
+                else:
+                    stats.changed += 1
+                    self.delete_record(source, dataset_id, record_id)
+                self.insert_record(source, dataset_id, record)
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO loaded VALUES (?, ?, ?, ?)", (source.name, dataset_id, record_id, digest)
+                )
+            for record_id in known.keys() - seen:
+                stats.removed += 1
+                self.delete_record(source, dataset_id, record_id)
+                self.conn.execute(
+                    "DELETE FROM loaded WHERE source = ? AND dataset_id = ? AND record_id = ?",
+                    (source.name, dataset_id, record_id),
+                )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO datasets VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    source.name,
+                    dataset_id,
+                    str(path) if path else None,
+                    header.get("generated_on"),
+                    len(seen),
+                    datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                ),
+            )
+        return stats
+
+    def query(self, sql: str, params: Iterable[Any] = ()) -> tuple[list[str], list[tuple[Any, ...]]]:
+        cursor = self.conn.execute(sql, tuple(params))
+        return [column[0] for column in cursor.description or ()], cursor.fetchall()
+
+
+def update_catalog(
+    path: Path | None,
+    header: dict[str, Any],
+    records: Iterable[dict[str, Any]],
+    source_name: str,
+    dataset_file: Path | None = None,
+) -> None:
+    """Export step for the generators: update the catalog at `path` (None = disabled) and report it."""
+    if path is None:
+        return
+    with Catalog(path) as catalog:
+        stats = catalog.update(header, records, source_name, dataset_file)
+    shown = path.relative_to(ROOT) if path.is_relative_to(ROOT) else path
+    print(f"Catalog ({source_name}): {stats.summary()} -> {shown}")
@@ -0,0 +1,213 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["pillow>=10.4.0"]
+# ///
+
+"""Build paginated preview contact sheets from rendered scan images.
+
+Thumbnails are decoded at reduced resolution (JPEG draft mode, then a box `reduce`), built in
+parallel and cached under `.cache/thumbnails` by source content hash; finished sheets are cached
+by their layout too, so re-previewing a large render only decodes and re-encodes what changed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, TypeVar
+
+from PIL import Image, ImageDraw, ImageOps, UnidentifiedImageError
+
+from font_registry import choose_font
+from render_cache import CACHE_DIR, link_or_copy
+
+THUMBNAIL_CACHE_DIR = CACHE_DIR.parent / "thumbnails"
+# Bump whenever thumbnail or sheet rendering changes so cached thumbnails are rebuilt.
+THUMBNAIL_VERSION = "1"
+COLS = 4
+CELL_W, CELL_H = 360, 500
+THUMB_SIZE = (CELL_W - 24, CELL_H - 78)
+SHEET_SIZE = 24
+IMAGE_SUFFIXES = {".webp", ".png", ".jpg", ".jpeg"}
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("sources", nargs="+", type=Path, help="Image files or directories to scan recursively.")
+    parser.add_argument("-o", "--output", type=Path, required=True, help="Sheet path; pages get _001, _002, ...")
+    parser.add_argument("--per-sheet", type=int, default=SHEET_SIZE)
+    parser.add_argument("--title", default="Synthetic Scan-Style Preview (local renderer)")
+    parser.add_argument("--jobs", type=int, default=0, help="Worker processes (0 = one per CPU).")
+    parser.add_argument("--cache-dir", type=Path, default=THUMBNAIL_CACHE_DIR)
+    return parser.parse_args()
+
+
+@dataclass(frozen=True)
+class ThumbnailTask:
+    source: Path
+    cache_dir: Path
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256(f"{THUMBNAIL_VERSION}:{THUMB_SIZE}".encode("utf-8"))
+    with path.open("rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def decode_reduced(path: Path, size: tuple[int, int]) -> Image.Image:
+    """Decode no more pixels than needed for a thumbnail of `size`."""
+    img = Image.open(path)
+    img.draft("RGB", size)  # JPEG: IDCT scaling at decode time; no-op for other formats
+    factor = min(img.width // size[0], img.height // size[1])
+    if factor > 1:
+        img = img.reduce(factor)
+    return ImageOps.contain(img.convert("RGB"), size)
+
+
+def build_thumbnail(task: ThumbnailTask) -> Path | None:
+    """Return the cached thumbnail for `task.source`, building it on a miss; None if it cannot be decoded."""
+    key = file_digest(task.source)
+    thumb = task.cache_dir / key[:2] / f"{key}.webp"
+    if not thumb.exists():
+        try:
+            img = decode_reduced(task.source, THUMB_SIZE)
+        except (UnidentifiedImageError, OSError) as exc:
+            print(f"contact_sheets: skipping {task.source}: {exc}", file=sys.stderr)
+            return None
+        tmp = thumb.with_name(f".{thumb.name}.tmp-{os.getpid()}")
+        tmp.parent.mkdir(parents=True, exist_ok=True)
+        img.save(tmp, format="WEBP", quality=85)
+        os.replace(tmp, thumb)
+    return thumb
+
+
+@dataclass(frozen=True)
+class SheetPage:
+    entries: list[tuple[Path, str]]
+    out_path: Path
+    title: str
+    cache_dir: Path
+
+
+def compose_sheet(page: SheetPage) -> Path:
+    """Write the sheet for `page`, reusing a cached copy when the same thumbnails and labels were laid out before."""
+    payload = json.dumps([THUMBNAIL_VERSION, page.title, [(thumb.name, label) for thumb, label in page.entries]])
+    key = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    cached = page.cache_dir / "sheets" / f"{key}.webp"
+    if not cached.exists():
+        tmp = cached.with_name(f".{cached.name}.tmp-{os.getpid()}")
+        tmp.parent.mkdir(parents=True, exist_ok=True)
+        draw_sheet(page).save(tmp, format="WEBP", quality=88, method=4)
+        os.replace(tmp, cached)
+    link_or_copy(cached, page.out_path)
+    return page.out_path
+
+
+def draw_sheet(page: SheetPage) -> Image.Image:
+    rows = math.ceil(len(page.entries) / COLS)
+    sheet = Image.new("RGB", (COLS * CELL_W, rows * CELL_H + 50), (246, 246, 246))
+    draw = ImageDraw.Draw(sheet)
+    font = choose_font(20, bold=True)
+    small = choose_font(16)
+    draw.text((20, 14), page.title, fill=(20, 20, 20), font=font)
+
+    for i, (thumb_path, label) in enumerate(page.entries):
+        row = i // COLS
+        col = i % COLS
+        x0 = col * CELL_W + 12
+        y0 = row * CELL_H + 56
+        thumb = Image.open(thumb_path).convert("RGB")
+        card = Image.new("RGB", (CELL_W - 18, CELL_H - 26), "white")
+        card_draw = ImageDraw.Draw(card)
+        card_draw.rectangle((0, 0, card.width - 1, card.height - 1), outline=(180, 180, 180))
+        card.paste(thumb, ((card.width - thumb.width) // 2, 8))
+        card_draw.text((10, card.height - 42), label[:38], fill=(40, 40, 40), font=small)
+        sheet.paste(card, (x0, y0))
+    return sheet
+
+
+def sheet_paths(out_path: Path, pages: int) -> list[Path]:
+    if pages == 1:
+        return [out_path]
+    return [out_path.with_name(f"{out_path.stem}_{page:03d}{out_path.suffix}") for page in range(1, pages + 1)]
+
+
+def collect_images(sources: Iterable[Path]) -> list[Path]:
+    images: list[Path] = []
+    for source in sources:
+        if source.is_dir():
+            images.extend(sorted(p for p in source.rglob("*") if p.suffix.lower() in IMAGE_SUFFIXES))
+        else:
+            images.append(source)
+    return images
+
+
+def map_jobs(fn: Callable[[T], R], items: list[T], jobs: int) -> list[R]:
+    if jobs <= 1 or len(items) <= 1:
+        return [fn(item) for item in items]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(items))) as pool:
+        return list(pool.map(fn, items, chunksize=max(1, len(items) // (jobs * 4))))
+
+
+def build_contact_sheets(
+    image_paths: list[Path],
+    out_path: Path,
+    *,
+    per_sheet: int = SHEET_SIZE,
+    title: str = "Synthetic Scan-Style Preview (local renderer)",
+    jobs: int = 1,
+    cache_dir: Path = THUMBNAIL_CACHE_DIR,
+) -> list[Path]:
+    """Write one sheet per `per_sheet` decodable images and return the sheet paths, in order.
+
+    A single page is written to `out_path` itself; more pages are numbered `<stem>_001...`.
+    Sheets left over from a previous preview are removed first.
+    """
+    out_path.unlink(missing_ok=True)
+    for stale in out_path.parent.glob(f"{out_path.stem}_[0-9][0-9][0-9]{out_path.suffix}"):
+        stale.unlink()
+    if not image_paths:
+        return []
+    thumbs = map_jobs(build_thumbnail, [ThumbnailTask(path, cache_dir) for path in image_paths], jobs)
+    entries = [(thumb, path.name) for thumb, path in zip(thumbs, image_paths) if thumb is not None]
+    if not entries:
+        return []
+    per_sheet = max(1, per_sheet)
+    chunks = [entries[i : i + per_sheet] for i in range(0, len(entries), per_sheet)]
+    paths = sheet_paths(out_path, len(chunks))
+    pages = [
+        SheetPage(chunk, path, title if len(chunks) == 1 else f"{title} - page {n}/{len(chunks)}", cache_dir)
+        for n, (chunk, path) in enumerate(zip(chunks, paths), start=1)
+    ]
+    return map_jobs(compose_sheet, pages, jobs)
+
+
+def main() -> None:
+    args = parse_args()
+    images = collect_images(args.sources)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    sheets = build_contact_sheets(
+        images,
+        args.output,
+        per_sheet=args.per_sheet,
+        title=args.title,
+        jobs=jobs,
+        cache_dir=args.cache_dir,
+    )
+    print(f"Wrote {len(sheets)} contact sheet(s) for {len(images)} images -> {args.output.parent}")
+
+
+if __name__ == "__main__":
+    main()
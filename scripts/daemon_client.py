@@ -0,0 +1,107 @@
+"""Client side of the warm render daemon (scripts/render_daemon.py).
+
+The protocol is JSON lines over a Unix socket: each request and each response is one JSON object
+on one line. A `render` request carries a list of jobs and is answered with one line per job, in
+job order, as each job finishes, so callers can stream results into their progress output.
+
+Jobs carry the per-process render settings (page template directory, document IR cache, WEBP
+profile, distortion memory budget) so the daemon renders exactly what the calling CLI would have
+rendered locally.
+"""
+
+from __future__ import annotations
+
+import json
+import socket
+from pathlib import Path
+from typing import Any, Iterator
+
+from document_ir import IR_CACHE
+from page_templates import TEMPLATES
+from scan_geometry import GEOMETRY
+from webp_profiles import WEBP
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_SOCKET = ROOT / ".cache" / "render-daemon.sock"
+
+
+class DaemonError(RuntimeError):
+    pass
+
+
+def current_settings() -> dict[str, Any]:
+    """This process's render settings, in the form `apply_settings` restores them."""
+    return {
+        "template_dir": str(TEMPLATES.root) if TEMPLATES.root else None,
+        "ir_dir": str(IR_CACHE.root) if IR_CACHE.root else None,
+        "webp_profile": WEBP.profile.name,
+        "distort_budget_mb": GEOMETRY.budget_bytes / 2**20,
+    }
+
+
+def apply_settings(settings: dict[str, Any]) -> None:
+    TEMPLATES.configure(Path(settings["template_dir"]) if settings["template_dir"] else None)
+    IR_CACHE.configure(Path(settings["ir_dir"]) if settings["ir_dir"] else None)
+    WEBP.configure(settings["webp_profile"])
+    GEOMETRY.configure(settings["distort_budget_mb"])
+
+
+class DaemonClient:
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.reader = sock.makefile("r", encoding="utf-8")
+        self.writer = sock.makefile("w", encoding="utf-8")
+
+    def __enter__(self) -> DaemonClient:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for stream in (self.reader, self.writer):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        self.sock.close()
+
+    def send(self, payload: dict[str, Any]) -> None:
+        self.writer.write(json.dumps(payload, separators=(",", ":")) + "\n")
+        self.writer.flush()
+
+    def receive(self) -> dict[str, Any]:
+        line = self.reader.readline()
+        if not line:
+            raise DaemonError("render daemon closed the connection")
+        return json.loads(line)
+
+    def request(self, payload: dict[str, Any]) -> dict[str, Any]:
+        self.send(payload)
+        response = self.receive()
+        if not response.get("ok"):
+            raise DaemonError(str(response.get("error")))
+        return response
+
+    def render(self, jobs: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """Yield the render metadata of each job, in order; a failed job raises DaemonError."""
+        self.send({"op": "render", "jobs": jobs})
+        for _ in jobs:
+            response = self.receive()
+            if not response.get("ok"):
+                raise DaemonError(f"render daemon job {response.get('index')} failed: {response.get('error')}")
+            yield response["meta"]
+
+
+def connect(path: Path | None) -> DaemonClient | None:
+    """Connect to the daemon at `path`; None (with a note) when no daemon is listening there."""
+    if path is None:
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError as exc:
+        sock.close()
+        print(f"Render daemon not reachable at {path} ({exc.strerror or exc}); rendering locally")
+        return None
+    return DaemonClient(sock)
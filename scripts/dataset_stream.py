@@ -0,0 +1,305 @@
+"""Streaming writers and lazy readers for applicant datasets: header fields plus an `applicants` list.
+
+Three layouts, all written one applicant at a time and read back one applicant at a time:
+
+- json: the classic single document. `write_json_stream` emits the same bytes as
+  `json.dumps(dataset, indent=2)` without building the list or the string, and
+  `read_json_stream` walks it incrementally with `JSONDecoder.raw_decode`.
+- ndjson: one compact applicant per line, with the header in a `<stem>.meta.json` sidecar.
+- shards: a directory of NDJSON files holding `shard_size` applicants each (1 = one file per
+  applicant) plus an `index.json` with the header and the shard list.
+
+Files are written through a temporary name and renamed into place, so a json or ndjson dataset
+can be rewritten from a reader that is still iterating over the same path. Standard library only,
+so scripts without third-party dependencies can use it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from itertools import chain, islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, TextIO
+
+FORMATS = ("json", "ndjson", "shards")
+APPLICANTS_KEY = "applicants"
+INDEX_NAME = "index.json"
+READ_CHUNK = 1 << 16
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+DECODER = json.JSONDecoder()
+
+
+def dataset_path(base: Path, fmt: str) -> Path:
+    """Where a dataset whose json layout lives at `base` (e.g. all_applicants.json) goes in `fmt`."""
+    if fmt == "ndjson":
+        return base.with_suffix(".ndjson")
+    if fmt == "shards":
+        return base.with_suffix("")
+    return base
+
+
+def detect_format(path: Path) -> str:
+    if path.is_dir():
+        return "shards"
+    return "ndjson" if path.suffix == ".ndjson" else "json"
+
+
+def sidecar_path(path: Path) -> Path:
+    return path.with_suffix(".meta.json")
+
+
+def encode_json_stream(
+    payload: dict[str, Any],
+    *,
+    key: str = APPLICANTS_KEY,
+    indent: int = 2,
+    ensure_ascii: bool = True,
+) -> Iterator[str]:
+    """Chunks of `json.dumps(payload, indent=indent)`, taking `payload[key]` from any iterable lazily."""
+    pad = " " * indent
+
+    def nested(value: Any, prefix: str) -> str:
+        # Strings never hold raw newlines once encoded, so every newline is structural.
+        return json.dumps(value, indent=indent, ensure_ascii=ensure_ascii).replace("\n", "\n" + prefix)
+
+    if not payload:
+        yield "{}"
+        return
+    for position, (name, value) in enumerate(payload.items()):
+        yield ("{" if position == 0 else ",") + "\n" + pad + json.dumps(name, ensure_ascii=ensure_ascii) + ": "
+        if name != key:
+            yield nested(value, pad)
+            continue
+        count = 0
+        for item in value:
+            yield ("[" if count == 0 else ",") + "\n" + pad * 2 + nested(item, pad * 2)
+            count += 1
+        yield "\n" + pad + "]" if count else "[]"
+    yield "\n}"
+
+
+def replace_atomically(path: Path, chunks: Iterable[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+    try:
+        with tmp.open("w", encoding="utf-8") as fh:
+            for chunk in chunks:
+                fh.write(chunk)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_json_stream(
+    path: Path,
+    payload: dict[str, Any],
+    *,
+    key: str = APPLICANTS_KEY,
+    indent: int = 2,
+    ensure_ascii: bool = True,
+    newline: bool = True,
+) -> None:
+    """Write `payload` as indented JSON, streaming the `key` items; `newline` adds a final "\\n"."""
+    chunks = encode_json_stream(payload, key=key, indent=indent, ensure_ascii=ensure_ascii)
+    replace_atomically(path, chain(chunks, ["\n"] if newline else []))
+
+
+def ndjson_lines(applicants: Iterable[dict[str, Any]], ensure_ascii: bool, counter: list[int]) -> Iterator[str]:
+    for applicant in applicants:
+        counter[0] += 1
+        yield json.dumps(applicant, separators=(",", ":"), ensure_ascii=ensure_ascii) + "\n"
+
+
+def write_ndjson(path: Path, applicants: Iterable[dict[str, Any]], *, ensure_ascii: bool = True) -> int:
+    """One compact JSON object per line; returns the number written."""
+    counter = [0]
+    replace_atomically(path, ndjson_lines(applicants, ensure_ascii, counter))
+    return counter[0]
+
+
+def write_shards(
+    out_dir: Path,
+    header: dict[str, Any],
+    applicants: Iterable[dict[str, Any]],
+    *,
+    shard_size: int = 1,
+    ensure_ascii: bool = True,
+    on_shard: Callable[[dict[str, Any]], None] | None = None,
+) -> list[dict[str, Any]]:
+    """Write `shard_size` applicants per `applicants-NNNNN.ndjson` and an index; returns the shard list.
+
+    The index is written last and shards left over from a larger earlier dataset are removed.
+    `on_shard(entry)` is called as each shard is finished.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    shard_size = max(1, shard_size)
+    iterator = iter(applicants)
+    shards: list[dict[str, Any]] = []
+    first_index = 1
+    while True:
+        chunk = list(islice(iterator, shard_size))
+        if not chunk:
+            break
+        path = out_dir / f"applicants-{len(shards):05d}.ndjson"
+        write_ndjson(path, chunk, ensure_ascii=ensure_ascii)
+        shards.append({"file": path.name, "first_index": first_index, "count": len(chunk)})
+        first_index += len(chunk)
+        if on_shard is not None:
+            on_shard(shards[-1])
+    index = {**header, "applicant_count": first_index - 1, "shards": shards}
+    replace_atomically(out_dir / INDEX_NAME, [json.dumps(index, indent=2, ensure_ascii=ensure_ascii) + "\n"])
+    listed = {shard["file"] for shard in shards}
+    for stale in out_dir.glob("applicants-*.ndjson"):
+        if stale.name not in listed:
+            stale.unlink()
+    return shards
+
+
+def write_dataset_stream(
+    path: Path,
+    header: dict[str, Any],
+    applicants: Iterable[dict[str, Any]],
+    fmt: str = "json",
+    *,
+    shard_size: int = 1,
+    ensure_ascii: bool = True,
+    newline: bool = True,
+) -> None:
+    """Write a dataset in any of the FORMATS without holding its applicants or its text in memory.
+
+    For json, `header` keys come first and `applicants` last, as the generators lay datasets out.
+    """
+    if fmt == "json":
+        write_json_stream(path, {**header, APPLICANTS_KEY: applicants}, ensure_ascii=ensure_ascii, newline=newline)
+    elif fmt == "ndjson":
+        count = write_ndjson(path, applicants, ensure_ascii=ensure_ascii)
+        meta = {**header, "applicant_count": count}
+        replace_atomically(sidecar_path(path), [json.dumps(meta, indent=2, ensure_ascii=ensure_ascii) + "\n"])
+    elif fmt == "shards":
+        write_shards(path, header, applicants, shard_size=shard_size, ensure_ascii=ensure_ascii)
+    else:
+        raise ValueError(f"Unknown dataset format {fmt!r}; expected one of {', '.join(FORMATS)}")
+
+
+class JsonTokens:
+    """Pull parser over a text stream: whitespace, single punctuation characters and whole JSON values."""
+
+    def __init__(self, fh: TextIO) -> None:
+        self.fh = fh
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        chunk = self.fh.read(READ_CHUNK)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character without consuming it ("" at end of input)."""
+        while True:
+            self.pos = WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) or not self.fill():
+                return self.buf[self.pos : self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} in streamed JSON, found {found or 'end of input'!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            else:
+                # A value that ends exactly at the buffer edge may be a truncated number; read on to be sure.
+                if end < len(self.buf) or self.eof:
+                    self.pos = end
+                    return value
+            self.fill()
+
+
+def read_json_stream(path: Path, key: str = APPLICANTS_KEY) -> tuple[dict[str, Any], Iterator[Any]]:
+    """Top-level fields before `key`, and a lazy iterator over the `key` array.
+
+    Fields after the array (none in the generators' layout) are added to the header dict once the
+    iterator is exhausted.
+    """
+    fh = path.open(encoding="utf-8")
+    tokens = JsonTokens(fh)
+    header: dict[str, Any] = {}
+
+    def read_fields() -> bool:
+        """Read `name: value` pairs into `header` up to `key` (True) or the closing brace (False)."""
+        while tokens.peek() == '"':
+            name = tokens.value()
+            tokens.expect(":")
+            if name == key:
+                return True
+            header[name] = tokens.value()
+            if tokens.peek() == ",":
+                tokens.expect(",")
+        tokens.expect("}")
+        return False
+
+    try:
+        tokens.expect("{")
+        found = read_fields()
+    except BaseException:
+        fh.close()
+        raise
+    if not found:
+        fh.close()
+
+    def items() -> Iterator[Any]:
+        if not found:
+            return
+        with fh:
+            tokens.expect("[")
+            if tokens.peek() == "]":
+                tokens.expect("]")
+            else:
+                while True:
+                    yield tokens.value()
+                    if tokens.peek() != ",":
+                        break
+                    tokens.expect(",")
+                tokens.expect("]")
+            if tokens.peek() == ",":
+                tokens.expect(",")
+                read_fields()
+
+    return header, items()
+
+
+def iter_ndjson(path: Path) -> Iterator[dict[str, Any]]:
+    with path.open(encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+
+def open_dataset(path: Path) -> tuple[dict[str, Any], Iterator[dict[str, Any]]]:
+    """(header, lazy applicants) for a dataset in any of the FORMATS, detected from `path`."""
+    fmt = detect_format(path)
+    if fmt == "shards":
+        index = json.loads((path / INDEX_NAME).read_text(encoding="utf-8"))
+        header = {name: value for name, value in index.items() if name != "shards"}
+        return header, (applicant for shard in index["shards"] for applicant in iter_ndjson(path / shard["file"]))
+    if fmt == "ndjson":
+        meta = sidecar_path(path)
+        header = json.loads(meta.read_text(encoding="utf-8")) if meta.exists() else {}
+        return header, iter_ndjson(path)
+    return read_json_stream(path)
@@ -0,0 +1,291 @@
+"""Typed intermediate representation of a document's printable content, shared by every renderer.
+
+A builder walks one source record (a credit-checking `Structured_Content` or a financial-aid
+`structured_fields`/`body_lines` document) and produces a `DocumentIR`: a title, header fields
+and titled sections made of blocks (key-value fields, verbatim lines, reflowable paragraphs,
+bullet items and tables). Renderers lay blocks out instead of re-reading the source schema, so
+the walk happens once per document however many outputs it feeds.
+
+`IR_CACHE` memoizes built IRs by a digest of the source record, builder name and IR version. With
+a cache directory it also persists them as JSON, so later runs, worker processes and text
+sidecars reuse the IR instead of rebuilding it; `DocumentIR.to_dict`/`from_dict` round-trip.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import textwrap
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, ClassVar, Union
+
+ROOT = Path(__file__).resolve().parents[1]
+IR_CACHE_DIR = ROOT / ".cache" / "ir"
+IR_CACHE_SIZE = 256
+TEXT_WRAP_WIDTH = 92
+
+
+@dataclass(frozen=True)
+class Field:
+    key: str
+    label: str
+    value: Any  # JSON scalar as it appears in the source record
+
+    @property
+    def text(self) -> str:
+        return f"{self.label}: {self.value}"
+
+
+@dataclass(frozen=True)
+class Fields:
+    """Key-value rows, printed one `Label: value` per line."""
+
+    kind: ClassVar[str] = "fields"
+    rows: tuple[Field, ...]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        for row in self.rows:
+            if row.key == key:
+                return row.value
+        return default
+
+    def values(self) -> dict[str, Any]:
+        return {row.key: row.value for row in self.rows}
+
+    def text_lines(self, wrap_width: int | None) -> list[str]:
+        return [row.text for row in self.rows]
+
+
+@dataclass(frozen=True)
+class Lines:
+    """Lines printed verbatim (summaries, OCR previews); visual renderers may still wrap them."""
+
+    kind: ClassVar[str] = "lines"
+    lines: tuple[str, ...]
+
+    def text_lines(self, wrap_width: int | None) -> list[str]:
+        return list(self.lines)
+
+
+@dataclass(frozen=True)
+class Paragraph:
+    """Reflowable prose; the text export wraps it by characters, visual renderers by measured width."""
+
+    kind: ClassVar[str] = "paragraph"
+    text: str
+
+    def text_lines(self, wrap_width: int | None) -> list[str]:
+        if wrap_width is None:
+            return [self.text]
+        return textwrap.wrap(self.text, width=wrap_width) or [""]
+
+
+@dataclass(frozen=True)
+class Items:
+    kind: ClassVar[str] = "items"
+    label: str
+    items: tuple[str, ...]
+
+    def text_lines(self, wrap_width: int | None) -> list[str]:
+        return [f"{self.label}:", *(f" - {item}" for item in self.items)]
+
+
+@dataclass(frozen=True)
+class Column:
+    key: str
+    label: str
+    width: int
+    align: str = "left"
+    spec: str = ""
+
+    def cell(self, value: Any) -> str:
+        text = ("" if value is None else format(value, self.spec))[: self.width]
+        return text.rjust(self.width) if self.align == "right" else text.ljust(self.width)
+
+
+@dataclass(frozen=True)
+class Table:
+    """Rows of raw values. Printed as a fixed-width grid, or one line per row from `row_format`."""
+
+    kind: ClassVar[str] = "table"
+    columns: tuple[Column, ...]
+    rows: tuple[tuple[Any, ...], ...]
+    row_format: str | None = None
+
+    def records(self) -> list[dict[str, Any]]:
+        keys = [column.key for column in self.columns]
+        return [dict(zip(keys, row)) for row in self.rows]
+
+    def text_lines(self, wrap_width: int | None) -> list[str]:
+        if self.row_format is not None:
+            return [self.row_format.format(**record) for record in self.records()]
+        header = " | ".join(column.label.ljust(column.width) for column in self.columns)
+        body = [" | ".join(column.cell(value) for column, value in zip(self.columns, row)) for row in self.rows]
+        return [header.rstrip(), "-" * len(header), *body]
+
+
+Block = Union[Fields, Lines, Paragraph, Items, Table]
+
+
+@dataclass(frozen=True)
+class Section:
+    kind: str
+    title: str
+    blocks: tuple[Block, ...]
+
+    def first(self, block_type: type[Block]) -> Any:
+        return next((block for block in self.blocks if isinstance(block, block_type)), None)
+
+
+@dataclass(frozen=True)
+class DocumentIR:
+    title: str
+    header: Fields
+    sections: tuple[Section, ...]
+
+    def section(self, kind: str) -> Section | None:
+        return next((section for section in self.sections if section.kind == kind), None)
+
+    def block(self, kind: str, block_type: type[Block]) -> Any:
+        """First block of `block_type` in the `kind` section, or None when either is absent."""
+        section = self.section(kind)
+        return section.first(block_type) if section else None
+
+    def text_lines(self, wrap_width: int | None = TEXT_WRAP_WIDTH) -> list[str]:
+        """Plain-text rendering: upper-cased title, header fields, then each titled section.
+
+        `wrap_width=None` leaves paragraphs unwrapped for renderers that wrap by measured width.
+        """
+        lines = [self.title.upper(), *self.header.text_lines(wrap_width)]
+        for section in self.sections:
+            lines.extend(["", section.title])
+            for block in section.blocks:
+                lines.extend(block.text_lines(wrap_width))
+        return lines
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "title": self.title,
+            "header": block_to_dict(self.header),
+            "sections": [
+                {"kind": s.kind, "title": s.title, "blocks": [block_to_dict(b) for b in s.blocks]}
+                for s in self.sections
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DocumentIR:
+        return cls(
+            title=data["title"],
+            header=block_from_dict(data["header"]),
+            sections=tuple(
+                Section(s["kind"], s["title"], tuple(block_from_dict(b) for b in s["blocks"]))
+                for s in data["sections"]
+            ),
+        )
+
+
+def block_to_dict(block: Block) -> dict[str, Any]:
+    if isinstance(block, Fields):
+        return {"kind": block.kind, "rows": [[row.key, row.label, row.value] for row in block.rows]}
+    if isinstance(block, Table):
+        return {
+            "kind": block.kind,
+            "columns": [[c.key, c.label, c.width, c.align, c.spec] for c in block.columns],
+            "rows": [list(row) for row in block.rows],
+            "row_format": block.row_format,
+        }
+    if isinstance(block, Items):
+        return {"kind": block.kind, "label": block.label, "items": list(block.items)}
+    if isinstance(block, Lines):
+        return {"kind": block.kind, "lines": list(block.lines)}
+    return {"kind": block.kind, "text": block.text}
+
+
+def block_from_dict(data: dict[str, Any]) -> Any:
+    kind = data["kind"]
+    if kind == Fields.kind:
+        return Fields(tuple(Field(*row) for row in data["rows"]))
+    if kind == Table.kind:
+        return Table(
+            tuple(Column(*column) for column in data["columns"]),
+            tuple(tuple(row) for row in data["rows"]),
+            data["row_format"],
+        )
+    if kind == Items.kind:
+        return Items(data["label"], tuple(data["items"]))
+    if kind == Lines.kind:
+        return Lines(tuple(data["lines"]))
+    if kind == Paragraph.kind:
+        return Paragraph(data["text"])
+    raise ValueError(f"Unknown IR block kind: {kind}")
+
+
+class IRCache:
+    def __init__(self, maxsize: int = IR_CACHE_SIZE, root: Path | None = None) -> None:
+        self.maxsize = maxsize
+        self.root = root
+        self.irs: OrderedDict[str, DocumentIR] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    def configure(self, root: Path | None = None, maxsize: int = IR_CACHE_SIZE) -> None:
+        """Set persistence and size; also used from ProcessPoolExecutor initializers."""
+        self.root = root
+        self.maxsize = maxsize
+
+    @staticmethod
+    def key(name: str, source: dict[str, Any], version: str) -> str:
+        payload = json.dumps([name, version, source], sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, name: str, source: dict[str, Any], version: str, build: Callable[[], DocumentIR]) -> DocumentIR:
+        """Return the IR for `source`, building (or loading) it on first use. IRs are immutable, so no copy."""
+        key = self.key(name, source, version)
+        ir = self.irs.get(key)
+        if ir is not None:
+            self.hits += 1
+            self.irs.move_to_end(key)
+            return ir
+        self.misses += 1
+        ir = self.load(key)
+        if ir is None:
+            ir = build()
+            self.save(key, ir)
+        else:
+            self.disk_hits += 1
+        self.irs[key] = ir
+        while len(self.irs) > self.maxsize:
+            self.irs.popitem(last=False)
+        return ir
+
+    def path(self, key: str) -> Path | None:
+        return self.root / key[:2] / f"{key}.json" if self.root else None
+
+    def load(self, key: str) -> DocumentIR | None:
+        path = self.path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            return DocumentIR.from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+            return None
+
+    def save(self, key: str, ir: DocumentIR) -> None:
+        path = self.path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+        tmp.write_text(json.dumps(ir.to_dict(), separators=(",", ":")) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+
+    def stats(self) -> dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "disk_hits": self.disk_hits, "cached_irs": len(self.irs)}
+
+
+IR_CACHE = IRCache()
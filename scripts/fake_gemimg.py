@@ -0,0 +1,59 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["pillow>=10.4.0"]
+# ///
+
+"""Offline stand-in for `uvx gemimg`: writes a placeholder WEBP after a simulated delay.
+
+Accepts the same arguments the renderers pass to gemimg. Latency and failures are
+controlled with FAKE_GEMIMG_DELAY_SEC (default 0.5) and FAKE_GEMIMG_FAIL_RATE (default 0).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+from PIL import Image, ImageDraw, ImageFont
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("prompt")
+    parser.add_argument("-o", "--output", type=Path, required=True)
+    parser.add_argument("--webp", action="store_true")
+    parser.add_argument("--force", action="store_true")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    time.sleep(float(os.environ.get("FAKE_GEMIMG_DELAY_SEC", "0.5")))
+    if random.random() < float(os.environ.get("FAKE_GEMIMG_FAIL_RATE", "0")):
+        print("fake_gemimg: simulated backend failure", file=sys.stderr)
+        raise SystemExit(1)
+    if args.output.exists() and not args.force:
+        print(f"fake_gemimg: {args.output} exists (use --force)", file=sys.stderr)
+        raise SystemExit(1)
+
+    img = Image.new("RGB", (896, 1152), (236, 232, 222))
+    draw = ImageDraw.Draw(img)
+    font = ImageFont.load_default()
+    draw.rectangle((24, 24, 871, 1127), outline=(120, 120, 120), width=2)
+    draw.text((48, 48), "FAKE GEMIMG OUTPUT", fill=(120, 40, 40), font=font)
+    y = 90
+    for line in textwrap.wrap(args.prompt, width=100):
+        draw.text((48, y), line, fill=(40, 40, 40), font=font)
+        y += 18
+    img.save(args.output, format="WEBP", quality=80)
+    print(f"Saved {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Process-wide memoized font lookup shared by the rendering scripts."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from PIL import ImageFont
+
+FONT_CANDIDATES: dict[tuple[str, str], list[str]] = {
+    ("mono", "regular"): [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
+        "/usr/share/fonts/truetype/liberation2/LiberationMono-Regular.ttf",
+    ],
+    ("sans", "regular"): [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/liberation2/LiberationSans-Regular.ttf",
+    ],
+    ("sans", "bold"): [
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+        "/usr/share/fonts/truetype/liberation2/LiberationSans-Bold.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/liberation2/LiberationSans-Regular.ttf",
+    ],
+}
+
+
+class FontRegistry:
+    """Resolve each (family, weight) to a font file once and keep one font object per size."""
+
+    def __init__(self) -> None:
+        self.paths: dict[tuple[str, str], str | None] = {}
+        self.fonts: dict[tuple[str, int, str], ImageFont.ImageFont] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, family: str, weight: str) -> str | None:
+        key = (family, weight)
+        if key not in self.paths:
+            self.paths[key] = next((p for p in FONT_CANDIDATES[key] if Path(p).exists()), None)
+        return self.paths[key]
+
+    def get(self, family: str, size: int, weight: str = "regular") -> ImageFont.ImageFont:
+        key = (family, size, weight)
+        font = self.fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+        self.misses += 1
+        font = self.load(family, size, weight)
+        self.fonts[key] = font
+        return font
+
+    def load(self, family: str, size: int, weight: str) -> ImageFont.ImageFont:
+        for path in [self.resolve(family, weight), *FONT_CANDIDATES[(family, weight)]]:
+            if not path or not Path(path).exists():
+                continue
+            try:
+                return ImageFont.truetype(path, size)
+            except OSError:
+                continue
+        return ImageFont.load_default()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached_fonts": len(self.fonts),
+            "resolved_paths": {f"{family}/{weight}": path for (family, weight), path in self.paths.items()},
+        }
+
+
+REGISTRY = FontRegistry()
+
+
+def choose_font(size: int, mono: bool = False, bold: bool = False) -> ImageFont.ImageFont:
+    if mono:
+        return REGISTRY.get("mono", size)
+    return REGISTRY.get("sans", size, "bold" if bold else "regular")
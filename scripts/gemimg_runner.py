@@ -0,0 +1,167 @@
+"""Bounded-concurrency asyncio runner for gemimg image generation jobs."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+FAKE_GEMIMG_SCRIPT = Path(__file__).resolve().parent / "fake_gemimg.py"
+
+
+@dataclass(frozen=True)
+class GemimgJob:
+    document_id: str
+    prompt: str
+    out_path: Path
+
+
+def gemimg_command(job: GemimgJob) -> list[str]:
+    return ["uvx", "gemimg", "--webp", "--force", "-o", job.out_path.name, job.prompt]
+
+
+def fake_gemimg_command(job: GemimgJob) -> list[str]:
+    return [sys.executable, str(FAKE_GEMIMG_SCRIPT), "--webp", "--force", "-o", job.out_path.name, job.prompt]
+
+
+BACKENDS: dict[str, Callable[[GemimgJob], list[str]]] = {
+    "gemimg": gemimg_command,
+    "fake": fake_gemimg_command,
+}
+
+
+class TokenBucket:
+    """Allow `rate` job starts per second on average, with bursts of up to `burst`."""
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+async def run_command(cmd: list[str], cwd: Path, timeout_sec: float) -> tuple[int, str, str]:
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=os.environ.copy(),
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout_sec)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise TimeoutError(f"timed out after {timeout_sec:g}s") from None
+    return proc.returncode or 0, stdout.decode(errors="replace").strip(), stderr.decode(errors="replace").strip()
+
+
+async def run_job(
+    job: GemimgJob,
+    command: Callable[[GemimgJob], list[str]],
+    *,
+    semaphore: asyncio.Semaphore,
+    bucket: TokenBucket,
+    timeout_sec: float,
+    retries: int,
+    backoff_sec: float,
+    clock_start: float,
+) -> dict[str, Any]:
+    job.out_path.parent.mkdir(parents=True, exist_ok=True)
+    result: dict[str, Any] = {
+        "document_id": job.document_id,
+        "output_file": str(job.out_path),
+        "status": "failed",
+        "attempts": [],
+    }
+    queued_at = time.monotonic()
+    async with semaphore:
+        result["queue_wait_sec"] = round(time.monotonic() - queued_at, 3)
+        result["started_at_sec"] = round(time.monotonic() - clock_start, 3)
+        for attempt in range(retries + 1):
+            if attempt:
+                delay = backoff_sec * 2 ** (attempt - 1) * random.uniform(0.8, 1.2)
+                await asyncio.sleep(delay)
+            await bucket.acquire()
+            t0 = time.monotonic()
+            record: dict[str, Any] = {"attempt": attempt + 1}
+            try:
+                returncode, stdout, stderr = await run_command(command(job), job.out_path.parent, timeout_sec)
+                record["returncode"] = returncode
+                if returncode != 0:
+                    raise RuntimeError(stderr or stdout or f"exit code {returncode}")
+                if not job.out_path.exists():
+                    raise RuntimeError(f"reported success but output not found: {job.out_path}")
+                result["status"] = "ok"
+                result["stdout"] = stdout
+                result.pop("error", None)
+            except Exception as exc:
+                record["error"] = str(exc)
+                result["error"] = str(exc)
+            record["wall_sec"] = round(time.monotonic() - t0, 3)
+            result["attempts"].append(record)
+            if result["status"] == "ok":
+                break
+    result["wall_sec"] = round(time.monotonic() - queued_at, 3)
+    return result
+
+
+async def run_jobs_async(
+    jobs: list[GemimgJob],
+    *,
+    backend: str = "gemimg",
+    concurrency: int = 4,
+    rate_per_sec: float = 1.0,
+    timeout_sec: float = 240,
+    retries: int = 2,
+    backoff_sec: float = 2.0,
+    on_result: Callable[[dict[str, Any]], None] | None = None,
+) -> list[dict[str, Any]]:
+    command = BACKENDS[backend]
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    bucket = TokenBucket(rate_per_sec, burst=max(1, concurrency))
+    clock_start = time.monotonic()
+
+    async def tracked(job: GemimgJob) -> dict[str, Any]:
+        result = await run_job(
+            job,
+            command,
+            semaphore=semaphore,
+            bucket=bucket,
+            timeout_sec=timeout_sec,
+            retries=retries,
+            backoff_sec=backoff_sec,
+            clock_start=clock_start,
+        )
+        if on_result:
+            on_result(result)
+        return result
+
+    return list(await asyncio.gather(*(tracked(job) for job in jobs)))
+
+
+def run_jobs(jobs: list[GemimgJob], **kwargs: Any) -> list[dict[str, Any]]:
+    """Run jobs to completion and return one result per job, in job order."""
+    if not jobs:
+        return []
+    return asyncio.run(run_jobs_async(jobs, **kwargs))
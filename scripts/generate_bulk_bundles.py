@@ -0,0 +1,265 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["jsonschema>=4.23.0"]
+# ///
+
+"""Generate N seeded synthetic applicant bundles for load-testing extraction and rendering.
+
+Profiles are sampled from the hand-written demo personas in generate_synthetic_bundles.py and
+fed through the same archetype builders, so every record matches the applicant schema. Each
+applicant uses its own RNG derived from (seed, index): output is identical for a given seed
+regardless of how it is sharded. Records are streamed, so memory stays flat for any count.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Iterator
+
+from bundle_model import Applicant
+from catalog import CATALOG_PATH, update_catalog
+from dataset_stream import dataset_path, open_dataset, write_dataset_stream, write_shards
+from generate_synthetic_bundles import (
+    FORMAT_VARIANT_PLAN,
+    GENERATED_ON,
+    INTERNATIONAL_PROFILES,
+    OUT_DIR,
+    ROOT,
+    SCNC_PROFILES,
+    VETERAN_PROFILES,
+    build_schema,
+    international_applicant,
+    scnc_applicant,
+    set_doc_variant,
+    veteran_applicant,
+    write_json,
+)
+from schema_validation import DatasetValidationError, StreamingValidator
+
+BULK_DIR = OUT_DIR / "bulk"
+BULK_SCHEMA_PATH = OUT_DIR / "schema" / "synthetic_applicant_bundles.bulk.schema.json"
+DATASET_ID = "super-fast-ai-credit-checking.synthetic-applicant-bundles.bulk.v1"
+
+FIRST_NAMES = [
+    "Aaliyah", "Andre", "Carmen", "Chloe", "Daniel", "Deja", "Elena", "Emeka", "Fatima", "Gabriel",
+    "Hannah", "Hiro", "Imani", "Isaac", "Jamal", "Jasmine", "Jose", "Kayla", "Keisha", "Liam",
+    "Lucia", "Malik", "Marcus", "Mei", "Nadia", "Noah", "Olivia", "Omar", "Rosa", "Ryan",
+    "Sofia", "Tariq", "Terrence", "Valeria", "Victor", "Yesenia", "Zoe",
+]
+LAST_NAMES = [
+    "Adeyemi", "Alvarez", "Baker", "Brooks", "Castillo", "Chang", "Coleman", "Diaz", "Edwards", "Flores",
+    "Garcia", "Goldberg", "Gupta", "Hughes", "Ibrahim", "Jackson", "Johnson", "Kowalski", "Le", "Mendoza",
+    "Murphy", "Nakamura", "Okafor", "Ortiz", "Park", "Price", "Ramirez", "Reyes", "Robinson", "Santos",
+    "Schmidt", "Singh", "Sullivan", "Thompson", "Washington", "Williams", "Yilmaz",
+]
+RANKS = ["SPC / E-4", "SGT / E-5", "SSG / E-6", "SFC / E-7", "MSG / E-8"]
+COMPONENTS = ["Active Duty", "Army Reserve", "National Guard"]
+TERMS = ["Fall", "Spring", "Summer"]
+GRADES = ["A", "A-", "B+", "B", "B-", "C+", "C", "C-"]
+GRADE_POINTS = {"A": 4.0, "A-": 3.7, "B+": 3.3, "B": 3.0, "B-": 2.7, "C+": 2.3, "C": 2.0, "C-": 1.7}
+FILE_STYLES = ["{prefix}_{last}.{ext}", "scan_{first}_{last}_{prefix}.{ext}", "IMG_{n}_{prefix}.{ext}", "{first}{last}_{prefix}_copy.{ext}"]
+ARCHETYPES = ("A", "B", "C")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=10_000, help="Number of applicants to generate.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--format", choices=["ndjson", "shards", "json"], default="ndjson")
+    parser.add_argument("--shard-size", type=int, default=5_000, help="Applicants per shard with --format shards.")
+    parser.add_argument("--output", type=Path, default=None, help="Output file (ndjson/json) or directory (shards).")
+    parser.add_argument("--no-validate", action="store_true", help="Skip per-applicant schema validation.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes validating applicants as they are written (0 = one per CPU).",
+    )
+    parser.add_argument("--catalog", type=Path, default=CATALOG_PATH, help="SQLite catalog to update (see query_catalog.py).")
+    parser.add_argument("--no-catalog", action="store_true", help="Skip the catalog export.")
+    return parser.parse_args()
+
+
+def random_date(rng: random.Random, start: date, end: date) -> date:
+    return start + timedelta(days=rng.randint(0, (end - start).days))
+
+
+def random_id(rng: random.Random, prefix: str, digits: int = 7) -> str:
+    return f"{prefix}-{rng.randrange(10 ** (digits - 1), 10**digits)}"
+
+
+def file_name(rng: random.Random, first: str, last: str, prefix: str, ext: str) -> str:
+    style = rng.choice(FILE_STYLES)
+    return style.format(prefix=prefix, first=first, last=last, n=rng.randint(1000, 9999), ext=ext)
+
+
+def veteran_profile(rng: random.Random, first: str, last: str) -> dict[str, Any]:
+    template = rng.choice(VETERAN_PROFILES)
+    start = random_date(rng, date(1998, 1, 1), date(2016, 12, 31))
+    end = min(start + timedelta(days=rng.randint(4, 14) * 365), date(2025, 6, 30))
+    jst = random_date(rng, date(2024, 1, 1), date(2025, 12, 31))
+    secplus = random_date(rng, date(2023, 6, 1), date(2025, 12, 31))
+    initials = f"{first[0]}{last[0]}"
+    return {
+        **template,
+        "name": f"{first} {last}",
+        "component": rng.choice(COMPONENTS),
+        "rank": rng.choice(RANKS),
+        "service_start": start.isoformat(),
+        "service_end": end.isoformat(),
+        "deployments": rng.choice([0, 0, 1, 1, 2, 3]),
+        "offset": start.year - 2006,
+        "jst_issue_date": jst.isoformat(),
+        "secplus_issue_date": secplus.isoformat(),
+        "secplus_expiry": date(secplus.year + 3, secplus.month, min(secplus.day, 28)).isoformat(),
+        "secplus_id": f"COMP-SEC-{rng.randrange(16**4):04X}-{rng.randrange(10**4):04d}",
+        "jst_id": random_id(rng, f"JST-{initials}"),
+        "dd214_number": f"DD214-{rng.randrange(10**4):04d}-{initials}-{start.year}",
+        "dd214_file": file_name(rng, first, last, "dd214", "webp"),
+        "jst_file": file_name(rng, first, last, "JST", "pdf"),
+        "secplus_file": file_name(rng, first, last, "SecurityPlus", "pdf"),
+    }
+
+
+def scnc_profile(rng: random.Random, first: str, last: str) -> dict[str, Any]:
+    template = rng.choice(SCNC_PROFILES)
+    college = rng.choice(SCNC_PROFILES)
+    year_1 = rng.randint(1996, 2016)
+    grades = {key: rng.choice(GRADES) for key in ("psy_grade", "eng_grade", "alg_grade", "cis_grade")}
+    term_1 = rng.choice(TERMS)
+    return {
+        **template,
+        **grades,
+        "name": f"{first} {last}",
+        "hs_issuer": rng.choice(SCNC_PROFILES)["hs_issuer"],
+        "hs_signer": f"{rng.choice(FIRST_NAMES)[0]}. {rng.choice(LAST_NAMES)}",
+        "hs_attestation_date": random_date(rng, date(2025, 1, 1), date(2025, 12, 31)).isoformat(),
+        "hs_file": file_name(rng, first, last, "hs_attestation", "webp"),
+        "cc_name": college["cc_name"],
+        "cc_student_id": random_id(rng, college["cc_student_id"].split("-")[0], 6),
+        "cc_year_1": year_1,
+        "cc_year_2": year_1 + (term_1 != "Spring"),
+        "cc_term_1_label": term_1,
+        "cc_term_2_label": rng.choice(TERMS),
+        "cc_gpa": round(sum(GRADE_POINTS[g] for g in grades.values()) / len(grades), 2),
+        "cc_issue_date": random_date(rng, date(2025, 1, 1), date(2025, 12, 31)).isoformat(),
+        "cc_file": file_name(rng, first, last, "transcript", "webp"),
+        "sophia_issue_date": random_date(rng, date(2025, 1, 1), date(2025, 12, 31)).isoformat(),
+        "sophia_file": file_name(rng, first, last, "Sophia", "pdf"),
+        "google_issue_date": random_date(rng, date(2024, 6, 1), date(2025, 12, 31)).isoformat(),
+        "google_cred_id": f"GPM-{first[0]}{last[0]}-{rng.randrange(10**4):04d}-2025",
+        "google_file": file_name(rng, first, last, "GooglePM", "pdf"),
+    }
+
+
+def international_profile(rng: random.Random, first: str, last: str) -> dict[str, Any]:
+    template = rng.choice(INTERNATIONAL_PROFILES)
+    breakdown = {section: rng.randint(15, 30) for section in ("Reading", "Listening", "Speaking", "Writing")}
+    report = random_date(rng, date(2025, 1, 1), date(2025, 12, 31))
+    return {
+        **template,
+        "name": f"{first} {last}",
+        "us_gpa": round(rng.uniform(2.5, 3.9), 2),
+        "report_date": report.isoformat(),
+        "ref_number": random_id(rng, template["agency"]),
+        "eval_file": file_name(rng, first, last, template["agency"], "pdf"),
+        "toefl_date": random_date(rng, date(2024, 6, 1), report).isoformat(),
+        "toefl_registration": random_id(rng, "ETS-IBT", 8),
+        "toefl_breakdown": breakdown,
+        "toefl_total": sum(breakdown.values()),
+        "toefl_file": file_name(rng, first, last, "TOEFL", "pdf"),
+        "proposed_transfer_total": float(rng.choice(range(30, 66, 3))),
+    }
+
+
+PROFILE_FACTORIES = {
+    "A": (veteran_profile, veteran_applicant),
+    "B": (scnc_profile, scnc_applicant),
+    "C": (international_profile, international_applicant),
+}
+# Every (format, rendering, single_page_image) variant the demo plan uses for each document type.
+FORMAT_CHOICES: dict[str, list[tuple[str, str, bool]]] = {}
+for _plan in FORMAT_VARIANT_PLAN.values():
+    for _doc_type, _variant in _plan.items():
+        if _variant not in FORMAT_CHOICES.setdefault(_doc_type, []):
+            FORMAT_CHOICES[_doc_type].append(_variant)
+
+
+def bulk_applicant(seed: int, index: int) -> Applicant:
+    """Applicant `index` (1-based) of the dataset for `seed`; independent of every other index."""
+    rng = random.Random(f"{seed}:{index}")
+    archetype = rng.choice(ARCHETYPES)
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    make_profile, build = PROFILE_FACTORIES[archetype]
+    applicant = build(index, make_profile(rng, first, last))
+    for doc in applicant.documents:
+        fmt, rendering, single_page_image = rng.choice(FORMAT_CHOICES[doc.document_type])
+        set_doc_variant(doc, fmt=fmt, rendering=rendering, single_page_image=single_page_image)
+    return applicant
+
+
+def iter_applicants(count: int, seed: int, start: int = 1) -> Iterator[dict[str, Any]]:
+    """JSON-ready applicant records; each model lives only until its record is built."""
+    for index in range(start, start + count):
+        yield bulk_applicant(seed, index).to_dict()
+
+
+def dataset_header(count: int, seed: int) -> dict[str, Any]:
+    return {
+        "dataset_id": DATASET_ID,
+        "generated_on": GENERATED_ON,
+        "dataset_notes": [
+            "Synthetic records only; names, IDs, and credentials are fictitious.",
+            f"Bulk load-testing dataset: {count} applicants sampled from the demo personas with seed {seed}.",
+            "Bundle formats are drawn per document from the demo format mix (PDF, WEBP, TXT).",
+        ],
+    }
+
+
+def report_shard(shard: dict[str, Any]) -> None:
+    print(f"  shard {shard['file']}: {shard['count']} applicants from #{shard['first_index']}")
+
+
+def main() -> None:
+    args = parse_args()
+    header = dataset_header(args.count, args.seed)
+    schema = build_schema(None)
+    write_json(BULK_SCHEMA_PATH, schema)
+
+    # Every layout streams validated applicants straight to disk, so memory stays flat for any --count.
+    # The seed goes in the ndjson/shard metadata only; the json layout must match the dataset schema.
+    out = args.output or dataset_path(BULK_DIR / f"applicants_{args.count}.json", args.format)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    applicants = iter_applicants(args.count, args.seed)
+    validator = None if args.no_validate else StreamingValidator(schema, jobs=jobs)
+    if validator is not None:
+        validator.check_header(header, args.count)
+        applicants = validator.check(applicants)
+    try:
+        if args.format == "shards":
+            write_shards(out, {**header, "seed": args.seed}, applicants, shard_size=args.shard_size, on_shard=report_shard)
+        elif args.format == "ndjson":
+            write_dataset_stream(out, {**header, "seed": args.seed}, applicants, "ndjson")
+        else:
+            write_dataset_stream(out, header, applicants, "json")
+    except DatasetValidationError as exc:
+        raise SystemExit(f"Stopped before finishing {out}: {exc}") from None
+    finally:
+        if validator is not None:
+            validator.close()
+
+    print(f"Wrote schema: {BULK_SCHEMA_PATH.relative_to(ROOT)}")
+    print(f"Wrote {args.count} applicants ({args.format}) -> {out}")
+    if not args.no_catalog:
+        # Read back from disk so the export streams too, rather than keeping the applicants around.
+        written_header, written = open_dataset(out)
+        update_catalog(args.catalog, written_header, written, "credit", out)
+
+
+if __name__ == "__main__":
+    main()
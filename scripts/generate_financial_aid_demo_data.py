@@ -1,56 +1,119 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.12"
-# dependencies = ["pillow>=10.4.0", "reportlab>=4.2.0"]
+# dependencies = ["numpy>=1.26", "pillow>=10.4.0", "reportlab>=4.2.0"]
 # ///
 
 """Generate synthetic financial-aid applicant bundles with documents + chats."""
 
 from __future__ import annotations
 
+import argparse
 import json
-import textwrap
+import time
+import zlib
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
-from PIL import Image, ImageDraw, ImageEnhance, ImageFilter, ImageFont, ImageOps
+from PIL import Image, ImageDraw, ImageFilter
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
 
+from catalog import CATALOG_PATH, update_catalog
+from daemon_client import DEFAULT_SOCKET, apply_settings, connect, current_settings
+from dataset_stream import FORMATS, dataset_path, write_dataset_stream
+from document_ir import IR_CACHE, IR_CACHE_DIR, DocumentIR, Field, Fields, Lines, Section
+from font_registry import REGISTRY as FONT_REGISTRY, choose_font
+from manifest_watch import DEFAULT_INTERVAL_SEC, ManifestWatcher, diff_records, load_json_if_valid
+from page_templates import TEMPLATES
+from render_cache import CACHE_DIR, RenderCache, cache_key, cached_render, tally
+from render_metrics import aggregate, measure, note_pixels, stage
+from scan_effects import (
+    Brightness,
+    Effect,
+    EllipseFill,
+    EllipseRing,
+    GaussianNoise,
+    Monochrome,
+    apply_effects,
+    mean_luma,
+)
+from scan_geometry import DEFAULT_BUDGET_MB, GEOMETRY, paste_rotated
+from text_layout import METRICS, wrap
+from webp_profiles import DEFAULT_PROFILE, PROFILES, WEBP
+
 ROOT = Path(__file__).resolve().parents[1]
 DATA_ROOT = ROOT / "financial-aid" / "data"
+DATASET_PATH = DATA_ROOT / "all_applicants.json"
+# Timings and RSS change on every run, so they go to this untracked file instead of manifest.json.
+RENDER_METRICS_PATH = DATA_ROOT / "render_metrics.json"
 TZ_CST = timezone(timedelta(hours=-6))
+# Bump whenever rendered output changes so stale cache entries are not reused.
+RENDERER_VERSION = "5"
 
 
-def choose_font(size: int, *, bold: bool = False, mono: bool = False) -> ImageFont.ImageFont:
-    mono_candidates = [
-        "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
-        "/usr/share/fonts/truetype/liberation2/LiberationMono-Regular.ttf",
-    ]
-    sans_candidates = [
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-        "/usr/share/fonts/truetype/liberation2/LiberationSans-Regular.ttf",
-    ]
-    bold_candidates = [
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-        "/usr/share/fonts/truetype/liberation2/LiberationSans-Bold.ttf",
-    ]
-    candidates = mono_candidates if mono else (bold_candidates if bold else sans_candidates)
-    if bold and not mono:
-        candidates = bold_candidates + sans_candidates
-    for candidate in candidates:
-        if Path(candidate).exists():
-            try:
-                return ImageFont.truetype(candidate, size)
-            except OSError:
-                continue
-    return ImageFont.load_default()
-
-
-def wrap_text(text: str, width: int) -> list[str]:
-    return textwrap.wrap(text, width=width) or [""]
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=CACHE_DIR,
+        help="Content-addressed render cache; unchanged documents are linked from here instead of re-rendered.",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Render every document from scratch.")
+    parser.add_argument(
+        "--template-dir",
+        type=Path,
+        default=None,
+        help="Persist pre-rendered desk and page templates here so later runs skip drawing them.",
+    )
+    parser.add_argument(
+        "--distort-budget-mb",
+        type=float,
+        default=DEFAULT_BUDGET_MB,
+        help="Working-memory budget for rotating card and paper layers onto the desk.",
+    )
+    parser.add_argument(
+        "--webp-profile",
+        choices=sorted(PROFILES),
+        default=DEFAULT_PROFILE,
+        help="WEBP encoder settings for photo documents (draft = fastest, archival = release quality).",
+    )
+    parser.add_argument(
+        "--daemon",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_SOCKET,
+        default=None,
+        metavar="SOCKET",
+        help="Send renders to a warm scripts/render_daemon.py (default socket when no path is given); "
+        "renders in-process if none is listening.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Render from the existing all_applicants.json, then keep polling it and re-render only the "
+        "documents an edit touches (Ctrl-C stops).",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=DEFAULT_INTERVAL_SEC,
+        help="Seconds between --watch polls of all_applicants.json.",
+    )
+    parser.add_argument(
+        "--dataset-format",
+        choices=FORMATS,
+        default="json",
+        help="Layout of the combined dataset: all_applicants.json, all_applicants.ndjson, or an "
+        "all_applicants/ directory of shard files plus index.json.",
+    )
+    parser.add_argument("--shard-size", type=int, default=1, help="Applicants per shard file with --dataset-format shards.")
+    parser.add_argument("--catalog", type=Path, default=CATALOG_PATH, help="SQLite catalog to update (see query_catalog.py).")
+    parser.add_argument("--no-catalog", action="store_true", help="Skip the catalog export.")
+    return parser.parse_args()
 
 
 def slugify(value: str) -> str:
@@ -149,31 +212,62 @@ def timestamped_chat(start_hour: int, start_minute: int, events: list[dict[str,
     return out
 
 
-def pdf_line(c: canvas.Canvas, text: str, x: float, y: float, width_chars: int = 96) -> float:
-    for wrapped in wrap_text(text, width_chars):
+def pdf_line(c: canvas.Canvas, text: str, x: float, y: float, max_width: float) -> float:
+    """Draw one Helvetica 10 line wrapped to `max_width` points, continuing on a new page at the bottom margin."""
+    for wrapped in wrap(text, max_width, METRICS.pdf("Helvetica", 10)):
+        if y < 82:
+            c.showPage()
+            y = letter[1] - 54
+            c.setFont("Helvetica", 10)
         c.drawString(x, y, wrapped)
         y -= 13
     return y
 
 
-def render_pdf_document(doc: dict[str, Any], out_path: Path) -> None:
+def build_document_ir(doc: dict[str, Any]) -> DocumentIR:
+    header = Fields(
+        (
+            Field("issuer", "Issuer", doc["issuer"]),
+            Field("issue_date", "Issue Date", doc["issue_date"]),
+            Field("doc_type", "Document Type", doc["doc_type"]),
+            Field("document_role", "Role", doc["document_role"]),
+        )
+    )
+    sections = []
+    if doc.get("structured_fields"):
+        rows = tuple(
+            Field(key, key.replace("_", " ").title(), value) for key, value in doc["structured_fields"].items()
+        )
+        sections.append(Section("fields", "KEY FIELDS", (Fields(rows),)))
+    if doc.get("body_lines"):
+        sections.append(Section("content", "CONTENT", (Lines(tuple(doc["body_lines"])),)))
+    return DocumentIR(doc["title"], header, tuple(sections))
+
+
+def document_ir(doc: dict[str, Any]) -> DocumentIR:
+    return IR_CACHE.get("financial_aid", doc, RENDERER_VERSION, lambda: build_document_ir(doc))
+
+
+def render_pdf_document(ir: DocumentIR, out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
     c = canvas.Canvas(str(out_path), pagesize=letter)
     width, height = letter
     x_margin = 52
+    text_width = width - 2 * x_margin
     y = height - 54
 
     c.setFont("Helvetica-Bold", 15)
-    c.drawString(x_margin, y, doc["title"])
+    c.drawString(x_margin, y, ir.title)
     y -= 20
 
     c.setFillColor(colors.HexColor("#444444"))
     c.setFont("Helvetica", 9)
-    c.drawString(x_margin, y, f"Issuer: {doc['issuer']}")
-    c.drawRightString(width - x_margin, y, f"Issue Date: {doc['issue_date']}")
+    issuer, issue_date, doc_type, role = ir.header.rows
+    c.drawString(x_margin, y, issuer.text)
+    c.drawRightString(width - x_margin, y, issue_date.text)
     y -= 16
-    c.drawString(x_margin, y, f"Document Type: {doc['doc_type']}")
-    c.drawRightString(width - x_margin, y, f"Role: {doc['document_role']}")
+    c.drawString(x_margin, y, doc_type.text)
+    c.drawRightString(width - x_margin, y, role.text)
 
     y -= 14
     c.setFillColor(colors.HexColor("#777777"))
@@ -183,27 +277,26 @@ def render_pdf_document(doc: dict[str, Any], out_path: Path) -> None:
     c.setFillColor(colors.black)
     c.setFont("Helvetica", 10)
 
-    if doc.get("structured_fields"):
+    if (fields := ir.block("fields", Fields)):
         c.setFont("Helvetica-Bold", 11)
         c.drawString(x_margin, y, "KEY FIELDS")
         y -= 15
         c.setFont("Helvetica", 10)
-        for key, value in doc["structured_fields"].items():
-            line = f"{key.replace('_', ' ').title()}: {value}"
-            y = pdf_line(c, line, x_margin, y)
+        for row in fields.rows:
+            y = pdf_line(c, row.text, x_margin, y, text_width)
             if y < 82:
                 c.showPage()
                 y = height - 54
                 c.setFont("Helvetica", 10)
 
-    if doc.get("body_lines"):
+    if (content := ir.block("content", Lines)):
         y -= 4
         c.setFont("Helvetica-Bold", 11)
         c.drawString(x_margin, y, "CONTENT")
         y -= 15
         c.setFont("Helvetica", 10)
-        for line in doc["body_lines"]:
-            y = pdf_line(c, line, x_margin, y)
+        for line in content.lines:
+            y = pdf_line(c, line, x_margin, y, text_width)
             if y < 82:
                 c.showPage()
                 y = height - 54
@@ -220,8 +313,7 @@ def render_pdf_document(doc: dict[str, Any], out_path: Path) -> None:
     c.save()
 
 
-def render_card_photo(doc: dict[str, Any], out_path: Path) -> None:
-    out_path.parent.mkdir(parents=True, exist_ok=True)
+def build_card_desk() -> Image.Image:
     bg = Image.new("RGB", (1600, 980), (58, 63, 70))
     bg_draw = ImageDraw.Draw(bg)
 
@@ -229,16 +321,75 @@ def render_card_photo(doc: dict[str, Any], out_path: Path) -> None:
     for idx in range(0, 980, 14):
         shade = 54 + (idx % 5)
         bg_draw.line([(0, idx), (1600, idx)], fill=(shade, shade + 2, shade + 5), width=1)
+    return bg
 
+
+def build_card_blank() -> Image.Image:
     card = Image.new("RGB", (1090, 680), (239, 242, 247))
     d = ImageDraw.Draw(card)
     d.rectangle([(0, 0), (1090, 98)], fill=(26, 82, 153))
-    d.text((28, 32), doc["title"].upper(), fill="white", font=choose_font(30, bold=True))
-
     d.rectangle([(40, 145), (335, 495)], outline=(40, 50, 65), width=3)
     d.text((70, 300), "PHOTO", fill=(110, 115, 120), font=choose_font(34, bold=True))
+    d.rectangle([(0, 620), (1090, 680)], fill=(216, 222, 232))
+    d.text((30, 639), "SYNTHETIC DEMO DOCUMENT", fill=(35, 45, 60), font=choose_font(18, bold=True))
+    return card
+
+
+def build_page_desk() -> Image.Image:
+    desk = Image.new("RGB", (1900, 1500), (66, 71, 78))
+    desk_draw = ImageDraw.Draw(desk)
+    for idx in range(0, 1900, 24):
+        tint = 60 + (idx % 7)
+        desk_draw.line([(idx, 0), (idx, 1500)], fill=(tint, tint + 1, tint + 4), width=1)
+    return desk
+
+
+def build_paper_blank() -> Image.Image:
+    paper = Image.new("RGB", (1080, 1340), (248, 245, 238))
+    d = ImageDraw.Draw(paper)
+    d.rectangle([(0, 0), (1079, 90)], fill=(40, 53, 72))
+    d.text((30, 1296), "Synthetic demo record - not real PII", fill=(80, 80, 80), font=choose_font(16))
+    return paper
 
-    fields = doc.get("structured_fields", {})
+
+PAGE_TEMPLATES = {
+    "card_desk": build_card_desk,
+    "card_blank": build_card_blank,
+    "page_desk": build_page_desk,
+    "paper_blank": build_paper_blank,
+}
+
+
+def page_template(name: str) -> Image.Image:
+    """Fresh copy of a static desk or blank-document background."""
+    return TEMPLATES.get(name, (), RENDERER_VERSION, PAGE_TEMPLATES[name])
+
+
+def save_photo(img: Image.Image, out_path: Path, flags: list[str], seed: int, quality: int) -> None:
+    """Degrade, encode and write a composed photo, timing each step separately."""
+    note_pixels(img.size)
+    with stage("effects"):
+        img = apply_quality_flags(img, flags, seed=seed)
+    with stage("encode"):
+        data = WEBP.encode(img, quality)
+    with stage("write"):
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_bytes(data)
+
+
+def render_card_photo(doc: dict[str, Any], ir: DocumentIR, out_path: Path) -> None:
+    with stage("layout"):
+        bg = compose_card_photo(doc, ir)
+    save_photo(bg, out_path, doc.get("quality_flags", []), doc_seed(doc), 84)
+
+
+def compose_card_photo(doc: dict[str, Any], ir: DocumentIR) -> Image.Image:
+    bg = page_template("card_desk")
+    card = page_template("card_blank")
+    d = ImageDraw.Draw(card)
+    d.text((28, 32), ir.title.upper(), fill="white", font=choose_font(30, bold=True))
+
+    fields = block.values() if (block := ir.block("fields", Fields)) else {}
     y = 148
     for key in [
         "full_name",
@@ -254,46 +405,37 @@ def render_card_photo(doc: dict[str, Any], out_path: Path) -> None:
             d.text((380, y + 22), str(fields[key]), fill=(20, 20, 20), font=choose_font(20))
             y += 72
 
-    d.rectangle([(0, 620), (1090, 680)], fill=(216, 222, 232))
-    d.text((30, 639), "SYNTHETIC DEMO DOCUMENT", fill=(35, 45, 60), font=choose_font(18, bold=True))
-
     angle = -2.0 if "2_degree_skew" in doc.get("quality_flags", []) else -0.5
-    card_rot = card.rotate(angle, expand=True, fillcolor=(58, 63, 70))
-    x = (bg.width - card_rot.width) // 2
-    y0 = (bg.height - card_rot.height) // 2
-    bg.paste(card_rot, (x, y0))
+    paste_rotated(bg, card, angle, fillcolor=(58, 63, 70))
+    return bg
 
-    final_img = apply_quality_flags(bg, doc.get("quality_flags", []))
-    final_img.save(out_path, "WEBP", quality=84, method=6)
 
+def render_page_photo(doc: dict[str, Any], ir: DocumentIR, out_path: Path) -> None:
+    flags = doc.get("quality_flags", [])
+    with stage("layout"):
+        desk = compose_page_photo(doc, ir)
+    save_photo(desk, out_path, flags, doc_seed(doc), 78 if "compression_noise" in flags else 86)
 
-def render_page_photo(doc: dict[str, Any], out_path: Path) -> None:
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-
-    desk = Image.new("RGB", (1900, 1500), (66, 71, 78))
-    desk_draw = ImageDraw.Draw(desk)
-    for idx in range(0, 1900, 24):
-        tint = 60 + (idx % 7)
-        desk_draw.line([(idx, 0), (idx, 1500)], fill=(tint, tint + 1, tint + 4), width=1)
 
-    paper = Image.new("RGB", (1080, 1340), (248, 245, 238))
+def compose_page_photo(doc: dict[str, Any], ir: DocumentIR) -> Image.Image:
+    desk = page_template("page_desk")
+    paper = page_template("paper_blank")
     d = ImageDraw.Draw(paper)
-    d.rectangle([(0, 0), (1079, 90)], fill=(40, 53, 72))
-    d.text((26, 28), doc["title"], fill="white", font=choose_font(30, bold=True))
+    text_width = paper.width - 2 * 34
+    body = METRICS.pil(choose_font(20))
+    d.text((26, 28), ir.title, fill="white", font=choose_font(30, bold=True))
 
     y = 118
-    d.text((30, y), f"Issuer: {doc['issuer']}", fill=(45, 45, 45), font=choose_font(18))
+    d.text((30, y), f"Issuer: {ir.header.get('issuer')}", fill=(45, 45, 45), font=choose_font(18))
     y += 32
-    d.text((30, y), f"Issue Date: {doc['issue_date']}", fill=(45, 45, 45), font=choose_font(18))
+    d.text((30, y), f"Issue Date: {ir.header.get('issue_date')}", fill=(45, 45, 45), font=choose_font(18))
     y += 36
     d.line([(30, y), (1040, y)], fill=(115, 115, 115), width=2)
     y += 24
 
-    fields = doc.get("structured_fields", {})
-    for key, value in fields.items():
-        label = key.replace("_", " ").title()
-        text = f"{label}: {value}"
-        for wrapped in wrap_text(text, 62):
+    fields = ir.block("fields", Fields)
+    for row in fields.rows if fields else ():
+        for wrapped in wrap(row.text, text_width, body):
             d.text((34, y), wrapped, fill=(28, 28, 28), font=choose_font(20))
             y += 28
         y += 4
@@ -301,55 +443,51 @@ def render_page_photo(doc: dict[str, Any], out_path: Path) -> None:
     y += 6
     d.text((30, y), "Details", fill=(45, 45, 45), font=choose_font(21, bold=True))
     y += 30
-    for line in doc.get("body_lines", []):
-        for wrapped in wrap_text(line, 64):
+    content = ir.block("content", Lines)
+    for line in content.lines if content else ():
+        for wrapped in wrap(line, text_width, body):
             d.text((34, y), wrapped, fill=(25, 25, 25), font=choose_font(20))
             y += 27
         y += 3
 
-    d.text((30, 1296), "Synthetic demo record - not real PII", fill=(80, 80, 80), font=choose_font(16))
-
     angle = -2.0 if "2_degree_skew" in doc.get("quality_flags", []) else -0.8
-    paper_rot = paper.rotate(angle, expand=True, fillcolor=(66, 71, 78))
-    x = (desk.width - paper_rot.width) // 2
-    y0 = (desk.height - paper_rot.height) // 2
-    desk.paste(paper_rot, (x, y0))
-
-    final_img = apply_quality_flags(desk, doc.get("quality_flags", []))
-    quality = 78 if "compression_noise" in doc.get("quality_flags", []) else 86
-    final_img.save(out_path, "WEBP", quality=quality, method=6)
+    paste_rotated(desk, paper, angle, fillcolor=(66, 71, 78))
+    return desk
 
 
-def apply_quality_flags(image: Image.Image, flags: list[str]) -> Image.Image:
-    img = image.convert("RGB")
+def quality_flag_effects(image: Image.Image, flags: list[str]) -> list[Effect]:
+    w, h = image.size
+    effects: list[Effect] = []
+    brightness = 1.0
+    glare = None
 
     if "low_light" in flags:
-        img = ImageEnhance.Brightness(img).enhance(0.74)
+        brightness = 0.74
+        effects.append(Brightness(brightness))
 
     if "shadow_glare" in flags:
-        overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
-        d = ImageDraw.Draw(overlay)
-        d.ellipse(
-            [(int(img.width * 0.58), int(img.height * 0.1)), (int(img.width * 1.05), int(img.height * 0.62))],
-            fill=(255, 255, 255, 42),
-        )
-        img = Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB")
+        glare = EllipseFill((int(w * 0.58), int(h * 0.1), int(w * 1.05), int(h * 0.62)), (255, 255, 255), 42 / 255)
+        effects.append(glare)
 
     if "coffee_stain" in flags:
-        overlay = Image.new("RGBA", img.size, (255, 255, 255, 0))
-        d = ImageDraw.Draw(overlay)
-        d.ellipse([(240, 430), (640, 870)], outline=(110, 70, 35, 65), width=18)
-        d.ellipse([(860, 220), (1170, 540)], outline=(122, 78, 41, 55), width=12)
-        img = Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB")
+        effects.append(EllipseRing((240, 430, 640, 870), (110, 70, 35), 65 / 255, width=18))
+        effects.append(EllipseRing((860, 220, 1170, 540), (122, 78, 41), 55 / 255, width=12))
 
     if "monochrome_artifacting" in flags:
-        img = ImageOps.grayscale(img).convert("RGB")
-        img = ImageEnhance.Contrast(img).enhance(1.18)
+        # ImageEnhance.Contrast pivots on the mean gray level at this point in the chain.
+        pivot = mean_luma(image) * brightness
+        if glare is not None:
+            pivot += glare.coverage(image.size) * glare.alpha * (255 - pivot)
+        effects.append(Monochrome(contrast=1.18, pivot=pivot))
 
     if "scanner_noise" in flags or "compression_noise" in flags:
-        noise = Image.effect_noise(img.size, 8).convert("L")
-        noise_rgb = Image.merge("RGB", (noise, noise, noise))
-        img = Image.blend(img, noise_rgb, 0.10)
+        effects.append(GaussianNoise(sigma=8, blend=0.10))
+
+    return effects
+
+
+def apply_quality_flags(image: Image.Image, flags: list[str], seed: int | None = None) -> Image.Image:
+    img = apply_effects(image, quality_flag_effects(image, flags), seed=seed)
 
     if "blurry" in flags:
         img = img.filter(ImageFilter.GaussianBlur(radius=1.3))
@@ -357,16 +495,24 @@ def apply_quality_flags(image: Image.Image, flags: list[str]) -> Image.Image:
     return img
 
 
-def render_document(doc: dict[str, Any], out_path: Path) -> None:
+def doc_seed(doc: dict[str, Any]) -> int:
+    return zlib.crc32(doc["doc_id"].encode("utf-8"))
+
+
+def render_document(doc: dict[str, Any], out_path: Path) -> dict[str, Any]:
+    with stage("layout"):
+        ir = document_ir(doc)
     if doc["format"] == "pdf":
-        render_pdf_document(doc, out_path)
-        return
+        with stage("render"):
+            render_pdf_document(ir, out_path)
+        return {"engine": "local", "status": "ok"}
 
     template = doc.get("render_template")
     if template in {"id_card_photo", "ead_card_photo"}:
-        render_card_photo(doc, out_path)
+        render_card_photo(doc, ir, out_path)
     else:
-        render_page_photo(doc, out_path)
+        render_page_photo(doc, ir, out_path)
+    return {"engine": "local", "status": "ok"}
 
 
 def build_applicants() -> list[dict[str, Any]]:
@@ -2581,16 +2727,97 @@ def assign_paths(dataset: dict[str, Any]) -> None:
             doc["file_link"] = f"./{doc['file_name']}"
 
 
-def write_dataset(dataset: dict[str, Any]) -> None:
+def render_key(doc: dict[str, Any]) -> str:
+    method = f"{doc['format']}:{doc.get('render_template')}"
+    if doc["format"] == "webp" and not WEBP.is_default:
+        method += f":webp-{WEBP.profile.name}"
+    return cache_key(doc, method, None, RENDERER_VERSION)
+
+
+def run_document(doc: dict[str, Any], out_path: Path, cache: RenderCache | None) -> dict[str, Any]:
+    with measure() as metrics:
+        meta = cached_render(cache, render_key(doc), out_path, lambda: render_document(doc, out_path))
+    return {**meta, "metrics": metrics.finish([out_path])}
+
+
+def job_payload(doc: dict[str, Any], out_path: Path, cache: RenderCache | None) -> dict[str, Any]:
+    """JSON form of one document render for the render daemon, with this process's render settings."""
+    return {
+        "kind": "financial_aid",
+        "doc": doc,
+        "out_path": str(out_path.resolve()),
+        "cache_dir": str(cache.root.resolve()) if cache else None,
+        "settings": current_settings(),
+    }
+
+
+def run_job(payload: dict[str, Any]) -> dict[str, Any]:
+    """Render one `job_payload` job; the render daemon's entry point for financial-aid documents."""
+    apply_settings(payload["settings"])
+    cache = RenderCache(Path(payload["cache_dir"])) if payload["cache_dir"] else None
+    return run_document(payload["doc"], Path(payload["out_path"]), cache)
+
+
+def render_documents(
+    items: list[tuple[dict[str, Any], Path]],
+    cache: RenderCache | None,
+    daemon: Path | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield render metadata for each (document, output path), in order, via the daemon when one is listening."""
+    client = connect(daemon) if items else None
+    if client is None:
+        for doc, out_path in items:
+            yield run_document(doc, out_path, cache)
+        return
+    with client:
+        yield from client.render([job_payload(doc, out_path, cache) for doc, out_path in items])
+
+
+def write_dataset(
+    dataset: dict[str, Any],
+    cache: RenderCache | None = None,
+    daemon: Path | None = None,
+    previous: dict[str, dict[str, Any]] | None = None,
+    dataset_format: str = "json",
+    shard_size: int = 1,
+    catalog: Path | None = None,
+) -> dict[str, int]:
+    """Render every document and write the bundles, manifests and catalog; returns cache (and reuse) counts.
+
+    `previous` maps render keys to the metadata of documents rendered earlier in this process.
+    Documents found there whose output still exists are not rendered again, and the documents
+    rendered now are added to it.
+    """
     DATA_ROOT.mkdir(parents=True, exist_ok=True)
+    cache_counts = {"hits": 0, "misses": 0}
+    document_metrics: dict[str, dict[str, Any]] = {}
+    render_samples: list[tuple[str, dict[str, Any]]] = []
 
+    items: list[tuple[dict[str, Any], Path]] = []
     for applicant in dataset["applicants"]:
         folder_path = DATA_ROOT / applicant["folder_name"]
         folder_path.mkdir(parents=True, exist_ok=True)
+        items.extend((doc, folder_path / doc["file_name"]) for doc in applicant["document_bundle"])
 
-        for doc in applicant["document_bundle"]:
-            render_document(doc, folder_path / doc["file_name"])
+    keys = [render_key(doc) for doc, _ in items]
+    reused = {
+        index: previous[key]
+        for index, (key, (_, out_path)) in enumerate(zip(keys, items))
+        if previous is not None and key in previous and out_path.exists()
+    }
+    results = render_documents([item for index, item in enumerate(items) if index not in reused], cache, daemon)
+    for index, (doc, _) in enumerate(items):
+        meta = reused[index] if index in reused else next(results)
+        if index not in reused:
+            tally(cache_counts, meta)
+            if previous is not None:
+                previous[keys[index]] = meta
+        document_metrics[doc["doc_id"]] = meta["metrics"]
+        if meta.get("cache") != "hit":
+            render_samples.append((doc.get("render_template") or doc["format"], meta["metrics"]))
 
+    for applicant in dataset["applicants"]:
+        folder_path = DATA_ROOT / applicant["folder_name"]
         bundle_path = folder_path / "applicant_bundle.json"
         bundle_path.write_text(json.dumps(applicant, indent=2, ensure_ascii=True), encoding="utf-8")
 
@@ -2599,6 +2826,7 @@ def write_dataset(dataset: dict[str, Any]) -> None:
         "generated_on": dataset["generated_on"],
         "notes": dataset["notes"],
         "applicant_count": len(dataset["applicants"]),
+        "webp_profile": WEBP.profile.name,
         "applicants": [
             {
                 "applicant_id": a["applicant_id"],
@@ -2611,17 +2839,94 @@ def write_dataset(dataset: dict[str, Any]) -> None:
             for a in dataset["applicants"]
         ],
     }
+    render_metrics = {
+        "dataset_id": dataset["dataset_id"],
+        # Cache hits only time a file copy, so they are left out of the per-template table.
+        "render_metrics_by_template": aggregate(render_samples),
+        "document_render_metrics": document_metrics,
+    }
 
     (DATA_ROOT / "manifest.json").write_text(json.dumps(manifest, indent=2, ensure_ascii=True), encoding="utf-8")
-    (DATA_ROOT / "all_applicants.json").write_text(json.dumps(dataset, indent=2, ensure_ascii=True), encoding="utf-8")
+    RENDER_METRICS_PATH.write_text(json.dumps(render_metrics, indent=2, ensure_ascii=True), encoding="utf-8")
+    header = {key: value for key, value in dataset.items() if key != "applicants"}
+    out_path = dataset_path(DATASET_PATH, dataset_format)
+    write_dataset_stream(out_path, header, dataset["applicants"], dataset_format, shard_size=shard_size, newline=False)
+    update_catalog(catalog, header, dataset["applicants"], "financial_aid", out_path)
+    return {**cache_counts, "reused": len(reused)}
 
 
-def main() -> None:
+def document_records(dataset: dict[str, Any]) -> dict[str, Any]:
+    """doc_id -> everything its output file depends on: the document and its applicant folder."""
+    return {
+        doc["doc_id"]: {"folder": [applicant["applicant_id"], applicant["profile"]["full_name"]], "doc": doc}
+        for applicant in dataset["applicants"]
+        for doc in applicant["document_bundle"]
+    }
+
+
+def applicant_records(dataset: dict[str, Any]) -> dict[str, Any]:
+    return {
+        applicant["applicant_id"]: {key: value for key, value in applicant.items() if key != "document_bundle"}
+        for applicant in dataset["applicants"]
+    }
+
+
+def document_outputs(dataset: dict[str, Any]) -> set[Path]:
+    return {
+        DATA_ROOT / applicant["folder_name"] / doc["file_name"]
+        for applicant in dataset["applicants"]
+        for doc in applicant["document_bundle"]
+    }
+
+
+def watch_dataset(
+    dataset: dict[str, Any],
+    cache: RenderCache | None,
+    daemon: Path | None,
+    previous: dict[str, dict[str, Any]],
+    interval: float,
+    catalog: Path | None = None,
+) -> None:
+    """Re-render after every structural change to all_applicants.json until interrupted.
+
+    Only documents whose render key changed (or whose file went missing) are rendered; the
+    bundles and manifests are rewritten each time, including all_applicants.json itself.
+    """
+    watcher = ManifestWatcher([DATASET_PATH], interval)
+    print(f"Watching {DATASET_PATH.relative_to(ROOT)} every {interval:g}s (Ctrl-C to stop)")
+    changes = 0
+    for _, saved_at in watcher.changes():
+        new_dataset = load_json_if_valid(DATASET_PATH)
+        if new_dataset is None:
+            print(f"{DATASET_PATH.name} is not valid JSON yet; waiting for the next save")
+            continue
+        if new_dataset == dataset:
+            print(f"{DATASET_PATH.name} saved without structural changes")
+            continue
+        changes += 1
+        started = time.perf_counter()
+        assign_paths(new_dataset)
+        documents = diff_records(document_records(dataset), document_records(new_dataset))
+        applicants = diff_records(applicant_records(dataset), applicant_records(new_dataset))
+        counts = write_dataset(new_dataset, cache, daemon, previous, catalog=catalog)
+        watcher.accept()  # write_dataset rewrote the watched file
+        for stale in document_outputs(dataset) - document_outputs(new_dataset):
+            stale.unlink(missing_ok=True)
+        dataset = new_dataset
+        rendered = sum(len(a["document_bundle"]) for a in dataset["applicants"]) - counts["reused"]
+        print(
+            f"Change {changes}: documents {documents.summary()}; applicants {applicants.summary()} -> "
+            f"{rendered} document(s) rendered, outputs updated in {time.perf_counter() - started:.2f}s "
+            f"({time.time() - saved_at:.2f}s after save)"
+        )
+
+
+def default_dataset() -> dict[str, Any]:
     applicants = build_applicants()
     if len(applicants) != 12:
         raise RuntimeError(f"Expected 12 applicants, found {len(applicants)}")
 
-    dataset = {
+    return {
         "dataset_id": "financial_aid_bot_synthetic_demo_v1",
         "generated_on": "2026-03-02",
         "notes": [
@@ -2632,8 +2937,38 @@ def main() -> None:
         "applicants": applicants,
     }
 
+
+def main() -> None:
+    args = parse_args()
+    TEMPLATES.configure(args.template_dir)
+    IR_CACHE.configure(None if args.no_cache else IR_CACHE_DIR)
+    WEBP.configure(args.webp_profile)
+    GEOMETRY.configure(args.distort_budget_mb)
+    if args.watch and args.dataset_format != "json":
+        raise SystemExit("--watch edits all_applicants.json; run it with --dataset-format json")
+    if args.watch and DATASET_PATH.exists():
+        # Hand edits to all_applicants.json are the source in watch mode, so start from them.
+        dataset = json.loads(DATASET_PATH.read_text(encoding="utf-8"))
+        print(f"Rendering from {DATASET_PATH.relative_to(ROOT)}")
+    else:
+        dataset = default_dataset()
+
     assign_paths(dataset)
-    write_dataset(dataset)
+    cache = None if args.no_cache else RenderCache(args.cache_dir)
+    previous: dict[str, dict[str, Any]] | None = {} if args.watch else None
+    catalog = None if args.no_catalog else args.catalog
+    cache_counts = write_dataset(dataset, cache, args.daemon, previous, args.dataset_format, args.shard_size, catalog)
+    if cache is not None:
+        print(f"Render cache: {cache_counts['hits']} hits, {cache_counts['misses']} misses ({args.cache_dir})")
+    if args.daemon is None:
+        print(f"Font registry: {FONT_REGISTRY.hits} hits, {FONT_REGISTRY.misses} misses")
+        print(f"Page templates: {TEMPLATES.hits} hits, {TEMPLATES.misses} misses ({TEMPLATES.disk_hits} from disk)")
+        print(f"Document IR: {IR_CACHE.hits} hits, {IR_CACHE.misses} misses ({IR_CACHE.disk_hits} from disk)")
+    if previous is not None:
+        try:
+            watch_dataset(dataset, cache, args.daemon, previous, args.watch_interval, catalog)
+        except KeyboardInterrupt:
+            print("Stopped watching")
 
 
 if __name__ == "__main__":
@@ -8,12 +8,24 @@
 
 from __future__ import annotations
 
-import json
-from copy import deepcopy
+import argparse
+import os
 from pathlib import Path
 from typing import Any
 
-from jsonschema import Draft202012Validator
+from bundle_model import (
+    AceRecommendation,
+    Applicant,
+    Course,
+    CourseMapping,
+    Document,
+    Score,
+    VisualProfile,
+    as_json,
+)
+from catalog import CATALOG_PATH, update_catalog
+from dataset_stream import FORMATS, dataset_path, write_dataset_stream, write_json_stream
+from schema_validation import DatasetValidationError, validate_dataset
 
 ROOT = Path(__file__).resolve().parents[1]
 OUT_DIR = ROOT / "credit-checking" / "data"
@@ -22,7 +34,28 @@ DATA_PATH = OUT_DIR / "manifests" / "synthetic_applicant_bundles.json"
 GENERATED_ON = "2026-02-24"
 
 
-def build_schema() -> dict[str, Any]:
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        default="json",
+        help="Dataset layout: one JSON document (what the renderer reads), NDJSON, or shard files plus index.json.",
+    )
+    parser.add_argument("--shard-size", type=int, default=1, help="Applicants per shard file with --format shards.")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for per-applicant schema validation (0 = one per CPU).",
+    )
+    parser.add_argument("--catalog", type=Path, default=CATALOG_PATH, help="SQLite catalog to update (see query_catalog.py).")
+    parser.add_argument("--no-catalog", action="store_true", help="Skip the catalog export.")
+    return parser.parse_args()
+
+
+def build_schema(applicant_count: int | None = 12) -> dict[str, Any]:
+    """Dataset schema; `applicant_count=None` drops the fixed-size constraint for bulk datasets."""
     document_types = [
         "DD214",
         "JST",
@@ -57,8 +90,11 @@ def build_schema() -> dict[str, Any]:
             },
             "applicants": {
                 "type": "array",
-                "minItems": 12,
-                "maxItems": 12,
+                **(
+                    {"minItems": applicant_count, "maxItems": applicant_count}
+                    if applicant_count is not None
+                    else {"minItems": 1}
+                ),
                 "items": {"$ref": "#/$defs/applicant"},
             },
         },
@@ -445,6 +481,7 @@ def build_schema() -> dict[str, Any]:
                     },
                     "rotation_degrees": {"type": "number"},
                     "blur_px": {"type": "number"},
+                    "perspective_skew": {"type": "number", "minimum": 0, "maximum": 0.2},
                     "notes": {"type": "string"},
                 },
             },
@@ -458,14 +495,8 @@ def mapping(
     title: str,
     credits: float,
     rationale: str,
-) -> dict[str, Any]:
-    return {
-        "source_evidence": source_evidence,
-        "proposed_college_course_code": code,
-        "proposed_college_course_title": title,
-        "credits": credits,
-        "rationale": rationale,
-    }
+) -> CourseMapping:
+    return CourseMapping(source_evidence, code, title, credits, rationale)
 
 
 def course(
@@ -480,33 +511,23 @@ def course(
     level: str | None = None,
     source_system: str | None = None,
     notes: str | None = None,
-) -> dict[str, Any]:
-    payload: dict[str, Any] = {
-        "course_code": course_code,
-        "course_title": course_title,
-        "term_label": term_label,
-        "year": year,
-        "credits": credits,
-        "grade": grade,
-        "status": status,
-    }
-    if level:
-        payload["level"] = level
-    if source_system:
-        payload["source_system"] = source_system
-    if notes:
-        payload["notes"] = notes
-    return payload
+) -> Course:
+    return Course(
+        course_code,
+        course_title,
+        term_label,
+        year,
+        credits,
+        grade,
+        status=status,
+        level=level,
+        source_system=source_system,
+        notes=notes,
+    )
 
 
-def score(test_name: str, section: str, value: float, scale: str, test_date: str) -> dict[str, Any]:
-    return {
-        "test_name": test_name,
-        "section": section,
-        "score": value,
-        "scale": scale,
-        "test_date": test_date,
-    }
+def score(test_name: str, section: str, value: float, scale: str, test_date: str) -> Score:
+    return Score(test_name, section, value, scale, test_date)
 
 
 def ace(
@@ -515,29 +536,21 @@ def ace(
     lower: float,
     upper: float,
     recommendation_basis: str,
-) -> dict[str, Any]:
-    return {
-        "experience_or_training": experience_or_training,
-        "subject": subject,
-        "lower_division_credits": lower,
-        "upper_division_credits": upper,
-        "recommendation_basis": recommendation_basis,
-    }
+) -> AceRecommendation:
+    return AceRecommendation(experience_or_training, subject, lower, upper, recommendation_basis)
 
 
-def visual(style: str, tone: str, artifact: str, *, rot: float = 0.0, blur: float = 0.0, notes: str = "") -> dict[str, Any]:
-    out: dict[str, Any] = {
-        "style": style,
-        "paper_tone": tone,
-        "artifact_level": artifact,
-    }
-    if rot:
-        out["rotation_degrees"] = rot
-    if blur:
-        out["blur_px"] = blur
-    if notes:
-        out["notes"] = notes
-    return out
+def visual(
+    style: str,
+    tone: str,
+    artifact: str,
+    *,
+    rot: float = 0.0,
+    blur: float = 0.0,
+    skew: float = 0.0,
+    notes: str = "",
+) -> VisualProfile:
+    return VisualProfile(style, tone, artifact, rotation_degrees=rot, blur_px=blur, perspective_skew=skew, notes=notes)
 
 
 def make_doc(
@@ -554,25 +567,23 @@ def make_doc(
     page_count: int,
     structured: dict[str, Any],
     gemimg_prompt: str | None = None,
-) -> dict[str, Any]:
-    doc = {
-        "Document_ID": f"{applicant_id}-D{index}",
-        "Document_Type": doc_type,
-        "Title": title,
-        "Issuing_Organization": issuer,
-        "Issue_Date": issue_date,
-        "Document_Format": fmt,
-        "Rendering_Method": rendering,
-        "Output_File_Name": file_name,
-        "Page_Count": page_count,
-        "Structured_Content": structured,
-    }
-    if gemimg_prompt:
-        doc["Gemimg_Prompt"] = gemimg_prompt
-    return doc
+) -> Document:
+    return Document(
+        f"{applicant_id}-D{index}",
+        doc_type,
+        title,
+        issuer,
+        issue_date,
+        fmt,
+        rendering,
+        file_name,
+        page_count,
+        structured,
+        gemimg_prompt or None,
+    )
 
 
-def veteran_applicant(idx: int, profile: dict[str, Any]) -> dict[str, Any]:
+def veteran_applicant(idx: int, profile: dict[str, Any]) -> Applicant:
     applicant_id = f"APPL-{idx:03d}"
     name = profile["name"]
     preferred = name.split()[0]
@@ -783,11 +794,11 @@ def veteran_applicant(idx: int, profile: dict[str, Any]) -> dict[str, Any]:
         )
     )
 
-    return {
-        "Applicant_ID": applicant_id,
-        "Archetype_Code": "A",
-        "Archetype_Label": "Military Veteran Transitioning to Business/IT",
-        "Persona": {
+    return Applicant(
+        applicant_id=applicant_id,
+        archetype_code="A",
+        archetype_label="Military Veteran Transitioning to Business/IT",
+        persona={
             "full_name": name,
             "preferred_name": preferred,
             "career_goal": profile["career_goal"],
@@ -798,10 +809,10 @@ def veteran_applicant(idx: int, profile: dict[str, Any]) -> dict[str, Any]:
             ],
             "demo_storyline": profile["storyline"],
         },
-        "Target_Program": profile["target_program"],
-        "Admissions_Term": "2026FA",
-        "Document_Bundle": [dd214, jst, secplus],
-        "Expected_AI_Output": {
+        target_program=profile["target_program"],
+        admissions_term="2026FA",
+        documents=[dd214, jst, secplus],
+        expected_output={
             "Target_Pathway": profile["target_program"],
             "Pathway_Theme": "Military-to-business/IT accelerated transfer review",
             "Proposed_Transfer_Credits_Total": 12.0,
@@ -821,10 +832,10 @@ def veteran_applicant(idx: int, profile: dict[str, Any]) -> dict[str, Any]:
                 "equivalency for a business/IT transition pathway."
             ),
         },
-    }
+    )
 
 
-def scnc_applicant(idx: int, profile: dict[str, Any]) -> dict[str, Any]:
+def scnc_applicant(idx: int, profile: dict[str, Any]) -> Applicant:
     applicant_id = f"APPL-{idx:03d}"
     name = profile["name"]
     preferred = name.split()[0]
@@ -1033,11 +1044,11 @@ def scnc_applicant(idx: int, profile: dict[str, Any]) -> dict[str, Any]:
         )
     )
 
-    return {
-        "Applicant_ID": applicant_id,
-        "Archetype_Code": "B",
-        "Archetype_Label": "SCNC Corporate Upskiller (Some College, No Credential)",
-        "Persona": {
+    return Applicant(
+        applicant_id=applicant_id,
+        archetype_code="B",
+        archetype_label="SCNC Corporate Upskiller (Some College, No Credential)",
+        persona={
             "full_name": name,
             "preferred_name": preferred,
             "career_goal": profile["career_goal"],
@@ -1049,10 +1060,10 @@ def scnc_applicant(idx: int, profile: dict[str, Any]) -> dict[str, Any]:
             ],
             "demo_storyline": profile["storyline"],
         },
-        "Target_Program": "BS in Operations Management",
-        "Admissions_Term": "2026FA",
-        "Document_Bundle": [hs, cc_transcript, sophia, google_cert],
-        "Expected_AI_Output": {
+        target_program="BS in Operations Management",
+        admissions_term="2026FA",
+        documents=[hs, cc_transcript, sophia, google_cert],
+        expected_output={
             "Target_Pathway": "BS in Operations Management",
             "Pathway_Theme": "SCNC fast-track credit aggregation across old and new learning",
             "Proposed_Transfer_Credits_Total": 18.0,
@@ -1073,10 +1084,10 @@ def scnc_applicant(idx: int, profile: dict[str, Any]) -> dict[str, Any]:
                 "and applies a 12-credit Google PM articulation block to accelerate the pathway."
             ),
         },
-    }
+    )
 
 
-def international_applicant(idx: int, profile: dict[str, Any]) -> dict[str, Any]:
+def international_applicant(idx: int, profile: dict[str, Any]) -> Applicant:
     applicant_id = f"APPL-{idx:03d}"
     name = profile["name"]
     preferred = name.split()[0]
@@ -1111,14 +1122,14 @@ def international_applicant(idx: int, profile: dict[str, Any]) -> dict[str, Any]
                 f"Origin credential: {profile['credential']} ({profile['country']})",
                 f"U.S. equivalency: {profile['us_equivalency']}",
             ],
-            "courses": deepcopy(profile["evaluated_courses"]),
+            "courses": list(profile["evaluated_courses"]),
             "gpa_summary": {
                 "gpa": profile["us_gpa"],
                 "scale": 4.0,
                 "credits_attempted": profile["eval_credits"],
                 "credits_earned": profile["eval_credits"],
             },
-            "ai_mapping_hints": deepcopy(profile["eval_mapping_hints"]),
+            "ai_mapping_hints": list(profile["eval_mapping_hints"]),
             "visual_profile": visual("pristine_digital", "bright_white", "none", notes="Credential evaluation report table layout with agency header."),
         },
     )
@@ -1154,7 +1165,7 @@ def international_applicant(idx: int, profile: dict[str, Any]) -> dict[str, Any]
         },
     )
 
-    mapped = deepcopy(profile["eval_mapping_hints"])
+    mapped = list(profile["eval_mapping_hints"])
     mapped.append(
         mapping(
             f"TOEFL iBT total {profile['toefl_total']}",
@@ -1165,11 +1176,11 @@ def international_applicant(idx: int, profile: dict[str, Any]) -> dict[str, Any]
         )
     )
 
-    return {
-        "Applicant_ID": applicant_id,
-        "Archetype_Code": "C",
-        "Archetype_Label": "International Adult Learner",
-        "Persona": {
+    return Applicant(
+        applicant_id=applicant_id,
+        archetype_code="C",
+        archetype_label="International Adult Learner",
+        persona={
             "full_name": name,
             "preferred_name": preferred,
             "career_goal": profile["career_goal"],
@@ -1180,10 +1191,10 @@ def international_applicant(idx: int, profile: dict[str, Any]) -> dict[str, Any]
             ],
             "demo_storyline": profile["storyline"],
         },
-        "Target_Program": profile["target_program"],
-        "Admissions_Term": "2026FA",
-        "Document_Bundle": [evaluation, toefl],
-        "Expected_AI_Output": {
+        target_program=profile["target_program"],
+        admissions_term="2026FA",
+        documents=[evaluation, toefl],
+        expected_output={
             "Target_Pathway": profile["target_program"],
             "Pathway_Theme": "International transfer with credential evaluation + language verification",
             "Proposed_Transfer_Credits_Total": profile["proposed_transfer_total"],
@@ -1201,345 +1212,347 @@ def international_applicant(idx: int, profile: dict[str, Any]) -> dict[str, Any]
                 "credit details while the TOEFL report resolves English proficiency in the same intake pass."
             ),
         },
-    }
+    )
 
 
-def build_dataset() -> dict[str, Any]:
-    veterans = [
-        {
-            "name": "Miguel Rivera",
-            "component": "Active Duty",
-            "rank": "SSG / E-6",
-            "service_start": "2006-08-15",
-            "service_end": "2014-09-30",
-            "deployments": 1,
-            "offset": 0,
-            "jst_issue_date": "2024-11-12",
-            "secplus_issue_date": "2025-06-21",
-            "secplus_expiry": "2028-06-21",
-            "secplus_id": "COMP-SEC-8A1R-1927",
-            "jst_id": "JST-AR-5729441",
-            "dd214_number": "DD214-8471-AR-2006",
-            "dd214_file": "IMG_1044_dd214_rivera.webp",
-            "jst_file": "JST_MRivera_2024-11-12.pdf",
-            "secplus_file": "CompTIA_SecurityPlus_Miguel_Rivera.pdf",
-            "target_program": "BS in Information Technologies",
-            "career_goal": "Move from Army HR operations into corporate HRIS and cybersecurity-aware IT support roles.",
-            "storyline": "Veteran with strong personnel records experience wants a business/IT degree path without losing military credit.",
-        },
-        {
-            "name": "Ashley Kim",
-            "component": "Army Reserve",
-            "rank": "SGT / E-5",
-            "service_start": "2009-03-10",
-            "service_end": "2018-05-18",
-            "deployments": 0,
-            "offset": 1,
-            "jst_issue_date": "2025-01-09",
-            "secplus_issue_date": "2025-09-04",
-            "secplus_expiry": "2028-09-04",
-            "secplus_id": "COMP-SEC-4K2M-0083",
-            "jst_id": "JST-AK-4482020",
-            "dd214_number": "DD214-1120-AK-2009",
-            "dd214_file": "scan_ashley_kim_dd214_final.webp",
-            "jst_file": "JST_AKim_reserve_copy.pdf",
-            "secplus_file": "SecurityPlus_Certificate_AshleyKim_2025.pdf",
-            "target_program": "BS in Business Administration",
-            "career_goal": "Pivot into HR operations and compliance technology roles in a healthcare employer.",
-            "storyline": "Reserve service and recent IT certification create a mixed HR/IT profile that benefits from fast cross-walking.",
-        },
-        {
-            "name": "Darnell Turner",
-            "component": "Active Duty",
-            "rank": "SFC / E-7",
-            "service_start": "2004-01-12",
-            "service_end": "2016-02-01",
-            "deployments": 2,
-            "offset": -1,
-            "jst_issue_date": "2024-08-28",
-            "secplus_issue_date": "2024-12-10",
-            "secplus_expiry": "2027-12-10",
-            "secplus_id": "COMP-SEC-7D9T-5512",
-            "jst_id": "JST-DT-3319475",
-            "dd214_number": "DD214-5399-DT-2004",
-            "dd214_file": "phone-photo_dd214_turner.webp",
-            "jst_file": "Turner_Darnell_JST_unofficial.pdf",
-            "secplus_file": "comptia_security_plus_turner.pdf",
-            "target_program": "BS in Business Administration",
-            "career_goal": "Translate military personnel leadership into civilian HR management while keeping IT security credibility.",
-            "storyline": "Senior NCO HR specialist needs rapid review of ACE and certification credit to choose the best degree track.",
-        },
-        {
-            "name": "Brianna Patel",
-            "component": "National Guard",
-            "rank": "SSG / E-6",
-            "service_start": "2010-07-06",
-            "service_end": "2022-10-14",
-            "deployments": 1,
-            "offset": 2,
-            "jst_issue_date": "2025-03-03",
-            "secplus_issue_date": "2025-11-16",
-            "secplus_expiry": "2028-11-16",
-            "secplus_id": "COMP-SEC-2P7L-7644",
-            "jst_id": "JST-BP-9021547",
-            "dd214_number": "DD214-2886-BP-2010",
-            "dd214_file": "BPatel_DD214_scan.webp",
-            "jst_file": "JST_BriannaPatel_guard.pdf",
-            "secplus_file": "BriannaPatel_SecurityPlus_Credential.pdf",
-            "target_program": "BS in Information Technologies",
-            "career_goal": "Advance from administrative roles into IT governance and systems security support.",
-            "storyline": "Guard HR specialist completed Security+ and wants immediate visibility into transfer credit before enrolling.",
-        },
-    ]
-
-    scncs = [
-        {
-            "name": "Nicole Hernandez",
-            "hs_issuer": "Springfield Adult Learning Center",
-            "hs_signer": "L. McCarthy",
-            "hs_attestation_date": "2025-09-11",
-            "hs_file": "hs_attestation_signed_nhernandez.webp",
-            "cc_name": "Bunker Hill Community College",
-            "cc_student_id": "BH-00492177",
-            "cc_year_1": 2007,
-            "cc_year_2": 2008,
-            "cc_term_1_label": "Fall",
-            "cc_term_2_label": "Spring",
-            "psy_grade": "B+",
-            "eng_grade": "B",
-            "alg_grade": "C+",
-            "cis_grade": "A-",
-            "cc_gpa": 3.11,
-            "cc_issue_date": "2025-10-02",
-            "cc_file": "scan0001_BHCC_transcript_2008.webp",
-            "sophia_issue_date": "2025-12-06",
-            "sophia_file": "SophiaLearning-Transcript-NH-2025.pdf",
-            "google_issue_date": "2025-11-21",
-            "google_cred_id": "GPM-NH-8452-2025",
-            "google_file": "Google_Project_Management_Certificate_Nicole_Hernandez.pdf",
-            "career_goal": "Move from office coordinator work into operations/project management with a bachelor's pathway.",
-            "storyline": "Classic SCNC profile: old community college credits, new online upskilling, and a high-value Google PM certificate.",
-        },
-        {
-            "name": "Brandon ONeal",
-            "hs_issuer": "Metro Regional Adult Education Program",
-            "hs_signer": "T. Alvarez",
-            "hs_attestation_date": "2025-08-19",
-            "hs_file": "attestation_form_boneal_scan.webp",
-            "cc_name": "Middlesex Community College",
-            "cc_student_id": "MX-7712043",
-            "cc_year_1": 2004,
-            "cc_year_2": 2005,
-            "cc_term_1_label": "Fall",
-            "cc_term_2_label": "Spring",
-            "psy_grade": "A-",
-            "eng_grade": "B-",
-            "alg_grade": "B",
-            "cis_grade": "B+",
-            "cc_gpa": 3.22,
-            "cc_issue_date": "2025-09-30",
-            "cc_file": "mcc_old_transcript_copy_2005.webp",
-            "sophia_issue_date": "2025-11-27",
-            "sophia_file": "BrandonONeal_Sophia_Transcript.pdf",
-            "google_issue_date": "2025-10-18",
-            "google_cred_id": "GPM-BO-1922-2025",
-            "google_file": "BrandonONeal_GooglePM_ProfCert.pdf",
-            "career_goal": "Grow from warehouse team lead to operations project coordinator in manufacturing.",
-            "storyline": "Has old credits and recent self-paced coursework but needs quick clarity on what still counts.",
-        },
-        {
-            "name": "Tasha Nguyen",
-            "hs_issuer": "North Shore Adult Diploma Office",
-            "hs_signer": "R. Patel",
-            "hs_attestation_date": "2025-07-08",
-            "hs_file": "HS_completion_attestation_tnguyen.webp",
-            "cc_name": "Northern Essex Community College",
-            "cc_student_id": "NE-229915",
-            "cc_year_1": 2002,
-            "cc_year_2": 2003,
-            "cc_term_1_label": "Spring",
-            "cc_term_2_label": "Fall",
-            "psy_grade": "B",
-            "eng_grade": "A-",
-            "alg_grade": "C",
-            "cis_grade": "B",
-            "cc_gpa": 2.94,
-            "cc_issue_date": "2025-09-04",
-            "cc_file": "NECC_transcript_scanned_03.webp",
-            "sophia_issue_date": "2025-10-29",
-            "sophia_file": "SophiaTranscript_TNguyen_102925.pdf",
-            "google_issue_date": "2025-12-01",
-            "google_cred_id": "GPM-TN-7710-2025",
-            "google_file": "GooglePMCert_TashaNguyen.pdf",
-            "career_goal": "Transition from customer service supervision to project operations and process improvement.",
-            "storyline": "Long gap since community college makes the AI transcript read/normalize capability especially compelling.",
-        },
-        {
-            "name": "Kevin Morales",
-            "hs_issuer": "City Schools Records Verification Office",
-            "hs_signer": "J. Bennett",
-            "hs_attestation_date": "2025-10-03",
-            "hs_file": "kmorales_hs_attestation_scan.webp",
-            "cc_name": "Quinsigamond Community College",
-            "cc_student_id": "QCC-518884",
-            "cc_year_1": 2009,
-            "cc_year_2": 2010,
-            "cc_term_1_label": "Fall",
-            "cc_term_2_label": "Spring",
-            "psy_grade": "A",
-            "eng_grade": "B+",
-            "alg_grade": "B-",
-            "cis_grade": "A-",
-            "cc_gpa": 3.45,
-            "cc_issue_date": "2025-11-14",
-            "cc_file": "qcc_transcript_2010_scan-copy.webp",
-            "sophia_issue_date": "2025-12-19",
-            "sophia_file": "KMorales_Sophia_Learning_Transcript.pdf",
-            "google_issue_date": "2025-12-09",
-            "google_cred_id": "GPM-KM-3348-2025",
-            "google_file": "Google_Project_Mgmt_Certificate_KMorales.pdf",
-            "career_goal": "Advance from field service logistics to operations program management.",
-            "storyline": "Strong mix of older academic credits and modern credentialing for a dramatic credit-jump demo.",
-        },
-    ]
+VETERAN_PROFILES: list[dict[str, Any]] = [
+    {
+        "name": "Miguel Rivera",
+        "component": "Active Duty",
+        "rank": "SSG / E-6",
+        "service_start": "2006-08-15",
+        "service_end": "2014-09-30",
+        "deployments": 1,
+        "offset": 0,
+        "jst_issue_date": "2024-11-12",
+        "secplus_issue_date": "2025-06-21",
+        "secplus_expiry": "2028-06-21",
+        "secplus_id": "COMP-SEC-8A1R-1927",
+        "jst_id": "JST-AR-5729441",
+        "dd214_number": "DD214-8471-AR-2006",
+        "dd214_file": "IMG_1044_dd214_rivera.webp",
+        "jst_file": "JST_MRivera_2024-11-12.pdf",
+        "secplus_file": "CompTIA_SecurityPlus_Miguel_Rivera.pdf",
+        "target_program": "BS in Information Technologies",
+        "career_goal": "Move from Army HR operations into corporate HRIS and cybersecurity-aware IT support roles.",
+        "storyline": "Veteran with strong personnel records experience wants a business/IT degree path without losing military credit.",
+    },
+    {
+        "name": "Ashley Kim",
+        "component": "Army Reserve",
+        "rank": "SGT / E-5",
+        "service_start": "2009-03-10",
+        "service_end": "2018-05-18",
+        "deployments": 0,
+        "offset": 1,
+        "jst_issue_date": "2025-01-09",
+        "secplus_issue_date": "2025-09-04",
+        "secplus_expiry": "2028-09-04",
+        "secplus_id": "COMP-SEC-4K2M-0083",
+        "jst_id": "JST-AK-4482020",
+        "dd214_number": "DD214-1120-AK-2009",
+        "dd214_file": "scan_ashley_kim_dd214_final.webp",
+        "jst_file": "JST_AKim_reserve_copy.pdf",
+        "secplus_file": "SecurityPlus_Certificate_AshleyKim_2025.pdf",
+        "target_program": "BS in Business Administration",
+        "career_goal": "Pivot into HR operations and compliance technology roles in a healthcare employer.",
+        "storyline": "Reserve service and recent IT certification create a mixed HR/IT profile that benefits from fast cross-walking.",
+    },
+    {
+        "name": "Darnell Turner",
+        "component": "Active Duty",
+        "rank": "SFC / E-7",
+        "service_start": "2004-01-12",
+        "service_end": "2016-02-01",
+        "deployments": 2,
+        "offset": -1,
+        "jst_issue_date": "2024-08-28",
+        "secplus_issue_date": "2024-12-10",
+        "secplus_expiry": "2027-12-10",
+        "secplus_id": "COMP-SEC-7D9T-5512",
+        "jst_id": "JST-DT-3319475",
+        "dd214_number": "DD214-5399-DT-2004",
+        "dd214_file": "phone-photo_dd214_turner.webp",
+        "jst_file": "Turner_Darnell_JST_unofficial.pdf",
+        "secplus_file": "comptia_security_plus_turner.pdf",
+        "target_program": "BS in Business Administration",
+        "career_goal": "Translate military personnel leadership into civilian HR management while keeping IT security credibility.",
+        "storyline": "Senior NCO HR specialist needs rapid review of ACE and certification credit to choose the best degree track.",
+    },
+    {
+        "name": "Brianna Patel",
+        "component": "National Guard",
+        "rank": "SSG / E-6",
+        "service_start": "2010-07-06",
+        "service_end": "2022-10-14",
+        "deployments": 1,
+        "offset": 2,
+        "jst_issue_date": "2025-03-03",
+        "secplus_issue_date": "2025-11-16",
+        "secplus_expiry": "2028-11-16",
+        "secplus_id": "COMP-SEC-2P7L-7644",
+        "jst_id": "JST-BP-9021547",
+        "dd214_number": "DD214-2886-BP-2010",
+        "dd214_file": "BPatel_DD214_scan.webp",
+        "jst_file": "JST_BriannaPatel_guard.pdf",
+        "secplus_file": "BriannaPatel_SecurityPlus_Credential.pdf",
+        "target_program": "BS in Information Technologies",
+        "career_goal": "Advance from administrative roles into IT governance and systems security support.",
+        "storyline": "Guard HR specialist completed Security+ and wants immediate visibility into transfer credit before enrolling.",
+    },
+]
+
+SCNC_PROFILES: list[dict[str, Any]] = [
+    {
+        "name": "Nicole Hernandez",
+        "hs_issuer": "Springfield Adult Learning Center",
+        "hs_signer": "L. McCarthy",
+        "hs_attestation_date": "2025-09-11",
+        "hs_file": "hs_attestation_signed_nhernandez.webp",
+        "cc_name": "Bunker Hill Community College",
+        "cc_student_id": "BH-00492177",
+        "cc_year_1": 2007,
+        "cc_year_2": 2008,
+        "cc_term_1_label": "Fall",
+        "cc_term_2_label": "Spring",
+        "psy_grade": "B+",
+        "eng_grade": "B",
+        "alg_grade": "C+",
+        "cis_grade": "A-",
+        "cc_gpa": 3.11,
+        "cc_issue_date": "2025-10-02",
+        "cc_file": "scan0001_BHCC_transcript_2008.webp",
+        "sophia_issue_date": "2025-12-06",
+        "sophia_file": "SophiaLearning-Transcript-NH-2025.pdf",
+        "google_issue_date": "2025-11-21",
+        "google_cred_id": "GPM-NH-8452-2025",
+        "google_file": "Google_Project_Management_Certificate_Nicole_Hernandez.pdf",
+        "career_goal": "Move from office coordinator work into operations/project management with a bachelor's pathway.",
+        "storyline": "Classic SCNC profile: old community college credits, new online upskilling, and a high-value Google PM certificate.",
+    },
+    {
+        "name": "Brandon ONeal",
+        "hs_issuer": "Metro Regional Adult Education Program",
+        "hs_signer": "T. Alvarez",
+        "hs_attestation_date": "2025-08-19",
+        "hs_file": "attestation_form_boneal_scan.webp",
+        "cc_name": "Middlesex Community College",
+        "cc_student_id": "MX-7712043",
+        "cc_year_1": 2004,
+        "cc_year_2": 2005,
+        "cc_term_1_label": "Fall",
+        "cc_term_2_label": "Spring",
+        "psy_grade": "A-",
+        "eng_grade": "B-",
+        "alg_grade": "B",
+        "cis_grade": "B+",
+        "cc_gpa": 3.22,
+        "cc_issue_date": "2025-09-30",
+        "cc_file": "mcc_old_transcript_copy_2005.webp",
+        "sophia_issue_date": "2025-11-27",
+        "sophia_file": "BrandonONeal_Sophia_Transcript.pdf",
+        "google_issue_date": "2025-10-18",
+        "google_cred_id": "GPM-BO-1922-2025",
+        "google_file": "BrandonONeal_GooglePM_ProfCert.pdf",
+        "career_goal": "Grow from warehouse team lead to operations project coordinator in manufacturing.",
+        "storyline": "Has old credits and recent self-paced coursework but needs quick clarity on what still counts.",
+    },
+    {
+        "name": "Tasha Nguyen",
+        "hs_issuer": "North Shore Adult Diploma Office",
+        "hs_signer": "R. Patel",
+        "hs_attestation_date": "2025-07-08",
+        "hs_file": "HS_completion_attestation_tnguyen.webp",
+        "cc_name": "Northern Essex Community College",
+        "cc_student_id": "NE-229915",
+        "cc_year_1": 2002,
+        "cc_year_2": 2003,
+        "cc_term_1_label": "Spring",
+        "cc_term_2_label": "Fall",
+        "psy_grade": "B",
+        "eng_grade": "A-",
+        "alg_grade": "C",
+        "cis_grade": "B",
+        "cc_gpa": 2.94,
+        "cc_issue_date": "2025-09-04",
+        "cc_file": "NECC_transcript_scanned_03.webp",
+        "sophia_issue_date": "2025-10-29",
+        "sophia_file": "SophiaTranscript_TNguyen_102925.pdf",
+        "google_issue_date": "2025-12-01",
+        "google_cred_id": "GPM-TN-7710-2025",
+        "google_file": "GooglePMCert_TashaNguyen.pdf",
+        "career_goal": "Transition from customer service supervision to project operations and process improvement.",
+        "storyline": "Long gap since community college makes the AI transcript read/normalize capability especially compelling.",
+    },
+    {
+        "name": "Kevin Morales",
+        "hs_issuer": "City Schools Records Verification Office",
+        "hs_signer": "J. Bennett",
+        "hs_attestation_date": "2025-10-03",
+        "hs_file": "kmorales_hs_attestation_scan.webp",
+        "cc_name": "Quinsigamond Community College",
+        "cc_student_id": "QCC-518884",
+        "cc_year_1": 2009,
+        "cc_year_2": 2010,
+        "cc_term_1_label": "Fall",
+        "cc_term_2_label": "Spring",
+        "psy_grade": "A",
+        "eng_grade": "B+",
+        "alg_grade": "B-",
+        "cis_grade": "A-",
+        "cc_gpa": 3.45,
+        "cc_issue_date": "2025-11-14",
+        "cc_file": "qcc_transcript_2010_scan-copy.webp",
+        "sophia_issue_date": "2025-12-19",
+        "sophia_file": "KMorales_Sophia_Learning_Transcript.pdf",
+        "google_issue_date": "2025-12-09",
+        "google_cred_id": "GPM-KM-3348-2025",
+        "google_file": "Google_Project_Mgmt_Certificate_KMorales.pdf",
+        "career_goal": "Advance from field service logistics to operations program management.",
+        "storyline": "Strong mix of older academic credits and modern credentialing for a dramatic credit-jump demo.",
+    },
+]
+
+INTERNATIONAL_PROFILES: list[dict[str, Any]] = [
+    {
+        "name": "Priya Nair",
+        "agency": "WES",
+        "country": "India",
+        "institution": "University of Mumbai",
+        "credential": "Bachelor of Commerce",
+        "us_equivalency": "U.S. Bachelor's degree (4 years) in Business Administration",
+        "us_gpa": 3.18,
+        "report_date": "2025-11-05",
+        "ref_number": "WES-7349912",
+        "eval_file": "WES_CourseByCourse_PriyaNair.pdf",
+        "eval_credits": 90.0,
+        "evaluated_courses": [
+            course("WES-EVAL-ACC", "Financial Accounting", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
+            course("WES-EVAL-MKT", "Principles of Marketing", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
+            course("WES-EVAL-MGMT", "Principles of Management", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
+            course("WES-EVAL-ECON", "Microeconomics", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
+        ],
+        "eval_mapping_hints": [
+            mapping("WES course equivalency: Financial Accounting", "ACC-201", "Financial Accounting", 3.0, "Evaluator identifies equivalent lower-division accounting coursework."),
+            mapping("WES course equivalency: Principles of Management", "BUS-210", "Managing and Leading in Business", 3.0, "Management fundamentals align to business core outcomes."),
+        ],
+        "toefl_date": "2025-09-17",
+        "toefl_registration": "ETS-IBT-99150012",
+        "toefl_breakdown": {"Reading": 26, "Listening": 24, "Speaking": 23, "Writing": 25},
+        "toefl_total": 98,
+        "toefl_file": "TOEFL_iBT_PriyaNair_2025.pdf",
+        "target_program": "BS in Business Administration",
+        "proposed_transfer_total": 60.0,
+        "career_goal": "Move into U.S.-based operations and finance management after relocating.",
+        "storyline": "International applicant needs simultaneous credential evaluation ingestion and English proficiency verification.",
+    },
+    {
+        "name": "Wei Chen",
+        "agency": "ECE",
+        "country": "China",
+        "institution": "Shanghai Open University",
+        "credential": "Associate Degree in Information Technology",
+        "us_equivalency": "U.S. Associate degree in Information Technology",
+        "us_gpa": 3.01,
+        "report_date": "2025-10-21",
+        "ref_number": "ECE-8821045",
+        "eval_file": "ECE_Evaluation_WeiChen_course_by_course.pdf",
+        "eval_credits": 63.0,
+        "evaluated_courses": [
+            course("ECE-EVAL-PROG", "Programming Fundamentals", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
+            course("ECE-EVAL-NET", "Computer Networking", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
+            course("ECE-EVAL-DB", "Database Concepts", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
+            course("ECE-EVAL-MATH", "Discrete Mathematics", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
+        ],
+        "eval_mapping_hints": [
+            mapping("ECE evaluated course: Computer Networking", "IT-212", "Introduction to Computer Networks", 3.0, "Evaluator course equivalency aligns with lower-division networking outcomes."),
+            mapping("ECE evaluated course: Database Concepts", "IT-235", "Database Design", 3.0, "Database fundamentals are suitable for transfer articulation review."),
+        ],
+        "toefl_date": "2025-08-28",
+        "toefl_registration": "ETS-IBT-99200418",
+        "toefl_breakdown": {"Reading": 23, "Listening": 22, "Speaking": 21, "Writing": 24},
+        "toefl_total": 90,
+        "toefl_file": "TOEFL_WeiChen_official_score_report.pdf",
+        "target_program": "BS in Information Technologies",
+        "proposed_transfer_total": 45.0,
+        "career_goal": "Complete a U.S. IT bachelor's while working in technical support.",
+        "storyline": "ECE report plus TOEFL lets the AI intake both transfer and language documentation in one pass.",
+    },
+    {
+        "name": "Maria Lopes",
+        "agency": "WES",
+        "country": "Brazil",
+        "institution": "Universidade Paulista",
+        "credential": "Tecnologo em Logistica",
+        "us_equivalency": "U.S. Associate degree in Logistics / Operations",
+        "us_gpa": 3.34,
+        "report_date": "2025-12-02",
+        "ref_number": "WES-7411228",
+        "eval_file": "WES_MariaLopes_CourseByCourse_Report.pdf",
+        "eval_credits": 66.0,
+        "evaluated_courses": [
+            course("WES-EVAL-LOG", "Logistics Management", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
+            course("WES-EVAL-SCM", "Supply Chain Fundamentals", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
+            course("WES-EVAL-QM", "Quality Management", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
+            course("WES-EVAL-STATS", "Business Statistics", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
+        ],
+        "eval_mapping_hints": [
+            mapping("WES evaluated course: Logistics Management", "QSO-330", "Logistics Management", 3.0, "Evaluator's translated course content matches logistics management competencies."),
+            mapping("WES evaluated course: Business Statistics", "QSO/STAT-ELEC", "Business Statistics elective", 3.0, "Transferable quantitative business/statistics content."),
+        ],
+        "toefl_date": "2025-09-29",
+        "toefl_registration": "ETS-IBT-99087165",
+        "toefl_breakdown": {"Reading": 24, "Listening": 23, "Speaking": 24, "Writing": 23},
+        "toefl_total": 94,
+        "toefl_file": "TOEFL_MariaLopes_ETS_Report.pdf",
+        "target_program": "BS in Operations Management",
+        "proposed_transfer_total": 48.0,
+        "career_goal": "Advance into supply chain and operations leadership in a U.S. employer.",
+        "storyline": "International transfer into operations management with evaluator report and TOEFL ready for same-day review.",
+    },
+    {
+        "name": "Samuel Ofori",
+        "agency": "ECE",
+        "country": "Ghana",
+        "institution": "Kumasi Technical University",
+        "credential": "Higher National Diploma in Business Studies",
+        "us_equivalency": "U.S. Associate degree in Business",
+        "us_gpa": 2.92,
+        "report_date": "2025-10-07",
+        "ref_number": "ECE-8793310",
+        "eval_file": "ECE_SamuelOfori_Credential_Evaluation.pdf",
+        "eval_credits": 60.0,
+        "evaluated_courses": [
+            course("ECE-EVAL-BUSCOM", "Business Communication", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
+            course("ECE-EVAL-MGMT", "Management Principles", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
+            course("ECE-EVAL-ACC", "Accounting Principles", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
+            course("ECE-EVAL-MKT", "Marketing Principles", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
+        ],
+        "eval_mapping_hints": [
+            mapping("ECE evaluated course: Management Principles", "BUS-210", "Managing and Leading in Business", 3.0, "Foundational management content transfers to business core review."),
+            mapping("ECE evaluated course: Business Communication", "BUS-COMM-ELEC", "Business Communication elective", 3.0, "Communication content is directly relevant to business communication requirements."),
+        ],
+        "toefl_date": "2025-08-14",
+        "toefl_registration": "ETS-IBT-99311804",
+        "toefl_breakdown": {"Reading": 21, "Listening": 23, "Speaking": 22, "Writing": 21},
+        "toefl_total": 87,
+        "toefl_file": "SamuelOfori_TOEFL_iBT_ScoreReport.pdf",
+        "target_program": "BS in Business Administration",
+        "proposed_transfer_total": 42.0,
+        "career_goal": "Complete a bachelor's in business while continuing full-time employment.",
+        "storyline": "International adult learner needs rapid clarity on how prior HND coursework converts into a U.S. degree pathway.",
+    },
+]
 
-    intl = [
-        {
-            "name": "Priya Nair",
-            "agency": "WES",
-            "country": "India",
-            "institution": "University of Mumbai",
-            "credential": "Bachelor of Commerce",
-            "us_equivalency": "U.S. Bachelor's degree (4 years) in Business Administration",
-            "us_gpa": 3.18,
-            "report_date": "2025-11-05",
-            "ref_number": "WES-7349912",
-            "eval_file": "WES_CourseByCourse_PriyaNair.pdf",
-            "eval_credits": 90.0,
-            "evaluated_courses": [
-                course("WES-EVAL-ACC", "Financial Accounting", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
-                course("WES-EVAL-MKT", "Principles of Marketing", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
-                course("WES-EVAL-MGMT", "Principles of Management", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
-                course("WES-EVAL-ECON", "Microeconomics", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
-            ],
-            "eval_mapping_hints": [
-                mapping("WES course equivalency: Financial Accounting", "ACC-201", "Financial Accounting", 3.0, "Evaluator identifies equivalent lower-division accounting coursework."),
-                mapping("WES course equivalency: Principles of Management", "BUS-210", "Managing and Leading in Business", 3.0, "Management fundamentals align to business core outcomes."),
-            ],
-            "toefl_date": "2025-09-17",
-            "toefl_registration": "ETS-IBT-99150012",
-            "toefl_breakdown": {"Reading": 26, "Listening": 24, "Speaking": 23, "Writing": 25},
-            "toefl_total": 98,
-            "toefl_file": "TOEFL_iBT_PriyaNair_2025.pdf",
-            "target_program": "BS in Business Administration",
-            "proposed_transfer_total": 60.0,
-            "career_goal": "Move into U.S.-based operations and finance management after relocating.",
-            "storyline": "International applicant needs simultaneous credential evaluation ingestion and English proficiency verification.",
-        },
-        {
-            "name": "Wei Chen",
-            "agency": "ECE",
-            "country": "China",
-            "institution": "Shanghai Open University",
-            "credential": "Associate Degree in Information Technology",
-            "us_equivalency": "U.S. Associate degree in Information Technology",
-            "us_gpa": 3.01,
-            "report_date": "2025-10-21",
-            "ref_number": "ECE-8821045",
-            "eval_file": "ECE_Evaluation_WeiChen_course_by_course.pdf",
-            "eval_credits": 63.0,
-            "evaluated_courses": [
-                course("ECE-EVAL-PROG", "Programming Fundamentals", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
-                course("ECE-EVAL-NET", "Computer Networking", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
-                course("ECE-EVAL-DB", "Database Concepts", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
-                course("ECE-EVAL-MATH", "Discrete Mathematics", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
-            ],
-            "eval_mapping_hints": [
-                mapping("ECE evaluated course: Computer Networking", "IT-212", "Introduction to Computer Networks", 3.0, "Evaluator course equivalency aligns with lower-division networking outcomes."),
-                mapping("ECE evaluated course: Database Concepts", "IT-235", "Database Design", 3.0, "Database fundamentals are suitable for transfer articulation review."),
-            ],
-            "toefl_date": "2025-08-28",
-            "toefl_registration": "ETS-IBT-99200418",
-            "toefl_breakdown": {"Reading": 23, "Listening": 22, "Speaking": 21, "Writing": 24},
-            "toefl_total": 90,
-            "toefl_file": "TOEFL_WeiChen_official_score_report.pdf",
-            "target_program": "BS in Information Technologies",
-            "proposed_transfer_total": 45.0,
-            "career_goal": "Complete a U.S. IT bachelor's while working in technical support.",
-            "storyline": "ECE report plus TOEFL lets the AI intake both transfer and language documentation in one pass.",
-        },
-        {
-            "name": "Maria Lopes",
-            "agency": "WES",
-            "country": "Brazil",
-            "institution": "Universidade Paulista",
-            "credential": "Tecnologo em Logistica",
-            "us_equivalency": "U.S. Associate degree in Logistics / Operations",
-            "us_gpa": 3.34,
-            "report_date": "2025-12-02",
-            "ref_number": "WES-7411228",
-            "eval_file": "WES_MariaLopes_CourseByCourse_Report.pdf",
-            "eval_credits": 66.0,
-            "evaluated_courses": [
-                course("WES-EVAL-LOG", "Logistics Management", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
-                course("WES-EVAL-SCM", "Supply Chain Fundamentals", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
-                course("WES-EVAL-QM", "Quality Management", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
-                course("WES-EVAL-STATS", "Business Statistics", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="WES"),
-            ],
-            "eval_mapping_hints": [
-                mapping("WES evaluated course: Logistics Management", "QSO-330", "Logistics Management", 3.0, "Evaluator's translated course content matches logistics management competencies."),
-                mapping("WES evaluated course: Business Statistics", "QSO/STAT-ELEC", "Business Statistics elective", 3.0, "Transferable quantitative business/statistics content."),
-            ],
-            "toefl_date": "2025-09-29",
-            "toefl_registration": "ETS-IBT-99087165",
-            "toefl_breakdown": {"Reading": 24, "Listening": 23, "Speaking": 24, "Writing": 23},
-            "toefl_total": 94,
-            "toefl_file": "TOEFL_MariaLopes_ETS_Report.pdf",
-            "target_program": "BS in Operations Management",
-            "proposed_transfer_total": 48.0,
-            "career_goal": "Advance into supply chain and operations leadership in a U.S. employer.",
-            "storyline": "International transfer into operations management with evaluator report and TOEFL ready for same-day review.",
-        },
-        {
-            "name": "Samuel Ofori",
-            "agency": "ECE",
-            "country": "Ghana",
-            "institution": "Kumasi Technical University",
-            "credential": "Higher National Diploma in Business Studies",
-            "us_equivalency": "U.S. Associate degree in Business",
-            "us_gpa": 2.92,
-            "report_date": "2025-10-07",
-            "ref_number": "ECE-8793310",
-            "eval_file": "ECE_SamuelOfori_Credential_Evaluation.pdf",
-            "eval_credits": 60.0,
-            "evaluated_courses": [
-                course("ECE-EVAL-BUSCOM", "Business Communication", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
-                course("ECE-EVAL-MGMT", "Management Principles", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
-                course("ECE-EVAL-ACC", "Accounting Principles", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
-                course("ECE-EVAL-MKT", "Marketing Principles", "Evaluated", 2025, 3.0, None, status="Evaluated", source_system="ECE"),
-            ],
-            "eval_mapping_hints": [
-                mapping("ECE evaluated course: Management Principles", "BUS-210", "Managing and Leading in Business", 3.0, "Foundational management content transfers to business core review."),
-                mapping("ECE evaluated course: Business Communication", "BUS-COMM-ELEC", "Business Communication elective", 3.0, "Communication content is directly relevant to business communication requirements."),
-            ],
-            "toefl_date": "2025-08-14",
-            "toefl_registration": "ETS-IBT-99311804",
-            "toefl_breakdown": {"Reading": 21, "Listening": 23, "Speaking": 22, "Writing": 21},
-            "toefl_total": 87,
-            "toefl_file": "SamuelOfori_TOEFL_iBT_ScoreReport.pdf",
-            "target_program": "BS in Business Administration",
-            "proposed_transfer_total": 42.0,
-            "career_goal": "Complete a bachelor's in business while continuing full-time employment.",
-            "storyline": "International adult learner needs rapid clarity on how prior HND coursework converts into a U.S. degree pathway.",
-        },
-    ]
 
-    applicants: list[dict[str, Any]] = []
-    for i, profile in enumerate(veterans, start=1):
+def build_dataset() -> dict[str, Any]:
+    """Dataset header plus `applicants` as model objects; `bundle_model.as_json` gives the JSON form."""
+    applicants: list[Applicant] = []
+    for i, profile in enumerate(VETERAN_PROFILES, start=1):
         applicants.append(veteran_applicant(i, profile))
-    for i, profile in enumerate(scncs, start=5):
+    for i, profile in enumerate(SCNC_PROFILES, start=5):
         applicants.append(scnc_applicant(i, profile))
-    for i, profile in enumerate(intl, start=9):
+    for i, profile in enumerate(INTERNATIONAL_PROFILES, start=9):
         applicants.append(international_applicant(i, profile))
 
     return {
@@ -1558,22 +1571,22 @@ def swap_suffix(file_name: str, suffix: str) -> str:
     return str(Path(file_name).with_suffix(suffix))
 
 
-def get_doc(applicant: dict[str, Any], doc_type: str) -> dict[str, Any]:
-    for doc in applicant["Document_Bundle"]:
-        if doc["Document_Type"] == doc_type:
+def get_doc(applicant: Applicant, doc_type: str) -> Document:
+    for doc in applicant.documents:
+        if doc.document_type == doc_type:
             return doc
-    raise KeyError(f"Document type not found for {applicant['Applicant_ID']}: {doc_type}")
+    raise KeyError(f"Document type not found for {applicant.applicant_id}: {doc_type}")
 
 
-def ensure_notes(doc: dict[str, Any]) -> list[str]:
-    structured = doc["Structured_Content"]
+def ensure_notes(doc: Document) -> list[str]:
+    structured = doc.structured_content
     notes = structured.setdefault("notes", [])
     return notes
 
 
-def inferred_gemimg_prompt(doc: dict[str, Any]) -> str:
-    doc_type = doc["Document_Type"]
-    sc = doc["Structured_Content"]
+def inferred_gemimg_prompt(doc: Document) -> str:
+    doc_type = doc.document_type
+    sc = doc.structured_content
     student = sc.get("student_name", "adult learner")
     base_prompts = {
         "DD214": (
@@ -1620,8 +1633,8 @@ def inferred_gemimg_prompt(doc: dict[str, Any]) -> str:
         ),
     }
     prompt = base_prompts.get(doc_type, "Photorealistic scanned educational document with realistic office artifacts.")
-    vp = sc.get("visual_profile", {})
-    artifact = vp.get("artifact_level")
+    vp = sc.get("visual_profile")
+    artifact = vp.artifact_level if vp else None
     if artifact in {"medium", "heavy"}:
         prompt += " Include subtle copier dust, compression noise, and edge shadowing."
     if doc_type == "JST":
@@ -1632,27 +1645,27 @@ def inferred_gemimg_prompt(doc: dict[str, Any]) -> str:
 
 
 def set_doc_variant(
-    doc: dict[str, Any],
+    doc: Document,
     *,
     fmt: str,
     rendering: str,
     single_page_image: bool = False,
 ) -> None:
-    old_fmt = doc["Document_Format"]
-    doc["Document_Format"] = fmt
-    doc["Rendering_Method"] = rendering
-    doc["Output_File_Name"] = swap_suffix(doc["Output_File_Name"], f".{fmt}")
+    old_fmt = doc.document_format
+    doc.document_format = fmt
+    doc.rendering_method = rendering
+    doc.output_file_name = swap_suffix(doc.output_file_name, f".{fmt}")
 
     if fmt == "webp":
-        if single_page_image and doc.get("Page_Count", 1) != 1:
+        if single_page_image and doc.page_count != 1:
             notes = ensure_notes(doc)
             notes.append(
                 "Applicant uploaded a single image capture of this document (page 1 / summary page only); remaining pages may be requested."
             )
-            doc["Page_Count"] = 1
-        doc["Gemimg_Prompt"] = inferred_gemimg_prompt(doc)
+            doc.page_count = 1
+        doc.gemimg_prompt = inferred_gemimg_prompt(doc)
     else:
-        doc.pop("Gemimg_Prompt", None)
+        doc.gemimg_prompt = None
         if fmt == "txt":
             # Text dumps commonly collapse multi-page content into a single file export.
             if old_fmt != "txt":
@@ -1660,77 +1673,79 @@ def set_doc_variant(
                 notes.append("Content provided as a plain-text export file instead of scanned pages.")
 
 
+# (Document_Format, Rendering_Method, single_page_image) per applicant and document type.
+FORMAT_VARIANT_PLAN: dict[str, dict[str, tuple[str, str, bool]]] = {
+    # A: veteran bundles
+    "APPL-001": {
+        "DD214": ("webp", "gemimg_scan_webp", False),
+        "JST": ("txt", "raw_text_txt", False),
+        "CompTIA_SecurityPlus_Certificate": ("pdf", "pristine_pdf", False),
+    },
+    "APPL-002": {
+        "DD214": ("pdf", "scanned_pdf", False),
+        "JST": ("pdf", "raw_text_pdf", False),
+        "CompTIA_SecurityPlus_Certificate": ("webp", "gemimg_scan_webp", False),
+    },
+    "APPL-003": {
+        "DD214": ("webp", "gemimg_scan_webp", False),
+        "JST": ("webp", "gemimg_scan_webp", True),
+        "CompTIA_SecurityPlus_Certificate": ("webp", "gemimg_scan_webp", False),
+    },
+    "APPL-004": {
+        "DD214": ("pdf", "scanned_pdf", False),
+        "JST": ("pdf", "raw_text_pdf", False),
+        "CompTIA_SecurityPlus_Certificate": ("pdf", "pristine_pdf", False),
+    },
+    # B: SCNC bundles (4 docs each)
+    "APPL-005": {
+        "High_School_Attestation_Form": ("webp", "gemimg_scan_webp", False),
+        "Community_College_Transcript": ("webp", "gemimg_scan_webp", False),
+        "Sophia_Learning_Transcript": ("txt", "raw_text_txt", False),
+        "Google_Project_Management_Certificate": ("pdf", "pristine_pdf", False),
+    },
+    "APPL-006": {
+        "High_School_Attestation_Form": ("pdf", "scanned_pdf", False),
+        "Community_College_Transcript": ("pdf", "scanned_pdf", False),
+        "Sophia_Learning_Transcript": ("pdf", "raw_text_pdf", False),
+        "Google_Project_Management_Certificate": ("pdf", "pristine_pdf", False),
+    },
+    "APPL-007": {
+        "High_School_Attestation_Form": ("webp", "gemimg_scan_webp", False),
+        "Community_College_Transcript": ("webp", "gemimg_scan_webp", False),
+        "Sophia_Learning_Transcript": ("webp", "gemimg_scan_webp", True),
+        "Google_Project_Management_Certificate": ("webp", "gemimg_scan_webp", False),
+    },
+    "APPL-008": {
+        "High_School_Attestation_Form": ("webp", "gemimg_scan_webp", False),
+        "Community_College_Transcript": ("pdf", "scanned_pdf", False),
+        "Sophia_Learning_Transcript": ("txt", "raw_text_txt", False),
+        "Google_Project_Management_Certificate": ("webp", "gemimg_scan_webp", False),
+    },
+    # C: international bundles
+    "APPL-009": {
+        "WES_Course_By_Course_Evaluation": ("pdf", "pristine_pdf", False),
+        "TOEFL_Score_Report": ("pdf", "pristine_pdf", False),
+    },
+    "APPL-010": {
+        "ECE_Course_By_Course_Evaluation": ("pdf", "pristine_pdf", False),
+        "TOEFL_Score_Report": ("webp", "gemimg_scan_webp", False),
+    },
+    "APPL-011": {
+        "WES_Course_By_Course_Evaluation": ("pdf", "pristine_pdf", False),
+        "TOEFL_Score_Report": ("pdf", "pristine_pdf", False),
+    },
+    "APPL-012": {
+        "ECE_Course_By_Course_Evaluation": ("pdf", "pristine_pdf", False),
+        "TOEFL_Score_Report": ("webp", "gemimg_scan_webp", False),
+    },
+}
+
+
 def apply_realistic_format_mix(dataset: dict[str, Any]) -> dict[str, Any]:
     """Adjust document formats so bundles look like real user-submitted upload mixes."""
 
-    variant_plan: dict[str, dict[str, tuple[str, str, bool]]] = {
-        # A: veteran bundles
-        "APPL-001": {
-            "DD214": ("webp", "gemimg_scan_webp", False),
-            "JST": ("txt", "raw_text_txt", False),
-            "CompTIA_SecurityPlus_Certificate": ("pdf", "pristine_pdf", False),
-        },
-        "APPL-002": {
-            "DD214": ("pdf", "scanned_pdf", False),
-            "JST": ("pdf", "raw_text_pdf", False),
-            "CompTIA_SecurityPlus_Certificate": ("webp", "gemimg_scan_webp", False),
-        },
-        "APPL-003": {
-            "DD214": ("webp", "gemimg_scan_webp", False),
-            "JST": ("webp", "gemimg_scan_webp", True),
-            "CompTIA_SecurityPlus_Certificate": ("webp", "gemimg_scan_webp", False),
-        },
-        "APPL-004": {
-            "DD214": ("pdf", "scanned_pdf", False),
-            "JST": ("pdf", "raw_text_pdf", False),
-            "CompTIA_SecurityPlus_Certificate": ("pdf", "pristine_pdf", False),
-        },
-        # B: SCNC bundles (4 docs each)
-        "APPL-005": {
-            "High_School_Attestation_Form": ("webp", "gemimg_scan_webp", False),
-            "Community_College_Transcript": ("webp", "gemimg_scan_webp", False),
-            "Sophia_Learning_Transcript": ("txt", "raw_text_txt", False),
-            "Google_Project_Management_Certificate": ("pdf", "pristine_pdf", False),
-        },
-        "APPL-006": {
-            "High_School_Attestation_Form": ("pdf", "scanned_pdf", False),
-            "Community_College_Transcript": ("pdf", "scanned_pdf", False),
-            "Sophia_Learning_Transcript": ("pdf", "raw_text_pdf", False),
-            "Google_Project_Management_Certificate": ("pdf", "pristine_pdf", False),
-        },
-        "APPL-007": {
-            "High_School_Attestation_Form": ("webp", "gemimg_scan_webp", False),
-            "Community_College_Transcript": ("webp", "gemimg_scan_webp", False),
-            "Sophia_Learning_Transcript": ("webp", "gemimg_scan_webp", True),
-            "Google_Project_Management_Certificate": ("webp", "gemimg_scan_webp", False),
-        },
-        "APPL-008": {
-            "High_School_Attestation_Form": ("webp", "gemimg_scan_webp", False),
-            "Community_College_Transcript": ("pdf", "scanned_pdf", False),
-            "Sophia_Learning_Transcript": ("txt", "raw_text_txt", False),
-            "Google_Project_Management_Certificate": ("webp", "gemimg_scan_webp", False),
-        },
-        # C: international bundles
-        "APPL-009": {
-            "WES_Course_By_Course_Evaluation": ("pdf", "pristine_pdf", False),
-            "TOEFL_Score_Report": ("pdf", "pristine_pdf", False),
-        },
-        "APPL-010": {
-            "ECE_Course_By_Course_Evaluation": ("pdf", "pristine_pdf", False),
-            "TOEFL_Score_Report": ("webp", "gemimg_scan_webp", False),
-        },
-        "APPL-011": {
-            "WES_Course_By_Course_Evaluation": ("pdf", "pristine_pdf", False),
-            "TOEFL_Score_Report": ("pdf", "pristine_pdf", False),
-        },
-        "APPL-012": {
-            "ECE_Course_By_Course_Evaluation": ("pdf", "pristine_pdf", False),
-            "TOEFL_Score_Report": ("webp", "gemimg_scan_webp", False),
-        },
-    }
-
     for applicant in dataset["applicants"]:
-        plan = variant_plan.get(applicant["Applicant_ID"])
+        plan = FORMAT_VARIANT_PLAN.get(applicant.applicant_id)
         if not plan:
             continue
         for doc_type, (fmt, rendering, single_page_image) in plan.items():
@@ -1748,20 +1763,23 @@ def apply_realistic_format_mix(dataset: dict[str, Any]) -> dict[str, Any]:
 
 
 def write_json(path: Path, payload: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2, sort_keys=False) + "\n", encoding="utf-8")
-
-
-def validate(schema: dict[str, Any], data: dict[str, Any]) -> None:
-    Draft202012Validator(schema).validate(data)
+    """Write indented JSON; an `applicants` list is streamed item by item instead of dumped as one string."""
+    write_json_stream(path, payload)
 
 
 def main() -> None:
+    args = parse_args()
     schema = build_schema()
-    dataset = apply_realistic_format_mix(build_dataset())
-    validate(schema, dataset)
+    # Applicants are model objects up to here; validation, the writers and the catalog take plain JSON.
+    dataset = as_json(apply_realistic_format_mix(build_dataset()))
+    try:
+        validate_dataset(schema, dataset, jobs=args.jobs if args.jobs > 0 else (os.cpu_count() or 1))
+    except DatasetValidationError as exc:
+        raise SystemExit(f"Generated dataset does not match {SCHEMA_PATH.name}: {exc}") from None
     write_json(SCHEMA_PATH, schema)
-    write_json(DATA_PATH, dataset)
+    data_path = dataset_path(DATA_PATH, args.format)
+    header = {key: value for key, value in dataset.items() if key != "applicants"}
+    write_dataset_stream(data_path, header, dataset["applicants"], args.format, shard_size=args.shard_size)
 
     doc_count = sum(len(a["Document_Bundle"]) for a in dataset["applicants"])
     counts = {"A": 0, "B": 0, "C": 0}
@@ -1769,13 +1787,14 @@ def main() -> None:
         counts[applicant["Archetype_Code"]] += 1
 
     print(f"Wrote schema: {SCHEMA_PATH.relative_to(ROOT)}")
-    print(f"Wrote data:   {DATA_PATH.relative_to(ROOT)}")
+    print(f"Wrote data:   {data_path.relative_to(ROOT)} ({args.format})")
     print(
         "Applicants: "
         f"{len(dataset['applicants'])} total "
         f"(A={counts['A']}, B={counts['B']}, C={counts['C']}); "
         f"Documents: {doc_count}"
     )
+    update_catalog(None if args.no_catalog else args.catalog, header, dataset["applicants"], "credit", data_path)
 
 
 if __name__ == "__main__":
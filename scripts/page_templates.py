@@ -0,0 +1,96 @@
+"""LRU cache of pre-rendered static page chrome (paper, ruled grids, stamps, desk textures).
+
+Renderers ask for a template by name and layout parameters and get a private copy to draw the
+per-document text and artifacts on. Each template is built once per process; with a cache
+directory it is also persisted as an uncompressed `.npy` array so later runs and worker
+processes load it instead of redrawing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable
+
+import numpy as np
+from PIL import Image
+
+TEMPLATE_CACHE_SIZE = 32
+
+
+class TemplateCache:
+    def __init__(self, maxsize: int = TEMPLATE_CACHE_SIZE, root: Path | None = None) -> None:
+        self.maxsize = maxsize
+        self.root = root
+        self.images: OrderedDict[str, Image.Image] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    def configure(self, root: Path | None = None, maxsize: int = TEMPLATE_CACHE_SIZE) -> None:
+        """Set persistence and size; also used as a ProcessPoolExecutor initializer."""
+        self.root = root
+        self.maxsize = maxsize
+
+    @staticmethod
+    def key(name: str, params: tuple[Any, ...], version: str) -> str:
+        payload = json.dumps([name, params, version], separators=(",", ":"))
+        return f"{name}-{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]}"
+
+    def get(
+        self,
+        name: str,
+        params: tuple[Any, ...],
+        version: str,
+        build: Callable[[], Image.Image],
+    ) -> Image.Image:
+        """Return a copy of the template, building (or loading) it on first use."""
+        key = self.key(name, params, version)
+        img = self.images.get(key)
+        if img is not None:
+            self.hits += 1
+            self.images.move_to_end(key)
+            return img.copy()
+        self.misses += 1
+        img = self.load(key)
+        if img is None:
+            img = build()
+            self.save(key, img)
+        else:
+            self.disk_hits += 1
+        self.images[key] = img
+        while len(self.images) > self.maxsize:
+            self.images.popitem(last=False)
+        return img.copy()
+
+    def path(self, key: str) -> Path | None:
+        return self.root / f"{key}.npy" if self.root else None
+
+    def load(self, key: str) -> Image.Image | None:
+        path = self.path(key)
+        if path is None or not path.exists():
+            return None
+        return Image.fromarray(np.load(path))
+
+    def save(self, key: str, img: Image.Image) -> None:
+        path = self.path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp-{os.getpid()}.npy")
+        np.save(tmp, np.asarray(img))
+        os.replace(tmp, path)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "cached_templates": len(self.images),
+        }
+
+
+TEMPLATES = TemplateCache()
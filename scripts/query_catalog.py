@@ -0,0 +1,151 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# ///
+
+"""Query (and load) the SQLite catalog of datasets and render results (scripts/catalog.py).
+
+The generators keep the catalog current; `load` adds any other dataset file, e.g. a bulk NDJSON
+or shard directory from generate_bulk_bundles.py, or refreshes one edited by hand:
+
+  query_catalog.py load credit-checking/data/bulk/applicants_10000.ndjson
+  query_catalog.py summary
+  query_catalog.py gemimg-fallbacks
+  query_catalog.py scores --test TOEFL --section Total --below 90
+  query_catalog.py sql "SELECT intent, count(*) FROM chat_turns GROUP BY intent"
+
+Canned queries and `sql` open the catalog read-only; `--json` prints one JSON object per row.
+Options such as --catalog, --json and --limit go after the command name.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from catalog import CATALOG_PATH, SOURCES, Catalog
+from dataset_stream import open_dataset
+
+REPORTS = {
+    "summary": (
+        "Records per dataset and source",
+        "SELECT source, dataset_id, record_count, generated_on, updated_at, path FROM datasets ORDER BY source, dataset_id",
+    ),
+    "render-status": (
+        "Documents per render status and engine",
+        "SELECT dataset_id, rendering_method, engine, status, count(*) AS documents FROM render_results "
+        "GROUP BY dataset_id, rendering_method, engine, status ORDER BY dataset_id, rendering_method, status",
+    ),
+    "gemimg-fallbacks": (
+        "gemimg WEBP scans that fell back to the local renderer",
+        "SELECT dataset_id, applicant_id, document_id, document_type, engine, status, output_file FROM render_results "
+        "WHERE rendering_method = 'gemimg_scan_webp' AND status != 'ok' ORDER BY dataset_id, document_id",
+    ),
+    "escalations": (
+        "Financial-aid conversations handed to a person",
+        "SELECT dataset_id, applicant_id, full_name, outcome_status, final_owner, completion_percent FROM fa_applicants "
+        "WHERE outcome_status LIKE 'escalated%' ORDER BY dataset_id, applicant_id",
+    ),
+}
+
+
+def parse_args() -> argparse.Namespace:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--catalog", type=Path, default=CATALOG_PATH)
+    common.add_argument("--json", action="store_true", help="Print rows as JSON lines instead of a table.")
+    common.add_argument("--limit", type=int, default=200, help="Rows to print (0 = all).")
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    load = commands.add_parser(
+        "load", parents=[common], help="Load or refresh dataset files (json, ndjson or shard directory)."
+    )
+    load.add_argument("paths", type=Path, nargs="+")
+    load.add_argument("--source", choices=sorted(SOURCES), help="Record kind; detected from the first record by default.")
+
+    for name, (description, _) in REPORTS.items():
+        commands.add_parser(name, parents=[common], help=description)
+
+    scores = commands.add_parser("scores", parents=[common], help="Test scores filtered by test, section and range.")
+    scores.add_argument("--test", default="", help="Start of the test name (case-sensitive), e.g. TOEFL.")
+    scores.add_argument("--section", default="", help="Exact section name, e.g. Total.")
+    scores.add_argument("--below", type=float, help="Only scores strictly below this value.")
+    scores.add_argument("--at-least", type=float, help="Only scores at or above this value.")
+
+    sql = commands.add_parser("sql", parents=[common], help="Run a read-only SQL query.")
+    sql.add_argument("query")
+    sql.add_argument("params", nargs="*", help="Values for ? placeholders.")
+    return parser.parse_args()
+
+
+def scores_query(args: argparse.Namespace) -> tuple[str, list[Any]]:
+    # A GLOB prefix (unlike LIKE '%...%') can use the (test_name, section, score) index.
+    clauses, params = ["test_name GLOB ?"], [f"{args.test}*"]
+    if args.section:
+        clauses.append("section = ?")
+        params.append(args.section)
+    if args.below is not None:
+        clauses.append("score < ?")
+        params.append(args.below)
+    if args.at_least is not None:
+        clauses.append("score >= ?")
+        params.append(args.at_least)
+    sql = (
+        "SELECT s.dataset_id, s.applicant_id, a.full_name, s.test_name, s.section, s.score, s.scale, s.test_date "
+        "FROM scores s LEFT JOIN applicants a USING (dataset_id, applicant_id) "
+        f"WHERE {' AND '.join(clauses)} ORDER BY s.dataset_id, s.score, s.applicant_id"
+    )
+    return sql, params
+
+
+def print_rows(columns: list[str], rows: list[tuple[Any, ...]], as_json: bool, limit: int) -> None:
+    shown = rows[:limit] if limit > 0 else rows
+    if as_json:
+        for row in shown:
+            print(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+        return
+    text = [[("" if value is None else str(value)) for value in row] for row in shown]
+    widths = [min(64, max([len(column), *(len(row[i]) for row in text)])) for i, column in enumerate(columns)]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)).rstrip())
+    print("  ".join("-" * width for width in widths))
+    for row in text:
+        print("  ".join(value[:width].ljust(width) for value, width in zip(row, widths)).rstrip())
+    more = f" (showing {len(shown)}; --limit 0 for all)" if len(shown) < len(rows) else ""
+    print(f"{len(rows)} row(s){more}")
+
+
+def load(args: argparse.Namespace) -> None:
+    with Catalog(args.catalog) as catalog:
+        for path in args.paths:
+            started = time.perf_counter()
+            header, records = open_dataset(path)
+            header.setdefault("dataset_id", path.stem)
+            stats = catalog.update(header, records, args.source, path.resolve())
+            print(f"{path}: {stats.summary()} in {time.perf_counter() - started:.1f}s")
+
+
+def main() -> None:
+    args = parse_args()
+    if args.command == "load":
+        load(args)
+        return
+    if args.command == "scores":
+        sql, params = scores_query(args)
+    elif args.command == "sql":
+        sql, params = args.query, args.params
+    else:
+        sql, params = REPORTS[args.command][1], []
+    try:
+        with Catalog(args.catalog, readonly=True) as catalog:
+            columns, rows = catalog.query(sql, params)
+    except (FileNotFoundError, sqlite3.Error) as exc:
+        raise SystemExit(str(exc)) from None
+    print_rows(columns, rows, args.json, args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Content-addressed cache for rendered demo artifacts, shared by the rendering scripts."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+CACHE_DIR = ROOT / ".cache" / "render"
+
+
+def cache_key(doc: dict[str, Any], method: str, seed: int | None, renderer_version: str) -> str:
+    payload = json.dumps(
+        {"doc": doc, "method": method, "seed": seed, "renderer_version": renderer_version},
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def link_or_copy(src: Path, dst: Path) -> None:
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(f".{dst.name}.tmp-{os.getpid()}")
+    tmp.unlink(missing_ok=True)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+
+@dataclass(frozen=True)
+class RenderCache:
+    """Artifacts live at `<root>/<key[:2]>/<key><suffix>` next to a `<key>.json` copy of the render metadata.
+
+    Secondary outputs of the same render (e.g. thumbnails) are stored as `<key>.<n><suffix>`.
+
+    Hits are hard-linked into place (or copied across filesystems). Renderers always write a
+    fresh inode because misses unlink the output first, so linked cache entries are never
+    modified through the output path.
+    """
+
+    root: Path = CACHE_DIR
+    enabled: bool = True
+
+    def entry(self, key: str, suffix: str) -> tuple[Path, Path]:
+        folder = self.root / key[:2]
+        return folder / f"{key}{suffix}", folder / f"{key}.json"
+
+    def extra_entries(self, key: str, extras: Sequence[Path]) -> list[Path]:
+        return [self.entry(f"{key}.{i}", path.suffix)[0] for i, path in enumerate(extras)]
+
+    def fetch(self, key: str, out_path: Path, extras: Sequence[Path] = ()) -> dict[str, Any] | None:
+        artifact, meta_path = self.entry(key, out_path.suffix)
+        extra_artifacts = self.extra_entries(key, extras)
+        if not all(path.exists() for path in [artifact, meta_path, *extra_artifacts]):
+            return None
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        for src, dst in zip([artifact, *extra_artifacts], [out_path, *extras]):
+            if not (dst.exists() and os.path.samefile(src, dst)):
+                link_or_copy(src, dst)
+        return meta
+
+    def store(self, key: str, out_path: Path, meta: dict[str, Any], extras: Sequence[Path] = ()) -> None:
+        artifact, meta_path = self.entry(key, out_path.suffix)
+        link_or_copy(out_path, artifact)
+        for src, dst in zip(extras, self.extra_entries(key, extras)):
+            link_or_copy(src, dst)
+        tmp = meta_path.with_name(f".{meta_path.name}.tmp-{os.getpid()}")
+        tmp.write_text(json.dumps(meta, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp, meta_path)
+
+
+def cached_render(
+    cache: RenderCache | None,
+    key: str,
+    out_path: Path,
+    render: Callable[[], dict[str, Any]],
+    extras: Sequence[Path] = (),
+) -> dict[str, Any]:
+    """Return render metadata tagged with `cache` = hit/miss/off, rendering only on a miss.
+
+    `extras` are secondary files the same render writes; a hit restores them too. Only results
+    with status "ok" and every output present are stored, so fallbacks are retried next run.
+    """
+    if cache is None or not cache.enabled:
+        return {**render(), "cache": "off"}
+    meta = cache.fetch(key, out_path, extras)
+    if meta is not None:
+        return {**meta, "cache": "hit"}
+    for path in [out_path, *extras]:
+        path.unlink(missing_ok=True)
+    meta = render()
+    if meta.get("status") == "ok" and all(path.exists() for path in [out_path, *extras]):
+        cache.store(key, out_path, meta, extras)
+    return {**meta, "cache": "miss"}
+
+
+def tally(counts: dict[str, int], meta: dict[str, Any]) -> None:
+    outcome = {"hit": "hits", "miss": "misses"}.get(str(meta.get("cache")))
+    if outcome:
+        counts[outcome] = counts.get(outcome, 0) + 1
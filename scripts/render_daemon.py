@@ -0,0 +1,271 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["numpy>=1.26", "pillow>=10.4.0", "reportlab>=4.2.0"]
+# ///
+
+"""Long-lived render process that keeps fonts, glyph metrics, page templates and document IRs warm.
+
+Every renderer CLI run pays for interpreter start-up, module imports, font loading and template
+drawing before its first document. The daemon pays that once: it renders one fixture document per
+credit Rendering_Method and financial-aid render_template at start-up, then serves render jobs
+from the same (or pooled, with --jobs) processes for as long as it runs.
+
+Protocol (JSON lines, over a Unix socket or, with --stdio, stdin/stdout):
+
+  {"op": "ping"}                       -> {"ok": true, "pid": ..., "uptime_sec": ..., "jobs_served": ...}
+  {"op": "stats"}                      -> font, glyph metric, template and IR cache counters
+  {"op": "render", "jobs": [job, ...]} -> one {"ok": true, "index": i, "meta": {...}} line per job, in order
+                                          ({"ok": false, "index": i, "error": "..."} when job i fails)
+  {"op": "shutdown"}                   -> {"ok": true}, then the daemon exits
+
+Jobs are built by `task_payload` (render_synthetic_documents.py, kind "credit") and `job_payload`
+(generate_financial_aid_demo_data.py, kind "financial_aid") and carry the caller's render settings,
+so output is byte-identical to rendering in the CLI itself. Both CLIs delegate with `--daemon`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterator, TextIO
+
+import generate_financial_aid_demo_data as fa
+import render_synthetic_documents as credit
+from daemon_client import DEFAULT_SOCKET
+from document_ir import IR_CACHE
+from font_registry import REGISTRY as FONT_REGISTRY
+from page_templates import TEMPLATES
+from text_layout import METRICS
+
+JOB_RUNNERS: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    "credit": credit.run_job,
+    "financial_aid": fa.run_job,
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--socket", type=Path, default=DEFAULT_SOCKET, help="Unix socket to listen on.")
+    parser.add_argument(
+        "--stdio",
+        action="store_true",
+        help="Serve one JSON-lines session on stdin/stdout instead of a socket (logs go to stderr).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Warm worker processes for render jobs (0 = one per CPU); 1 renders in the daemon process.",
+    )
+    parser.add_argument("--input", type=Path, default=credit.DATA_PATH, help="Credit bundle manifest for warm-up fixtures.")
+    parser.add_argument("--no-warm", action="store_true", help="Skip the start-up fixture renders.")
+    return parser.parse_args()
+
+
+def log(message: str) -> None:
+    print(f"[render-daemon {os.getpid()}] {message}", file=sys.stderr, flush=True)
+
+
+def warm_fixtures(credit_input: Path) -> list[tuple[str, Callable[[Path], Any], str]]:
+    """One (name, render, suffix) per credit Rendering_Method and financial-aid render_template."""
+    fixtures: list[tuple[str, Callable[[Path], Any], str]] = []
+    if credit_input.exists():
+        seen: dict[str, dict[str, Any]] = {}
+        for applicant in credit.load_json(credit_input)["applicants"]:
+            for doc in applicant["Document_Bundle"]:
+                seen.setdefault(doc["Rendering_Method"], doc)
+        for method, doc in sorted(seen.items()):
+
+            def render(out_path: Path, doc: dict[str, Any] = doc) -> Any:
+                rng = credit.document_rng(42, doc["Document_ID"])
+                return credit.render_document(doc, out_path, rng, webp_backend="local", gemimg_timeout_sec=0)
+
+            fixtures.append((f"credit:{method}", render, Path(doc["Output_File_Name"]).suffix))
+    templates: dict[str, dict[str, Any]] = {}
+    for applicant in fa.build_applicants():
+        for doc in applicant["document_bundle"]:
+            templates.setdefault(doc["render_template"], doc)
+    for template, doc in sorted(templates.items()):
+
+        def render(out_path: Path, doc: dict[str, Any] = doc) -> Any:
+            return fa.render_document(doc, out_path)
+
+        fixtures.append((f"fa:{template}", render, Path(doc["file_name"]).suffix))
+    return fixtures
+
+
+def warm_up(credit_input: Path) -> None:
+    """Render every fixture once into a scratch directory so fonts, templates and metrics are loaded."""
+    started = time.perf_counter()
+    fixtures = warm_fixtures(credit_input)
+    with tempfile.TemporaryDirectory(prefix="render-daemon-") as scratch:
+        for name, render, suffix in fixtures:
+            render(Path(scratch) / f"{name.replace(':', '_')}{suffix}")
+    log(f"warmed {len(fixtures)} renderers in {time.perf_counter() - started:.1f}s")
+
+
+def run_job(job: dict[str, Any]) -> dict[str, Any]:
+    runner = JOB_RUNNERS.get(job.get("kind", ""))
+    if runner is None:
+        raise ValueError(f"unknown job kind {job.get('kind')!r}")
+    return runner(job)
+
+
+def error_text(exc: BaseException) -> str:
+    return f"{type(exc).__name__}: {exc}"
+
+
+class RenderDaemon:
+    def __init__(self, jobs: int, credit_input: Path, warm: bool) -> None:
+        self.started = time.monotonic()
+        self.served = 0
+        self.workers = jobs
+        self.pool: ProcessPoolExecutor | None = None
+        if jobs > 1:
+            # Workers warm themselves as the pool starts them; the daemon process only dispatches.
+            self.pool = ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=warm_up if warm else None,
+                initargs=(credit_input,) if warm else (),
+            )
+        elif warm:
+            warm_up(credit_input)
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+
+    def results(self, jobs: list[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        if self.pool is None:
+            outcomes: Iterator[Callable[[], dict[str, Any]]] = (partial(run_job, job) for job in jobs)
+        else:
+            outcomes = (future.result for future in [self.pool.submit(run_job, job) for job in jobs])
+        for index, outcome in enumerate(outcomes):
+            try:
+                meta = outcome()
+            except Exception as exc:
+                yield {"ok": False, "index": index, "error": error_text(exc)}
+                continue
+            self.served += 1
+            yield {"ok": True, "index": index, "meta": meta}
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "ok": True,
+            "workers": self.workers,
+            "scope": "dispatcher" if self.pool else "renderer",
+            "fonts": {"hits": FONT_REGISTRY.hits, "misses": FONT_REGISTRY.misses},
+            "glyph_metrics": METRICS.stats(),
+            "templates": {"hits": TEMPLATES.hits, "misses": TEMPLATES.misses, "disk_hits": TEMPLATES.disk_hits},
+            "document_ir": IR_CACHE.stats(),
+        }
+
+    def handle(self, request: dict[str, Any]) -> Iterator[dict[str, Any]]:
+        op = request.get("op")
+        if op == "ping":
+            yield {
+                "ok": True,
+                "pid": os.getpid(),
+                "uptime_sec": round(time.monotonic() - self.started, 3),
+                "jobs_served": self.served,
+            }
+        elif op == "stats":
+            yield self.stats()
+        elif op == "render":
+            jobs = request.get("jobs", [])
+            started = time.perf_counter()
+            yield from self.results(jobs)
+            log(f"rendered {len(jobs)} job(s) in {time.perf_counter() - started:.2f}s")
+        elif op == "shutdown":
+            yield {"ok": True}
+        else:
+            yield {"ok": False, "error": f"unknown op {op!r}"}
+
+    def serve_stream(self, reader: TextIO, writer: TextIO) -> bool:
+        """Answer requests from `reader` until it closes; False once a shutdown was requested."""
+        for line in reader:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as exc:
+                request = {}
+                responses: Iterator[dict[str, Any]] = iter([{"ok": False, "error": f"bad request: {exc}"}])
+            else:
+                responses = self.handle(request)
+            for response in responses:
+                writer.write(json.dumps(response, separators=(",", ":")) + "\n")
+                writer.flush()
+            if request.get("op") == "shutdown":
+                return False
+        return True
+
+    def serve_socket(self, path: Path) -> None:
+        """Accept one client at a time (render stages record into per-process metrics) until shutdown."""
+        claim_socket(path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(str(path))
+            path.chmod(0o600)
+            server.listen()
+            log(f"listening on {path}")
+            running = True
+            while running:
+                conn, _ = server.accept()
+                with conn, conn.makefile("r", encoding="utf-8") as reader, conn.makefile("w", encoding="utf-8") as writer:
+                    try:
+                        running = self.serve_stream(reader, writer)
+                    except (BrokenPipeError, ConnectionResetError):
+                        log("client disconnected mid-request")
+        finally:
+            server.close()
+            path.unlink(missing_ok=True)
+
+
+def claim_socket(path: Path) -> None:
+    """Remove a stale socket file left by a crashed daemon; refuse to start if one is still serving."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(str(path))
+    except OSError:
+        path.unlink()
+        return
+    finally:
+        probe.close()
+    raise SystemExit(f"A render daemon is already listening on {path}")
+
+
+def main() -> None:
+    args = parse_args()
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    protocol_out = sys.stdout
+    if args.stdio:
+        # stdout carries the protocol; renderer progress prints go to stderr with the logs.
+        sys.stdout = sys.stderr
+    daemon = RenderDaemon(jobs, args.input, warm=not args.no_warm)
+    try:
+        if args.stdio:
+            daemon.serve_stream(sys.stdin, protocol_out)
+        else:
+            daemon.serve_socket(args.socket)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.close()
+        log(f"stopped after {daemon.served} job(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Append-only, crash-safe journal of finished document renders.
+
+Each completed document is appended as one JSON line holding its render key, the path and SHA-256
+of every output file the render wrote and its render metadata, then flushed and fsynced, so a
+killed run loses at most the document in flight. On restart `resume` returns the entries whose key
+still matches the input and whose recorded files are still on disk with the recorded hashes;
+everything else is rendered again. A torn
+last line from a crash is ignored when reading and truncated before the next entry is appended.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Sequence
+
+
+class MissingOutputError(FileNotFoundError):
+    """A render output passed to `RenderJournal.record` does not exist."""
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class RenderJournal:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.fh = None
+
+    def entries(self) -> dict[str, dict[str, Any]]:
+        """Journal entries by render key; later lines win."""
+        found: dict[str, dict[str, Any]] = {}
+        if not self.path.exists():
+            return found
+        with self.path.open(encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                found[entry["key"]] = entry
+        return found
+
+    def resume(self, keys: Sequence[str]) -> dict[int, dict[str, Any]]:
+        """Render metadata for each key in `keys` that is journaled and whose files verify, by position."""
+        entries = self.entries()
+        done: dict[int, dict[str, Any]] = {}
+        for index, key in enumerate(keys):
+            entry = entries.get(key)
+            if entry is None or "files" not in entry:
+                continue
+            outputs = [Path(name) for name in entry["files"]]
+            if all(path.exists() and file_sha256(path) == digest for path, digest in zip(outputs, entry["sha256"])):
+                done[index] = entry["meta"]
+        return done
+
+    def record(self, key: str, outputs: Sequence[Path], meta: dict[str, Any]) -> None:
+        """Append `key` with the files its render wrote; every one of `outputs` must exist."""
+        missing = [str(path) for path in outputs if not path.is_file()]
+        if missing:
+            raise MissingOutputError(f"render output(s) not written, cannot journal them: {', '.join(missing)}")
+        if self.fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.drop_torn_line()
+            self.fh = self.path.open("a", encoding="utf-8")
+        entry = {
+            "key": key,
+            "files": [str(path) for path in outputs],
+            "sha256": [file_sha256(path) for path in outputs],
+            "meta": meta,
+        }
+        self.fh.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self.fh.flush()
+        os.fsync(self.fh.fileno())
+
+    def drop_torn_line(self) -> None:
+        """Truncate a last line left without its newline by a crash, so new entries start on a fresh line."""
+        if not self.path.exists():
+            return
+        with self.path.open("r+b") as fh:
+            end = fh.seek(0, os.SEEK_END)
+            position = end
+            while position > 0:
+                size = min(1 << 16, position)
+                fh.seek(position - size)
+                chunk = fh.read(size)
+                if position == end and chunk.endswith(b"\n"):
+                    return
+                newline = chunk.rfind(b"\n")
+                if newline >= 0:
+                    position = position - size + newline + 1
+                    break
+                position -= size
+            fh.truncate(position)
+            fh.flush()
+            os.fsync(fh.fileno())
+
+    def discard(self) -> None:
+        """Remove the journal once the run's manifest is safely written."""
+        if self.fh is not None:
+            self.fh.close()
+            self.fh = None
+        self.path.unlink(missing_ok=True)
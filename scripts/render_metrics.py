@@ -0,0 +1,144 @@
+"""Per-document render instrumentation: stage timings, output size, pixel dimensions and peak memory.
+
+Renderers mark their phases with `stage("layout")`, `stage("encode")`, ... and report raster sizes
+with `note_pixels`; both are no-ops unless a `measure()` block is active, so render functions keep
+their signatures. Peak memory is the process resident high-water mark, reset per document where
+Linux allows it (/proc/self/clear_refs); elsewhere it is the high-water mark since process start.
+"""
+
+from __future__ import annotations
+
+import math
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+CLEAR_REFS = Path("/proc/self/clear_refs")
+PROC_STATUS = Path("/proc/self/status")
+
+
+class RenderMetrics:
+    def __init__(self) -> None:
+        self.stages: dict[str, dict[str, float]] = {}
+        self.pixels: list[list[int]] = []
+        self.wall_start = time.perf_counter()
+        self.cpu_start = time.process_time()
+
+    def add(self, name: str, wall: float, cpu: float) -> None:
+        entry = self.stages.setdefault(name, {"wall_ms": 0.0, "cpu_ms": 0.0})
+        entry["wall_ms"] += wall * 1000
+        entry["cpu_ms"] += cpu * 1000
+
+    def finish(self, outputs: Iterable[Path] = ()) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "wall_ms": round((time.perf_counter() - self.wall_start) * 1000, 2),
+            "cpu_ms": round((time.process_time() - self.cpu_start) * 1000, 2),
+            "stages": {
+                name: {key: round(value, 2) for key, value in entry.items()} for name, entry in self.stages.items()
+            },
+            "output_bytes": sum(path.stat().st_size for path in outputs if path.exists()),
+            "peak_rss_mb": round(peak_rss_bytes() / 2**20, 1),
+        }
+        if self.pixels:
+            result["pixels"] = self.pixels
+        return result
+
+
+_active: RenderMetrics | None = None
+
+
+def reset_peak_rss() -> None:
+    try:
+        CLEAR_REFS.write_text("5")
+    except OSError:
+        pass
+
+
+def peak_rss_bytes() -> int:
+    try:
+        for line in PROC_STATUS.read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def external_metrics(wall_sec: float, outputs: Iterable[Path] = (), stage_name: str = "remote") -> dict[str, Any]:
+    """Metrics for a document rendered outside this process (e.g. a gemimg subprocess), in `finish` form."""
+    wall_ms = round(wall_sec * 1000, 2)
+    return {
+        "wall_ms": wall_ms,
+        "cpu_ms": 0.0,
+        "stages": {stage_name: {"wall_ms": wall_ms, "cpu_ms": 0.0}},
+        "output_bytes": sum(path.stat().st_size for path in outputs if path.exists()),
+        "peak_rss_mb": 0.0,
+    }
+
+
+@contextmanager
+def measure() -> Iterator[RenderMetrics]:
+    """Collect stages and pixel notes from everything rendered inside the block."""
+    global _active
+    previous = _active
+    reset_peak_rss()
+    _active = RenderMetrics()
+    try:
+        yield _active
+    finally:
+        _active = previous
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    if _active is None:
+        yield
+        return
+    metrics = _active
+    wall, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        metrics.add(name, time.perf_counter() - wall, time.process_time() - cpu)
+
+
+def note_pixels(size: tuple[int, int]) -> None:
+    if _active is not None:
+        _active.pixels.append(list(size))
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of `values` (which must be non-empty)."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    return {
+        "p50": round(percentile(values, 50), 2),
+        "p95": round(percentile(values, 95), 2),
+        "max": round(max(values), 2),
+    }
+
+
+def aggregate(samples: Iterable[tuple[str, dict[str, Any]]]) -> dict[str, dict[str, Any]]:
+    """p50/p95/max of each metric and stage, grouped by the key of each (key, metrics) sample."""
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    for key, metrics in samples:
+        grouped.setdefault(key, []).append(metrics)
+    table: dict[str, dict[str, Any]] = {}
+    for key, rows in sorted(grouped.items()):
+        entry: dict[str, Any] = {"count": len(rows)}
+        for field in ("wall_ms", "cpu_ms", "output_bytes", "peak_rss_mb"):
+            entry[field] = summarize([row[field] for row in rows])
+        stage_names = sorted({name for row in rows for name in row["stages"]})
+        entry["stage_wall_ms"] = {
+            name: summarize([row["stages"][name]["wall_ms"] for row in rows if name in row["stages"]])
+            for name in stage_names
+        }
+        table[key] = entry
+    return table
@@ -1,7 +1,7 @@
 #!/usr/bin/env -S uv run --script
 # /// script
 # requires-python = ">=3.12"
-# dependencies = ["pillow>=10.4.0", "reportlab>=4.2.0"]
+# dependencies = ["numpy>=1.26", "pillow>=10.4.0", "reportlab>=4.2.0"]
 # ///
 
 """Render synthetic applicant document bundles into mixed-format demo artifacts."""
@@ -10,26 +10,44 @@ from __future__ import annotations
 
 import argparse
 import json
-import math
 import os
 import random
-import subprocess
-import textwrap
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Container, Iterable, Iterator
 
-from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageFont, ImageOps
+import numpy as np
+from PIL import Image, ImageDraw
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
-from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
+from catalog import CATALOG_PATH, update_catalog
+from contact_sheets import build_contact_sheets
+from daemon_client import DEFAULT_SOCKET, apply_settings, connect, current_settings
+from document_ir import IR_CACHE, IR_CACHE_DIR, Block, Column, DocumentIR, Field, Fields, Items, Lines, Paragraph, Section, Table
+from font_registry import REGISTRY as FONT_REGISTRY, choose_font
+from gemimg_runner import BACKENDS, GemimgJob, run_jobs
+from manifest_watch import DEFAULT_INTERVAL_SEC, ManifestWatcher, diff_records, load_json_if_valid
+from page_templates import TEMPLATES
+from render_cache import CACHE_DIR, RenderCache, cache_key, cached_render, tally
+from render_journal import MissingOutputError, RenderJournal
+from render_metrics import aggregate, external_metrics, measure, note_pixels, stage
+from scan_effects import Effect, EllipseRing, Line, PaperTexture, RectOutline, Speckles, apply_effects
+from scan_geometry import DEFAULT_BUDGET_MB, GEOMETRY, Distortion, distort
+from text_layout import METRICS, paginate, wrap, wrap_all
+from webp_profiles import DEFAULT_PROFILE, PROFILES, WEBP
+
 ROOT = Path(__file__).resolve().parents[1]
 DATA_ROOT = ROOT / "credit-checking" / "data"
 DATA_PATH = DATA_ROOT / "manifests" / "synthetic_applicant_bundles.json"
 OUT_DIR = DATA_ROOT / "applicants"
+# Bump whenever rendered output changes so stale cache entries are not reused.
+RENDERER_VERSION = "8"
 
 
 def parse_args() -> argparse.Namespace:
@@ -38,9 +56,9 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--output-dir", type=Path, default=OUT_DIR)
     parser.add_argument(
         "--webp-backend",
-        choices=["gemimg", "local"],
+        choices=["gemimg", "fake", "local"],
         default="gemimg",
-        help="How to generate .webp documents marked as gemimg_scan_webp.",
+        help="How to generate .webp documents marked as gemimg_scan_webp (fake = offline stand-in script).",
     )
     parser.add_argument(
         "--gemimg-timeout-sec",
@@ -48,6 +66,24 @@ def parse_args() -> argparse.Namespace:
         default=240,
         help="Timeout for each gemimg image generation call.",
     )
+    parser.add_argument(
+        "--gemimg-concurrency",
+        type=int,
+        default=4,
+        help="Maximum gemimg calls in flight at once.",
+    )
+    parser.add_argument(
+        "--gemimg-rate",
+        type=float,
+        default=1.0,
+        help="Maximum gemimg call starts per second (0 = unlimited).",
+    )
+    parser.add_argument(
+        "--gemimg-retries",
+        type=int,
+        default=2,
+        help="Retries per gemimg job, with exponential backoff, before falling back to the local renderer.",
+    )
     parser.add_argument(
         "--gemimg-samples",
         type=int,
@@ -60,6 +96,87 @@ def parse_args() -> argparse.Namespace:
         default=42,
         help="Seed for deterministic local scan noise.",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for document rendering (0 = one per CPU). Output is identical for any value.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=CACHE_DIR,
+        help="Content-addressed render cache; unchanged documents are linked from here instead of re-rendered.",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Render every document from scratch.")
+    parser.add_argument(
+        "--catalog",
+        type=Path,
+        default=CATALOG_PATH,
+        help="SQLite catalog to update with render results (see query_catalog.py).",
+    )
+    parser.add_argument("--no-catalog", action="store_true", help="Skip the catalog export.")
+    parser.add_argument(
+        "--template-dir",
+        type=Path,
+        default=None,
+        help="Persist pre-rendered page templates here so later runs skip drawing them (default: memory only).",
+    )
+    parser.add_argument(
+        "--thumbnails",
+        action="store_true",
+        help="Also write a small WEBP thumbnail of every locally rasterized scan to previews/thumbnails.",
+    )
+    parser.add_argument(
+        "--webp-profile",
+        choices=sorted(PROFILES),
+        default=DEFAULT_PROFILE,
+        help="WEBP encoder settings for scan images (draft = fastest, archival = release quality).",
+    )
+    parser.add_argument(
+        "--distort-budget-mb",
+        type=float,
+        default=DEFAULT_BUDGET_MB,
+        help="Working-memory budget per scan for the rotate/skew/blur pass; lower trades speed for RSS.",
+    )
+    parser.add_argument(
+        "--shard",
+        type=Shard.parse,
+        default=None,
+        metavar="I/N",
+        help="Render only shard I of N (applicants round-robin by input order) and write a partial manifest.",
+    )
+    parser.add_argument(
+        "--merge-shards",
+        action="store_true",
+        help="Build render_manifest.json, gemimg_jobs.json and previews from the shard manifests; renders nothing.",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Ignore the progress journal left by an interrupted run and render everything again.",
+    )
+    parser.add_argument(
+        "--daemon",
+        type=Path,
+        nargs="?",
+        const=DEFAULT_SOCKET,
+        default=None,
+        metavar="SOCKET",
+        help="Send local renders to a warm scripts/render_daemon.py (default socket when no path is given); "
+        "renders in-process if none is listening.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="After rendering, keep polling --input and re-render only the documents an edit touches (Ctrl-C stops).",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=DEFAULT_INTERVAL_SEC,
+        help="Seconds between --watch polls of the input manifest.",
+    )
     return parser.parse_args()
 
 
@@ -75,198 +192,164 @@ def load_json(path: Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
-def choose_font(size: int, mono: bool = False, bold: bool = False) -> ImageFont.ImageFont:
-    mono_candidates = [
-        "/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf",
-        "/usr/share/fonts/truetype/liberation2/LiberationMono-Regular.ttf",
-    ]
-    sans_candidates = [
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-        "/usr/share/fonts/truetype/liberation2/LiberationSans-Regular.ttf",
-    ]
-    bold_candidates = [
-        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-        "/usr/share/fonts/truetype/liberation2/LiberationSans-Bold.ttf",
-    ]
-    candidates = mono_candidates if mono else (bold_candidates if bold else sans_candidates)
-    if bold and not mono:
-        candidates = bold_candidates + sans_candidates
-    for path in candidates:
-        if Path(path).exists():
-            try:
-                return ImageFont.truetype(path, size)
-            except OSError:
-                continue
-    return ImageFont.load_default()
-
-
-def wrap_lines(text: str, width: int) -> list[str]:
-    wrapped = textwrap.wrap(text, width=width) or [""]
-    return wrapped
-
-
-def document_text_lines(doc: dict[str, Any]) -> list[str]:
+SERVICE_FIELDS = [
+    "branch",
+    "component",
+    "rank_at_separation",
+    "mos_code",
+    "mos_title",
+    "service_start",
+    "service_end",
+    "character_of_service",
+    "deployments_count",
+]
+EDUCATION_FIELDS = [
+    "institution_name",
+    "student_number",
+    "program",
+    "credential_awarded",
+    "attendance_start",
+    "attendance_end",
+    "gpa",
+    "graduation_date",
+]
+EVALUATION_FIELDS = [
+    "agency",
+    "report_type",
+    "origin_country",
+    "origin_institution",
+    "origin_credential",
+    "us_equivalency",
+    "us_gpa",
+    "report_date",
+    "reference_number",
+]
+CERTIFICATE_FIELDS = [
+    "certificate_name",
+    "provider",
+    "credential_id",
+    "issue_date",
+    "expiration_date",
+    "verification_url",
+]
+SCORE_COLUMNS = (
+    Column("test_name", "Test", 24),
+    Column("section", "Section", 24),
+    Column("score", "Score", 6),
+    Column("scale", "Scale", 10),
+    Column("test_date", "Date", 10),
+)
+COURSE_COLUMNS = (
+    Column("course_code", "Code", 13),
+    Column("course_title", "Title", 33),
+    Column("term_label", "Term", 6),
+    Column("year", "Yr", 4, align="right"),
+    Column("credits", "Cr", 4, align="right", spec=".1f"),
+    Column("grade", "Grade", 5),
+    Column("status", "Status", 9),
+)
+HINT_COLUMNS = (
+    Column("source_evidence", "Source Evidence", 40),
+    Column("proposed_college_course_code", "Course", 12),
+    Column("proposed_college_course_title", "Course Title", 40),
+    Column("credits", "Cr", 4, align="right", spec=".1f"),
+)
+
+
+def record_fields(record: dict[str, Any], keys: list[str]) -> Fields:
+    return Fields(tuple(Field(key, key.replace("_", " ").title(), record[key]) for key in keys if key in record))
+
+
+def record_table(records: list[dict[str, Any]], columns: tuple[Column, ...], row_format: str | None = None) -> Table:
+    return Table(columns, tuple(tuple(r.get(c.key) for c in columns) for r in records), row_format)
+
+
+def build_document_ir(doc: dict[str, Any]) -> DocumentIR:
+    """Walk a document's Structured_Content once into the sections every renderer draws from."""
     sc = doc["Structured_Content"]
-    lines = [
-        doc["Title"].upper(),
-        f"Issuer: {doc['Issuing_Organization']}",
-        f"Issue Date: {doc['Issue_Date']}",
-        f"Document Type: {doc['Document_Type']}",
+    header = [
+        Field("issuer", "Issuer", doc["Issuing_Organization"]),
+        Field("issue_date", "Issue Date", doc["Issue_Date"]),
+        Field("document_type", "Document Type", doc["Document_Type"]),
     ]
-    if sc.get("student_name"):
-        lines.append(f"Student: {sc['student_name']}")
-    if sc.get("student_id_on_document"):
-        lines.append(f"Document Student ID: {sc['student_id_on_document']}")
-    if sc.get("document_number"):
-        lines.append(f"Document Number: {sc['document_number']}")
+    for key, label in [
+        ("student_name", "Student"),
+        ("student_id_on_document", "Document Student ID"),
+        ("document_number", "Document Number"),
+    ]:
+        if sc.get(key):
+            header.append(Field(key, label, sc[key]))
+
+    sections: list[Section] = []
     if sc.get("summary_lines"):
-        lines.append("")
-        lines.append("SUMMARY")
-        lines.extend(sc["summary_lines"])
-
+        sections.append(Section("summary", "SUMMARY", (Lines(tuple(sc["summary_lines"])),)))
     if (service := sc.get("service_record")):
-        lines.append("")
-        lines.append("SERVICE RECORD")
-        for key in [
-            "branch",
-            "component",
-            "rank_at_separation",
-            "mos_code",
-            "mos_title",
-            "service_start",
-            "service_end",
-            "character_of_service",
-            "deployments_count",
-        ]:
-            if key in service:
-                label = key.replace("_", " ").title()
-                lines.append(f"{label}: {service[key]}")
-
+        sections.append(Section("service_record", "SERVICE RECORD", (record_fields(service, SERVICE_FIELDS),)))
     if (edu := sc.get("education_record")):
-        lines.append("")
-        lines.append("EDUCATION RECORD")
-        for key in [
-            "institution_name",
-            "student_number",
-            "program",
-            "credential_awarded",
-            "attendance_start",
-            "attendance_end",
-            "gpa",
-            "graduation_date",
-        ]:
-            if key in edu:
-                label = key.replace("_", " ").title()
-                lines.append(f"{label}: {edu[key]}")
-
+        sections.append(Section("education_record", "EDUCATION RECORD", (record_fields(edu, EDUCATION_FIELDS),)))
     if (ev := sc.get("evaluation_record")):
-        lines.append("")
-        lines.append("CREDENTIAL EVALUATION")
-        for key in [
-            "agency",
-            "report_type",
-            "origin_country",
-            "origin_institution",
-            "origin_credential",
-            "us_equivalency",
-            "us_gpa",
-            "report_date",
-            "reference_number",
-        ]:
-            if key in ev:
-                label = key.replace("_", " ").title()
-                lines.append(f"{label}: {ev[key]}")
-
+        sections.append(Section("evaluation_record", "CREDENTIAL EVALUATION", (record_fields(ev, EVALUATION_FIELDS),)))
     if (cert := sc.get("certificate_record")):
-        lines.append("")
-        lines.append("CERTIFICATE")
-        for key in [
-            "certificate_name",
-            "provider",
-            "credential_id",
-            "issue_date",
-            "expiration_date",
-            "verification_url",
-        ]:
-            if key in cert:
-                label = key.replace("_", " ").title()
-                lines.append(f"{label}: {cert[key]}")
+        blocks: list[Block] = [record_fields(cert, CERTIFICATE_FIELDS)]
         if cert.get("skills"):
-            lines.append("Skills:")
-            for skill in cert["skills"]:
-                lines.append(f" - {skill}")
-
+            blocks.append(Items("Skills", tuple(cert["skills"])))
+        sections.append(Section("certificate_record", "CERTIFICATE", tuple(blocks)))
     if sc.get("scores"):
-        lines.append("")
-        lines.append("SCORES")
-        for s in sc["scores"]:
-            lines.append(f"{s['test_name']} | {s['section']}: {s['score']} ({s['scale']}) [{s['test_date']}]")
-
+        scores = record_table(sc["scores"], SCORE_COLUMNS, "{test_name} | {section}: {score} ({scale}) [{test_date}]")
+        sections.append(Section("scores", "SCORES", (scores,)))
     if sc.get("courses"):
-        lines.append("")
-        lines.append("COURSE RECORDS")
-        lines.append("Code           | Title                             | Term   | Yr | Cr | Grade | Status")
-        lines.append("-" * 94)
-        for c in sc["courses"]:
-            code = c["course_code"][:13].ljust(13)
-            title = c["course_title"][:33].ljust(33)
-            term = c["term_label"][:6].ljust(6)
-            year = str(c["year"]).rjust(4)
-            credits = f"{c['credits']:.1f}".rjust(4)
-            grade = str(c["grade"] if c["grade"] is not None else "").ljust(5)
-            status = c["status"][:9].ljust(9)
-            lines.append(f"{code} | {title} | {term} | {year} | {credits} | {grade} | {status}")
-
+        sections.append(Section("courses", "COURSE RECORDS", (record_table(sc["courses"], COURSE_COLUMNS),)))
     if sc.get("ace_recommendations"):
-        lines.append("")
-        lines.append("ACE CREDIT RECOMMENDATIONS")
+        blocks = []
         for rec in sc["ace_recommendations"]:
-            lines.append(
-                f"{rec['experience_or_training']}: {rec['subject']} "
-                f"(LL {rec['lower_division_credits']:.1f} / UL {rec['upper_division_credits']:.1f})"
+            blocks.append(
+                Lines(
+                    (
+                        f"{rec['experience_or_training']}: {rec['subject']} "
+                        f"(LL {rec['lower_division_credits']:.1f} / UL {rec['upper_division_credits']:.1f})",
+                    )
+                )
             )
-            lines.extend(wrap_lines(f"Basis: {rec['recommendation_basis']}", width=92))
-
+            blocks.append(Paragraph(f"Basis: {rec['recommendation_basis']}"))
+        sections.append(Section("ace_recommendations", "ACE CREDIT RECOMMENDATIONS", tuple(blocks)))
     if sc.get("ai_mapping_hints"):
-        lines.append("")
-        lines.append("AI MAPPING HINTS")
-        for hint in sc["ai_mapping_hints"]:
-            lines.append(
-                f"{hint['source_evidence']} -> {hint['proposed_college_course_code']} "
-                f"({hint['proposed_college_course_title']}, {hint['credits']:.1f} cr)"
-            )
-
+        hints = record_table(
+            sc["ai_mapping_hints"],
+            HINT_COLUMNS,
+            "{source_evidence} -> {proposed_college_course_code} ({proposed_college_course_title}, {credits:.1f} cr)",
+        )
+        sections.append(Section("ai_mapping_hints", "AI MAPPING HINTS", (hints,)))
     if sc.get("raw_text_preview"):
-        lines.append("")
-        lines.append("RAW TEXT PREVIEW")
-        lines.extend(sc["raw_text_preview"])
-
+        sections.append(Section("raw_text_preview", "RAW TEXT PREVIEW", (Lines(tuple(sc["raw_text_preview"])),)))
     if sc.get("notes"):
-        lines.append("")
-        lines.append("NOTES")
-        for note in sc["notes"]:
-            lines.extend(wrap_lines(note, width=92))
+        sections.append(Section("notes", "NOTES", tuple(Paragraph(note) for note in sc["notes"])))
+    return DocumentIR(doc["Title"], Fields(tuple(header)), tuple(sections))
 
-    return lines
+
+def document_ir(doc: dict[str, Any]) -> DocumentIR:
+    return IR_CACHE.get("credit", doc, RENDERER_VERSION, lambda: build_document_ir(doc))
 
 
 def draw_wrapped_pdf_lines(
     c: canvas.Canvas,
     x: float,
     y: float,
-    width_chars: int,
     lines: Iterable[str],
     *,
     font_name: str = "Helvetica",
     font_size: int = 10,
     leading: int = 13,
+    max_width: float | None = None,
     bottom_margin: float = 0.7 * inch,
 ) -> float:
+    """Draw `lines` wrapped to `max_width` points (default: to the right margin), starting new pages as needed."""
+    if max_width is None:
+        max_width = letter[0] - 0.75 * inch - x
     c.setFont(font_name, font_size)
     cur_y = y
+    metrics = METRICS.pdf(font_name, font_size)
     for line in lines:
-        wrapped = wrap_lines(str(line), width_chars) if line else [""]
-        for chunk in wrapped:
+        for chunk in wrap(str(line), max_width, metrics):
             if cur_y <= bottom_margin:
                 c.showPage()
                 cur_y = letter[1] - 0.75 * inch
@@ -276,65 +359,64 @@ def draw_wrapped_pdf_lines(
     return cur_y
 
 
-def render_pristine_pdf(doc: dict[str, Any], out_path: Path) -> None:
+def render_pristine_pdf(ir: DocumentIR, out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    c = canvas.Canvas(str(out_path), pagesize=letter)
+    c = canvas.Canvas(str(out_path), pagesize=letter, invariant=1)
     width, height = letter
-    sc = doc["Structured_Content"]
 
     c.setStrokeColor(colors.HexColor("#D1D5DB"))
     c.setFillColor(colors.HexColor("#F8FAFC"))
     c.rect(0.5 * inch, height - 1.35 * inch, width - inch, 0.85 * inch, fill=1, stroke=1)
     c.setFillColor(colors.HexColor("#0F172A"))
     c.setFont("Helvetica-Bold", 16)
-    c.drawString(0.75 * inch, height - 0.9 * inch, doc["Title"])
+    c.drawString(0.75 * inch, height - 0.9 * inch, ir.title)
     c.setFont("Helvetica", 9)
     c.setFillColor(colors.HexColor("#334155"))
-    c.drawString(0.75 * inch, height - 1.15 * inch, f"Issuer: {doc['Issuing_Organization']}")
-    c.drawRightString(width - 0.75 * inch, height - 1.15 * inch, f"Issue Date: {doc['Issue_Date']}")
+    c.drawString(0.75 * inch, height - 1.15 * inch, f"Issuer: {ir.header.get('issuer')}")
+    c.drawRightString(width - 0.75 * inch, height - 1.15 * inch, f"Issue Date: {ir.header.get('issue_date')}")
 
     y = height - 1.7 * inch
-    if sc.get("student_name"):
+    if (student := ir.header.get("student_name")):
         c.setFillColor(colors.black)
         c.setFont("Helvetica-Bold", 11)
-        c.drawString(0.75 * inch, y, f"Student: {sc['student_name']}")
+        c.drawString(0.75 * inch, y, f"Student: {student}")
         y -= 0.25 * inch
 
     c.setFont("Helvetica", 10)
     c.setFillColor(colors.black)
+    summary = ir.block("summary", Lines)
     y = draw_wrapped_pdf_lines(
         c,
         0.75 * inch,
         y,
-        95,
-        [f"- {line}" for line in sc.get("summary_lines", [])],
+        [f"- {line}" for line in summary.lines] if summary else [],
         font_name="Helvetica",
         font_size=10,
         leading=14,
     )
     y -= 0.1 * inch
 
-    if (cert := sc.get("certificate_record")):
+    if (cert := ir.block("certificate_record", Fields)):
         c.setFont("Helvetica-Bold", 11)
         c.drawString(0.75 * inch, y, "Credential Details")
         y -= 0.2 * inch
         rows = [
-            f"Certificate: {cert['certificate_name']}",
-            f"Provider: {cert['provider']}",
-            f"Credential ID: {cert['credential_id']}",
-            f"Issue Date: {cert['issue_date']}",
+            f"Certificate: {cert.get('certificate_name')}",
+            f"Provider: {cert.get('provider')}",
+            f"Credential ID: {cert.get('credential_id')}",
+            f"Issue Date: {cert.get('issue_date')}",
             f"Expiration Date: {cert.get('expiration_date') or 'N/A'}",
-            f"Verification URL: {cert['verification_url']}",
+            f"Verification URL: {cert.get('verification_url')}",
         ]
-        y = draw_wrapped_pdf_lines(c, 0.9 * inch, y, 92, rows, font_name="Helvetica", font_size=9, leading=12)
-        if cert.get("skills"):
+        y = draw_wrapped_pdf_lines(c, 0.9 * inch, y, rows, font_name="Helvetica", font_size=9, leading=12)
+        if (skills := ir.block("certificate_record", Items)):
             y -= 0.1 * inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(0.9 * inch, y, "Skills")
             y -= 0.18 * inch
-            y = draw_wrapped_pdf_lines(c, 1.05 * inch, y, 88, [f"* {s}" for s in cert["skills"]], font_name="Helvetica", font_size=9, leading=12)
+            y = draw_wrapped_pdf_lines(c, 1.05 * inch, y, [f"* {s}" for s in skills.items], font_name="Helvetica", font_size=9, leading=12)
 
-    if (ev := sc.get("evaluation_record")):
+    if (ev := ir.block("evaluation_record", Fields)):
         c.setFont("Helvetica-Bold", 11)
         if y < 2.5 * inch:
             c.showPage()
@@ -342,24 +424,24 @@ def render_pristine_pdf(doc: dict[str, Any], out_path: Path) -> None:
         c.drawString(0.75 * inch, y, "Evaluation Summary")
         y -= 0.2 * inch
         rows = [
-            f"Agency: {ev['agency']}",
-            f"Report Type: {ev['report_type']}",
-            f"Origin Institution: {ev['origin_institution']} ({ev['origin_country']})",
-            f"Origin Credential: {ev['origin_credential']}",
-            f"U.S. Equivalency: {ev['us_equivalency']}",
+            f"Agency: {ev.get('agency')}",
+            f"Report Type: {ev.get('report_type')}",
+            f"Origin Institution: {ev.get('origin_institution')} ({ev.get('origin_country')})",
+            f"Origin Credential: {ev.get('origin_credential')}",
+            f"U.S. Equivalency: {ev.get('us_equivalency')}",
             f"U.S. GPA: {ev.get('us_gpa') if ev.get('us_gpa') is not None else 'N/A'}",
-            f"Reference Number: {ev['reference_number']}",
+            f"Reference Number: {ev.get('reference_number')}",
         ]
-        y = draw_wrapped_pdf_lines(c, 0.9 * inch, y, 90, rows, font_name="Helvetica", font_size=9, leading=12)
+        y = draw_wrapped_pdf_lines(c, 0.9 * inch, y, rows, font_name="Helvetica", font_size=9, leading=12)
 
-    if sc.get("scores"):
+    if (scores := ir.block("scores", Table)):
         if y < 2.2 * inch:
             c.showPage()
             y = height - 0.9 * inch
         c.setFont("Helvetica-Bold", 11)
         c.drawString(0.75 * inch, y, "Score Breakdown")
         y -= 0.2 * inch
-        for s in sc["scores"]:
+        for s in scores.records():
             c.setStrokeColor(colors.HexColor("#CBD5E1"))
             c.rect(0.9 * inch, y - 0.15 * inch, width - 1.8 * inch, 0.28 * inch, fill=0, stroke=1)
             c.setFont("Helvetica", 9)
@@ -367,7 +449,7 @@ def render_pristine_pdf(doc: dict[str, Any], out_path: Path) -> None:
             c.drawRightString(width - 1.0 * inch, y - 0.03 * inch, f"{s['score']} ({s['scale']})")
             y -= 0.34 * inch
 
-    if sc.get("courses"):
+    if (courses := ir.block("courses", Table)):
         if y < 3.0 * inch:
             c.showPage()
             y = height - 0.9 * inch
@@ -385,7 +467,7 @@ def render_pristine_pdf(doc: dict[str, Any], out_path: Path) -> None:
         c.line(0.75 * inch, y, width - 0.75 * inch, y)
         y -= 0.15 * inch
         c.setFont("Helvetica", 8)
-        for row in sc["courses"]:
+        for row in courses.records():
             if y < 0.9 * inch:
                 c.showPage()
                 y = height - 0.9 * inch
@@ -398,7 +480,7 @@ def render_pristine_pdf(doc: dict[str, Any], out_path: Path) -> None:
             c.drawString(6.15 * inch, y, str(row.get("grade") or ""))
             y -= 0.18 * inch
 
-    if sc.get("ai_mapping_hints"):
+    if (hints := ir.block("ai_mapping_hints", Table)):
         if y < 2.0 * inch:
             c.showPage()
             y = height - 0.9 * inch
@@ -407,52 +489,41 @@ def render_pristine_pdf(doc: dict[str, Any], out_path: Path) -> None:
         y -= 0.18 * inch
         hint_lines = [
             f"- {h['source_evidence']} -> {h['proposed_college_course_code']} ({h['credits']:.1f} cr)"
-            for h in sc["ai_mapping_hints"]
+            for h in hints.records()
         ]
-        draw_wrapped_pdf_lines(c, 0.9 * inch, y, 90, hint_lines, font_name="Helvetica", font_size=8, leading=11)
+        draw_wrapped_pdf_lines(c, 0.9 * inch, y, hint_lines, font_name="Helvetica", font_size=8, leading=11)
 
     c.save()
 
 
-def render_raw_text_pdf(doc: dict[str, Any], out_path: Path) -> None:
+def render_raw_text_pdf(ir: DocumentIR, out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    c = canvas.Canvas(str(out_path), pagesize=letter)
+    c = canvas.Canvas(str(out_path), pagesize=letter, invariant=1)
     width, height = letter
     left = 0.55 * inch
     top = height - 0.55 * inch
     line_height = 11
-    max_width = 102
+    max_width = width - 2 * left
+    lines_per_page = int((top - 0.55 * inch) // line_height) + 1
 
-    full_lines = build_raw_text_lines(doc)
-
-    cur_y = top
-    c.setFont("Courier", 9)
-    for line in full_lines:
-        chunks = wrap_lines(line, max_width) if line else [""]
-        for chunk in chunks:
-            if cur_y < 0.55 * inch:
-                c.showPage()
-                c.setFont("Courier", 9)
-                cur_y = top
-            c.drawString(left, cur_y, chunk)
-            cur_y -= line_height
+    rows = wrap_all(build_raw_text_lines(ir), max_width, METRICS.pdf("Courier", 9))
+    for page_number, page in enumerate(paginate(rows, lines_per_page)):
+        if page_number:
+            c.showPage()
+        c.setFont("Courier", 9)
+        for i, chunk in enumerate(page):
+            c.drawString(left, top - i * line_height, chunk)
     c.save()
 
 
-def build_raw_text_lines(doc: dict[str, Any]) -> list[str]:
-    full_lines = []
-    full_lines.append("=" * 106)
-    full_lines.append(doc["Title"].upper())
-    full_lines.append("=" * 106)
-    full_lines.extend(document_text_lines(doc))
-    full_lines.append("")
-    full_lines.append("END OF DOCUMENT")
-    return full_lines
+def build_raw_text_lines(ir: DocumentIR) -> list[str]:
+    rule = "=" * 106
+    return [rule, ir.title.upper(), rule, *ir.text_lines(), "", "END OF DOCUMENT"]
 
 
-def render_raw_text_txt(doc: dict[str, Any], out_path: Path) -> None:
+def render_raw_text_txt(ir: DocumentIR, out_path: Path) -> None:
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text("\n".join(build_raw_text_lines(doc)) + "\n", encoding="utf-8")
+    out_path.write_text("\n".join(build_raw_text_lines(ir)) + "\n", encoding="utf-8")
 
 
 def paper_background(size: tuple[int, int], tone: str) -> Image.Image:
@@ -463,23 +534,17 @@ def paper_background(size: tuple[int, int], tone: str) -> Image.Image:
         "plain_white": (246, 247, 248),
         "bright_white": (248, 250, 252),
     }.get(tone, (242, 242, 242))
-    img = Image.new("RGB", size, base)
-    # subtle paper texture
-    noise = Image.effect_noise(size, 6).convert("L")
-    noise = ImageOps.autocontrast(noise)
-    noise = noise.point(lambda p: 220 + (p - 128) * 0.08)
-    img = ImageChops.multiply(img, Image.merge("RGB", (noise, noise, noise)))
-    return img
+    # Paper grain is applied with the other scan effects in add_scan_artifacts.
+    return Image.new("RGB", size, base)
 
 
-def add_scan_artifacts(img: Image.Image, visual_profile: dict[str, Any], rng: random.Random) -> Image.Image:
-    draw = ImageDraw.Draw(img, "RGBA")
-    w, h = img.size
+def scan_artifact_effects(size: tuple[int, int], visual_profile: dict[str, Any], rng: random.Random) -> list[Effect]:
+    w, h = size
+    effects: list[Effect] = [PaperTexture()]
 
     # Edge shadow
     for i in range(6):
-        alpha = 25 - i * 3
-        draw.rectangle((12 + i, 12 + i, w - 12 - i, h - 12 - i), outline=(90, 90, 90, alpha))
+        effects.append(RectOutline((12 + i, 12 + i, w - 12 - i, h - 12 - i), (90, 90, 90), (25 - i * 3) / 255))
 
     # Random stains / smudges for medium-heavy artifacts
     artifact = visual_profile.get("artifact_level", "light")
@@ -488,146 +553,319 @@ def add_scan_artifacts(img: Image.Image, visual_profile: dict[str, Any], rng: ra
             x = rng.randint(80, w - 160)
             y = rng.randint(80, h - 160)
             r = rng.randint(20, 90)
-            draw.ellipse((x - r, y - r, x + r, y + r), outline=(120, 100, 80, 28), width=2)
+            effects.append(EllipseRing((x - r, y - r, x + r, y + r), (120, 100, 80), 28 / 255, width=2))
     if artifact == "heavy":
-        for _ in range(900):
-            x = rng.randint(0, w - 1)
-            y = rng.randint(0, h - 1)
-            val = rng.randint(140, 210)
-            img.putpixel((x, y), (val, val, val))
+        effects.append(Speckles.random(size, 900, np.random.default_rng(rng.getrandbits(64))))
 
     # Fax line artifacts
     if artifact in {"medium", "heavy"}:
         for _ in range(4):
             y = rng.randint(40, h - 40)
-            draw.line((20, y, w - 20, y + rng.randint(-2, 2)), fill=(120, 120, 120, 28), width=1)
+            effects.append(Line(20, y, w - 20, y + rng.randint(-2, 2), (120, 120, 120), 28 / 255))
+    return effects
 
-    blur_px = float(visual_profile.get("blur_px", 0.0) or 0.0)
-    if blur_px > 0:
-        img = img.filter(ImageFilter.GaussianBlur(radius=blur_px))
 
-    rot = float(visual_profile.get("rotation_degrees", 0.0) or 0.0)
-    if rot:
-        img = img.rotate(rot, resample=Image.Resampling.BICUBIC, expand=True, fillcolor=(235, 235, 235))
-        img = ImageOps.fit(img, (1654, 2339), method=Image.Resampling.BICUBIC, centering=(0.5, 0.5))
+def add_scan_artifacts(img: Image.Image, visual_profile: dict[str, Any], rng: random.Random) -> Image.Image:
+    effects = scan_artifact_effects(img.size, visual_profile, rng)
+    img = apply_effects(img, effects, seed=rng.getrandbits(64))
 
-    return img
+    distortion = Distortion(
+        rotation_degrees=float(visual_profile.get("rotation_degrees", 0.0) or 0.0),
+        skew=float(visual_profile.get("perspective_skew", 0.0) or 0.0),
+        blur_px=float(visual_profile.get("blur_px", 0.0) or 0.0),
+    )
+    return distort(img, distortion, fillcolor=(235, 235, 235))
 
 
-def build_scan_image(doc: dict[str, Any], rng: random.Random) -> Image.Image:
-    sc = doc["Structured_Content"]
-    vp = sc["visual_profile"]
-    img = paper_background((1654, 2339), vp.get("paper_tone", "gray_white"))
+SCAN_CANVAS = (1654, 2339)
+RULED_DOCUMENT_TYPES = {"DD214", "High_School_Attestation_Form", "Community_College_Transcript"}
+
+
+def build_scan_chrome(layout: str, tone: str, size: tuple[int, int]) -> Image.Image:
+    img = paper_background(size, tone)
     draw = ImageDraw.Draw(img)
-    title_font = choose_font(42, bold=True)
-    label_font = choose_font(24, bold=True)
-    body_font = choose_font(23)
-    mono_font = choose_font(20, mono=True)
 
     # Margins and faux header blocks
     draw.rectangle((70, 60, 1584, 240), outline=(70, 70, 70), width=3)
-    draw.text((95, 82), doc["Title"][:70], fill=(25, 25, 25), font=title_font)
-    draw.text((98, 150), f"Issuer: {doc['Issuing_Organization']}", fill=(40, 40, 40), font=body_font)
-    draw.text((980, 150), f"Issue Date: {doc['Issue_Date']}", fill=(40, 40, 40), font=body_font)
 
-    if doc["Document_Type"] in {"DD214", "High_School_Attestation_Form", "Community_College_Transcript"}:
+    if layout == "ruled":
         draw.rectangle((70, 270, 1584, 2100), outline=(90, 90, 90), width=2)
         for y in range(330, 2060, 90):
             draw.line((85, y, 1570, y), fill=(175, 175, 175), width=1)
         for x in [470, 980, 1270]:
             draw.line((x, 285, x, 2090), fill=(180, 180, 180), width=1)
 
-    lines = document_text_lines(doc)
-    y = 285
-    x = 96
-    max_chars = 108
-    draw.text((x, y), "DOCUMENT CONTENT (SYNTHETIC FACSIMILE)", fill=(20, 20, 20), font=label_font)
-    y += 55
-    for line in lines:
-        for chunk in wrap_lines(line, max_chars) if line else [""]:
-            if y > 2240:
-                break
-            font = mono_font if len(chunk) > 45 or "|" in chunk else body_font
-            draw.text((x, y), chunk, fill=(30, 30, 30), font=font)
-            y += 28
-        if y > 2240:
-            break
-
     # Stamp-like corner box for authenticity feel
     draw.rectangle((1220, 2160, 1550, 2280), outline=(120, 60, 60), width=3)
     draw.text((1240, 2196), "RECEIVED", fill=(120, 60, 60), font=choose_font(28, bold=True))
-
-    img = add_scan_artifacts(img, vp, rng)
     return img
 
 
-def render_scan_webp(doc: dict[str, Any], out_path: Path, rng: random.Random) -> None:
-    img = build_scan_image(doc, rng)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    img.save(out_path, format="WEBP", quality=85, method=6)
+def scan_chrome(document_type: str, tone: str, size: tuple[int, int] = SCAN_CANVAS) -> Image.Image:
+    """Fresh copy of the static page for this document type and paper tone."""
+    layout = "ruled" if document_type in RULED_DOCUMENT_TYPES else "plain"
+    return TEMPLATES.get(
+        "scan_chrome",
+        (layout, tone, size),
+        RENDERER_VERSION,
+        lambda: build_scan_chrome(layout, tone, size),
+    )
 
 
-def render_scanned_pdf(doc: dict[str, Any], out_path: Path, rng: random.Random) -> None:
-    img = build_scan_image(doc, rng)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    c = canvas.Canvas(str(out_path), pagesize=letter)
-    page_w, page_h = letter
-    margin = 0.45 * inch
+SCAN_TEXT_X = 96
+SCAN_TEXT_BOTTOM = 2240
+SCAN_LEADING = 28
+FIRST_PAGE_TEXT_TOP = 340
+CONTINUATION_TEXT_TOP = 285
+ScanRow = tuple[str, bool]  # (text, set in the mono font)
 
-    buf = BytesIO()
-    img.save(buf, format="PNG")
-    buf.seek(0)
-    reader = ImageReader(buf)
-    iw, ih = img.size
-    scale = min((page_w - 2 * margin) / iw, (page_h - 2 * margin) / ih)
-    draw_w = iw * scale
-    draw_h = ih * scale
-    x = (page_w - draw_w) / 2
-    y = (page_h - draw_h) / 2
-
-    c.setFillColor(colors.white)
-    c.rect(0, 0, page_w, page_h, fill=1, stroke=0)
-    c.drawImage(reader, x, y, width=draw_w, height=draw_h, preserveAspectRatio=True, mask="auto")
-    c.save()
 
+def is_tabular(line: str) -> bool:
+    """Column-aligned rows (course tables, OCR previews, rules) keep their alignment in the mono font."""
+    return "|" in line or "  " in line.strip() or (len(line) > 8 and len(set(line)) == 1)
 
-def generate_gemimg_webp(doc: dict[str, Any], out_path: Path, timeout_sec: int) -> dict[str, Any]:
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    prompt = doc.get("Gemimg_Prompt") or f"Photorealistic scanned document image: {doc['Title']}"
-    cmd = [
-        "uvx",
-        "gemimg",
-        "--webp",
-        "--force",
-        "-o",
-        out_path.name,
-        prompt,
+
+def scan_body_fonts() -> tuple[Any, Any]:
+    return choose_font(23), choose_font(20, mono=True)
+
+
+def rows_per_page(top: int) -> int:
+    return (SCAN_TEXT_BOTTOM - top) // SCAN_LEADING + 1
+
+
+def scan_layout(ir: DocumentIR) -> list[list[ScanRow]]:
+    """Wrap the document text to the scan width and split it into pages of rows."""
+    body_font, mono_font = scan_body_fonts()
+    max_width = SCAN_CANVAS[0] - 2 * SCAN_TEXT_X
+    rows = [
+        (chunk, mono)
+        for line in ir.text_lines(wrap_width=None)
+        for mono in [is_tabular(line)]
+        for chunk in wrap(line, max_width, METRICS.pil(mono_font if mono else body_font))
     ]
-    proc = subprocess.run(
-        cmd,
-        cwd=out_path.parent,
-        capture_output=True,
-        text=True,
-        timeout=timeout_sec,
-        env=os.environ.copy(),
-    )
-    status = {
-        "document_id": doc["Document_ID"],
-        "method": "gemimg_scan_webp",
-        "output_file": str(out_path),
-        "returncode": proc.returncode,
-        "stdout": proc.stdout.strip(),
-        "stderr": proc.stderr.strip(),
-    }
-    if proc.returncode != 0:
-        raise RuntimeError(f"gemimg failed for {doc['Document_ID']}: {proc.stderr.strip() or proc.stdout.strip()}")
-    if not out_path.exists():
-        alt = out_path.parent / out_path.name
-        if alt.exists():
-            alt.rename(out_path)
-    if not out_path.exists():
-        raise RuntimeError(f"gemimg reported success but output not found: {out_path}")
-    return status
+    pages = list(paginate(rows, rows_per_page(CONTINUATION_TEXT_TOP), rows_per_page(FIRST_PAGE_TEXT_TOP)))
+    return pages or [[]]
+
+
+def scan_page_count(ir: DocumentIR) -> int:
+    return len(scan_layout(ir))
+
+
+def scan_page_path(out_path: Path, page_number: int) -> Path:
+    """Page 1 of a WEBP scan series is `out_path`; later pages are numbered siblings."""
+    if page_number == 1:
+        return out_path
+    return out_path.with_name(f"{out_path.stem}_page{page_number:02d}{out_path.suffix}")
+
+
+def scan_pages(doc: dict[str, Any], ir: DocumentIR, rng: random.Random) -> Iterator[Image.Image]:
+    """Yield finished scan pages one at a time, so only the page being drawn is held in memory."""
+    vp = doc["Structured_Content"]["visual_profile"]
+    pages = scan_layout(ir)
+    for number, rows in enumerate(pages, start=1):
+        with stage("layout"):
+            img = scan_chrome(doc["Document_Type"], vp.get("paper_tone", "gray_white"))
+            draw_scan_page(ir, rows, number, len(pages), img)
+        note_pixels(img.size)
+        with stage("artifacts"):
+            img = add_scan_artifacts(img, vp, rng)
+        yield img
+        del img  # release the finished page before the next one is drawn
+
+
+def draw_scan_page(ir: DocumentIR, rows: list[ScanRow], number: int, count: int, img: Image.Image) -> None:
+    draw = ImageDraw.Draw(img)
+    title_font = choose_font(42, bold=True)
+    label_font = choose_font(24, bold=True)
+    body_font, mono_font = scan_body_fonts()
+
+    draw.text((95, 82), ir.title[:70], fill=(25, 25, 25), font=title_font)
+    if number == 1:
+        draw.text((98, 150), f"Issuer: {ir.header.get('issuer')}", fill=(40, 40, 40), font=body_font)
+        draw.text((980, 150), f"Issue Date: {ir.header.get('issue_date')}", fill=(40, 40, 40), font=body_font)
+        draw.text((SCAN_TEXT_X, 285), "DOCUMENT CONTENT (SYNTHETIC FACSIMILE)", fill=(20, 20, 20), font=label_font)
+        y = FIRST_PAGE_TEXT_TOP
+    else:
+        draw.text((98, 150), "(continued)", fill=(40, 40, 40), font=body_font)
+        y = CONTINUATION_TEXT_TOP
+    if count > 1:
+        draw.text((SCAN_TEXT_X, 2290), f"Page {number} of {count}", fill=(60, 60, 60), font=body_font)
+    for chunk, mono in rows:
+        draw.text((SCAN_TEXT_X, y), chunk, fill=(30, 30, 30), font=mono_font if mono else body_font)
+        y += SCAN_LEADING
+
+
+SCAN_JPEG_QUALITY = 88
+THUMBNAIL_WIDTH = 320
+
+
+def encode_webp(img: Image.Image) -> bytes:
+    return WEBP.encode(img, quality=85)
+
+
+class ScanPdfWriter:
+    """Multi-page scanned PDF written to disk one page at a time.
+
+    Each page is a white letter page with the scan JPEG embedded unchanged (DCTDecode) and centred
+    inside the margins. A page's objects are written as soon as it is added and only their byte
+    offsets are kept, so memory does not grow with the page count (reportlab's canvas holds every
+    page until save). The file has no timestamps or IDs, so identical pages give identical bytes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.tmp = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.fh = self.tmp.open("wb")
+        self.fh.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self.offsets: dict[int, int] = {}
+        self.next_id = 3  # 1 is the catalog and 2 the page tree, both written by close()
+        self.page_ids: list[int] = []
+
+    def allocate(self, count: int) -> list[int]:
+        ids = list(range(self.next_id, self.next_id + count))
+        self.next_id += count
+        return ids
+
+    def write_object(self, obj_id: int, body: str, stream: bytes | None = None) -> None:
+        self.offsets[obj_id] = self.fh.tell()
+        self.fh.write(f"{obj_id} 0 obj\n{body}".encode("ascii"))
+        if stream is not None:
+            self.fh.write(b"\nstream\n" + stream + b"\nendstream")
+        self.fh.write(b"\nendobj\n")
+
+    def add_page(self, jpeg: bytes, size: tuple[int, int]) -> None:
+        page_w, page_h = letter
+        margin = 0.45 * inch
+        iw, ih = size
+        scale = min((page_w - 2 * margin) / iw, (page_h - 2 * margin) / ih)
+        draw_w, draw_h = iw * scale, ih * scale
+        x, y = (page_w - draw_w) / 2, (page_h - draw_h) / 2
+        image_id, content_id, page_id = self.allocate(3)
+        self.write_object(
+            image_id,
+            f"<< /Type /XObject /Subtype /Image /Width {iw} /Height {ih} /ColorSpace /DeviceRGB "
+            f"/BitsPerComponent 8 /Filter /DCTDecode /Length {len(jpeg)} >>",
+            jpeg,
+        )
+        content = (
+            f"1 1 1 rg 0 0 {page_w:.2f} {page_h:.2f} re f\n"
+            f"q {draw_w:.4f} 0 0 {draw_h:.4f} {x:.4f} {y:.4f} cm /Im0 Do Q\n"
+        ).encode("ascii")
+        self.write_object(content_id, f"<< /Length {len(content)} >>", content)
+        self.write_object(
+            page_id,
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_w:.2f} {page_h:.2f}] "
+            f"/Resources << /XObject << /Im0 {image_id} 0 R >> >> /Contents {content_id} 0 R >>",
+        )
+        self.page_ids.append(page_id)
+
+    def close(self) -> None:
+        kids = " ".join(f"{page_id} 0 R" for page_id in self.page_ids)
+        self.write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(self.page_ids)} >>")
+        self.write_object(1, "<< /Type /Catalog /Pages 2 0 R >>")
+        xref_offset = self.fh.tell()
+        lines = [f"xref\n0 {self.next_id}\n", "0000000000 65535 f \n"]
+        lines += [f"{self.offsets[obj_id]:010d} 00000 n \n" for obj_id in range(1, self.next_id)]
+        lines.append(f"trailer\n<< /Size {self.next_id} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n")
+        self.fh.write("".join(lines).encode("ascii"))
+        self.fh.close()
+        os.replace(self.tmp, self.path)
+
+    def abort(self) -> None:
+        self.fh.close()
+        self.tmp.unlink(missing_ok=True)
+
+
+def encode_scan_jpeg(img: Image.Image) -> bytes:
+    buf = BytesIO()
+    img.convert("RGB").save(buf, format="JPEG", quality=SCAN_JPEG_QUALITY)
+    return buf.getvalue()
+
+
+def encode_thumbnail(img: Image.Image) -> bytes:
+    buf = BytesIO()
+    img.reduce(max(1, img.width // THUMBNAIL_WIDTH)).save(buf, format="WEBP", quality=80)
+    return buf.getvalue()
+
+
+SCAN_METHODS = {"scanned_pdf", "simulated_scan_webp", "gemimg_scan_webp"}
+
+
+def write_output(path: Path, data: bytes) -> None:
+    with stage("write"):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+
+
+def render_scan(
+    doc: dict[str, Any],
+    ir: DocumentIR,
+    out_path: Path,
+    rng: random.Random,
+    thumbnail_path: Path | None = None,
+) -> None:
+    """Rasterize the scan page by page, encoding and writing each page before the next is drawn.
+
+    PDF scans become one multi-page PDF; WEBP scans become a numbered series (see scan_page_path).
+    The thumbnail is taken from the first page.
+    """
+    pdf = ScanPdfWriter(out_path) if out_path.suffix == ".pdf" else None
+    try:
+        for number, img in enumerate(scan_pages(doc, ir, rng), start=1):
+            with stage("encode"):
+                data = encode_scan_jpeg(img) if pdf is not None else encode_webp(img)
+            if pdf is not None:
+                with stage("write"):
+                    pdf.add_page(data, img.size)
+            else:
+                write_output(scan_page_path(out_path, number), data)
+            if number == 1 and thumbnail_path is not None:
+                with stage("thumbnail"):
+                    thumbnail = encode_thumbnail(img)
+                write_output(thumbnail_path, thumbnail)
+            del img
+    except BaseException:
+        if pdf is not None:
+            pdf.abort()
+        raise
+    if pdf is not None:
+        with stage("write"):
+            pdf.close()
+
+
+@dataclass(frozen=True)
+class GemimgSettings:
+    backend: str = "gemimg"
+    concurrency: int = 4
+    rate_per_sec: float = 1.0
+    timeout_sec: int = 240
+    retries: int = 2
+
+    def runner_kwargs(self) -> dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "concurrency": self.concurrency,
+            "rate_per_sec": self.rate_per_sec,
+            "timeout_sec": self.timeout_sec,
+            "retries": self.retries,
+        }
+
+
+def gemimg_engine_name(backend: str) -> str:
+    return "gemimg" if backend == "gemimg" else f"{backend}_gemimg"
+
+
+def gemimg_prompt(doc: dict[str, Any]) -> str:
+    return doc.get("Gemimg_Prompt") or f"Photorealistic scanned document image: {doc['Title']}"
+
+
+def generate_gemimg_webp(doc: dict[str, Any], out_path: Path, timeout_sec: int, backend: str = "gemimg") -> dict[str, Any]:
+    job = GemimgJob(doc["Document_ID"], gemimg_prompt(doc), out_path)
+    [result] = run_jobs([job], backend=backend, timeout_sec=timeout_sec, retries=0, rate_per_sec=0)
+    if result["status"] != "ok":
+        raise RuntimeError(f"gemimg failed for {doc['Document_ID']}: {result.get('error')}")
+    return {"document_id": doc["Document_ID"], "method": "gemimg_scan_webp", **result}
 
 
 def render_document(
@@ -637,33 +875,297 @@ def render_document(
     *,
     webp_backend: str,
     gemimg_timeout_sec: int,
+    thumbnail_path: Path | None = None,
 ) -> dict[str, Any]:
     method = doc["Rendering_Method"]
+    with stage("layout"):
+        ir = document_ir(doc)
     if method == "pristine_pdf":
-        render_pristine_pdf(doc, out_path)
+        with stage("render"):
+            render_pristine_pdf(ir, out_path)
         return {"engine": "local", "status": "ok"}
     if method == "scanned_pdf":
-        render_scanned_pdf(doc, out_path, rng)
+        render_scan(doc, ir, out_path, rng, thumbnail_path)
         return {"engine": "local", "status": "ok"}
     if method == "raw_text_pdf":
-        render_raw_text_pdf(doc, out_path)
+        with stage("render"):
+            render_raw_text_pdf(ir, out_path)
         return {"engine": "local", "status": "ok"}
     if method == "raw_text_txt":
-        render_raw_text_txt(doc, out_path)
+        with stage("render"):
+            render_raw_text_txt(ir, out_path)
         return {"engine": "local", "status": "ok"}
     if method in {"simulated_scan_webp", "gemimg_scan_webp"}:
-        if method == "gemimg_scan_webp" and webp_backend == "gemimg":
+        if method == "gemimg_scan_webp" and webp_backend in BACKENDS:
             try:
-                meta = generate_gemimg_webp(doc, out_path, gemimg_timeout_sec)
-                return {"engine": "gemimg", "status": "ok", **meta}
+                meta = generate_gemimg_webp(doc, out_path, gemimg_timeout_sec, webp_backend)
+                return {**meta, "engine": gemimg_engine_name(webp_backend), "status": "ok"}
             except Exception as exc:
-                render_scan_webp(doc, out_path, rng)
+                render_scan(doc, ir, out_path, rng, thumbnail_path)
                 return {"engine": "local_fallback", "status": "fallback", "error": str(exc)}
-        render_scan_webp(doc, out_path, rng)
+        render_scan(doc, ir, out_path, rng, thumbnail_path)
         return {"engine": "local", "status": "ok"}
     raise ValueError(f"Unsupported rendering method: {method}")
 
 
+def document_rng(seed: int, document_id: str) -> random.Random:
+    # String seeds are hashed with SHA-512, so this is stable across processes and PYTHONHASHSEED.
+    return random.Random(f"{seed}:{document_id}")
+
+
+@dataclass(frozen=True)
+class RenderTask:
+    doc: dict[str, Any]
+    out_path: Path
+    seed: int
+    webp_backend: str
+    gemimg_timeout_sec: int
+    cache: RenderCache | None = None
+    thumbnail_path: Path | None = None
+
+
+def task_payload(task: RenderTask) -> dict[str, Any]:
+    """JSON form of `task` for the render daemon, with this process's render settings."""
+    return {
+        "kind": "credit",
+        "doc": task.doc,
+        "out_path": str(task.out_path.resolve()),
+        "seed": task.seed,
+        "webp_backend": task.webp_backend,
+        "gemimg_timeout_sec": task.gemimg_timeout_sec,
+        "cache_dir": str(task.cache.root.resolve()) if task.cache else None,
+        "thumbnail_path": str(task.thumbnail_path.resolve()) if task.thumbnail_path else None,
+        "settings": current_settings(),
+    }
+
+
+def task_from_payload(payload: dict[str, Any]) -> RenderTask:
+    return RenderTask(
+        doc=payload["doc"],
+        out_path=Path(payload["out_path"]),
+        seed=payload["seed"],
+        webp_backend=payload["webp_backend"],
+        gemimg_timeout_sec=payload["gemimg_timeout_sec"],
+        cache=RenderCache(Path(payload["cache_dir"])) if payload["cache_dir"] else None,
+        thumbnail_path=Path(payload["thumbnail_path"]) if payload["thumbnail_path"] else None,
+    )
+
+
+def run_job(payload: dict[str, Any]) -> dict[str, Any]:
+    """Render one `task_payload` job; the render daemon's entry point for credit documents."""
+    apply_settings(payload["settings"])
+    return run_render_task(task_from_payload(payload))
+
+
+def render_cache_method(doc: dict[str, Any], webp_backend: str) -> str:
+    method = doc["Rendering_Method"]
+    return f"{method}:{webp_backend}" if method == "gemimg_scan_webp" else method
+
+
+def scan_series_paths(task: RenderTask) -> list[Path]:
+    """Continuation pages a local WEBP scan writes next to `out_path` (empty for single-page scans)."""
+    method = task.doc["Rendering_Method"]
+    if task.out_path.suffix != ".webp" or method not in SCAN_METHODS:
+        return []
+    if method == "gemimg_scan_webp" and task.webp_backend in BACKENDS:
+        return []
+    pages = scan_page_count(document_ir(task.doc))
+    return [scan_page_path(task.out_path, number) for number in range(2, pages + 1)]
+
+
+def task_extras(task: RenderTask) -> list[Path]:
+    return [*scan_series_paths(task), *([task.thumbnail_path] if task.thumbnail_path else [])]
+
+
+def render_outputs(task: RenderTask, meta: dict[str, Any]) -> list[Path]:
+    """Files the render described by `meta` wrote: a gemimg scan is `out_path` alone, a local render adds its extras."""
+    if not str(meta.get("engine", "local")).startswith("local"):
+        return [task.out_path]
+    return [task.out_path, *task_extras(replace(task, webp_backend="local"))]
+
+
+def render_key(task: RenderTask) -> str:
+    """Cache and journal key: the document plus every setting that changes its output files."""
+    method = render_cache_method(task.doc, task.webp_backend)
+    if task.thumbnail_path:
+        method += ":thumbnail"
+    if task.out_path.suffix == ".webp" and not WEBP.is_default:
+        method += f":webp-{WEBP.profile.name}"
+    return cache_key(task.doc, method, task.seed, RENDERER_VERSION)
+
+
+def run_render_task(task: RenderTask) -> dict[str, Any]:
+    extras = task_extras(task)
+    key = render_key(task)
+    with measure() as metrics:
+        meta = cached_render(
+            task.cache,
+            key,
+            task.out_path,
+            lambda: render_document(
+                task.doc,
+                task.out_path,
+                document_rng(task.seed, task.doc["Document_ID"]),
+                webp_backend=task.webp_backend,
+                gemimg_timeout_sec=task.gemimg_timeout_sec,
+                thumbnail_path=task.thumbnail_path,
+            ),
+            extras,
+        )
+    # Timings describe this run, not the cached render, so they are attached after the cache.
+    return {**meta, "metrics": metrics.finish([task.out_path, *extras])}
+
+
+def configure_worker(
+    template_dir: Path | None,
+    ir_dir: Path | None,
+    webp_profile: str,
+    distort_budget_mb: float,
+) -> None:
+    TEMPLATES.configure(template_dir)
+    IR_CACHE.configure(ir_dir)
+    WEBP.configure(webp_profile)
+    GEOMETRY.configure(distort_budget_mb)
+
+
+def run_render_tasks(tasks: list[RenderTask], jobs: int, daemon: Path | None = None) -> Iterable[dict[str, Any]]:
+    """Yield render metadata for each task, in task order, using up to `jobs` worker processes.
+
+    With `daemon`, the tasks are sent to the render daemon listening there instead (when one is).
+    """
+    client = connect(daemon) if tasks else None
+    if client is not None:
+        with client:
+            yield from client.render([task_payload(task) for task in tasks])
+        return
+    if jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            yield run_render_task(task)
+        return
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(tasks)),
+        initializer=configure_worker,
+        initargs=(TEMPLATES.root, IR_CACHE.root, WEBP.profile.name, GEOMETRY.budget_bytes / 2**20),
+    ) as pool:
+        yield from pool.map(run_render_task, tasks)
+
+
+def gemimg_key(task: RenderTask, backend: str) -> str:
+    return cache_key(task.doc, render_cache_method(task.doc, backend), task.seed, RENDERER_VERSION)
+
+
+def render_gemimg_batch(
+    tasks: list[RenderTask],
+    settings: GemimgSettings,
+    skip: Container[int] = (),
+) -> tuple[dict[int, dict[str, Any]], list[dict[str, Any]]]:
+    """Run every gemimg_scan_webp task through the async runner.
+
+    Returns render metadata keyed by task index (successes and cache hits only) plus the
+    per-job runner records, including failures, for the render manifest.
+    """
+    engine = gemimg_engine_name(settings.backend)
+    metas: dict[int, dict[str, Any]] = {}
+    pending: dict[str, tuple[int, str]] = {}
+    jobs: list[GemimgJob] = []
+    for index, task in enumerate(tasks):
+        if index in skip or task.doc["Rendering_Method"] != "gemimg_scan_webp":
+            continue
+        key = gemimg_key(task, settings.backend)
+        cached = task.cache.fetch(key, task.out_path) if task.cache else None
+        if cached is not None:
+            metas[index] = {**cached, "cache": "hit"}
+            continue
+        pending[task.doc["Document_ID"]] = (index, key)
+        jobs.append(GemimgJob(task.doc["Document_ID"], gemimg_prompt(task.doc), task.out_path))
+
+    if not jobs:
+        return metas, []
+    print(
+        f"Generating {len(jobs)} gemimg scans via {settings.backend} "
+        f"(concurrency={settings.concurrency}, rate={settings.rate_per_sec:g}/s, retries={settings.retries})"
+    )
+
+    def report(result: dict[str, Any]) -> None:
+        print(
+            f"  gemimg {result['document_id']}: {result['status']} in {result['wall_sec']:.1f}s "
+            f"({len(result['attempts'])} attempt(s))"
+        )
+
+    runs = run_jobs(jobs, on_result=report, **settings.runner_kwargs())
+    for result in runs:
+        if result["status"] != "ok":
+            continue
+        index, key = pending[result["document_id"]]
+        meta = {"engine": engine, "status": "ok", "method": "gemimg_scan_webp", **result}
+        if tasks[index].cache:
+            tasks[index].cache.store(key, tasks[index].out_path, meta)
+        metas[index] = {
+            **meta,
+            "cache": "miss" if tasks[index].cache else "off",
+            "metrics": external_metrics(result["wall_sec"], [tasks[index].out_path]),
+        }
+    return metas, runs
+
+
+def run_all_render_tasks(
+    tasks: list[RenderTask],
+    jobs: int,
+    gemimg_settings: GemimgSettings | None,
+    done: dict[int, dict[str, Any]] | None = None,
+    daemon: Path | None = None,
+    gemimg_failures: dict[str, str | None] | None = None,
+) -> tuple[Iterable[dict[str, Any]], list[dict[str, Any]]]:
+    """Render gemimg scans concurrently first, then everything else (and gemimg fallbacks) locally.
+
+    Tasks in `done` (by index) were finished by an earlier run and yield their recorded metadata.
+    Local renders go to the render daemon at `daemon` when one is listening there.
+    `gemimg_failures` (gemimg key -> error) remembers failed scans across calls, as in a watch
+    session: those documents fall back to the local renderer without asking gemimg again, and
+    new failures are added to it.
+    """
+    done = done or {}
+    remote: dict[int, dict[str, Any]] = {}
+    runs: list[dict[str, Any]] = []
+    failures: dict[str, str | None] = {}
+    if gemimg_settings is not None:
+        keys = {
+            index: gemimg_key(task, gemimg_settings.backend)
+            for index, task in enumerate(tasks)
+            if index not in done and task.doc["Rendering_Method"] == "gemimg_scan_webp"
+        }
+        known = gemimg_failures if gemimg_failures is not None else {}
+        remembered = {index for index, key in keys.items() if key in known}
+        failures = {tasks[index].doc["Document_ID"]: known[keys[index]] for index in remembered}
+        remote, runs = render_gemimg_batch(tasks, gemimg_settings, skip={*done, *remembered})
+        index_by_id = {tasks[index].doc["Document_ID"]: index for index in keys}
+        for run in runs:
+            if run["status"] != "ok":
+                failures[run["document_id"]] = run.get("error")
+                if gemimg_failures is not None:
+                    gemimg_failures[keys[index_by_id[run["document_id"]]]] = run.get("error")
+    local_tasks = [
+        replace(task, webp_backend="local") for i, task in enumerate(tasks) if i not in remote and i not in done
+    ]
+
+    def ordered() -> Iterable[dict[str, Any]]:
+        local_results = iter(run_render_tasks(local_tasks, jobs, daemon))
+        for index, task in enumerate(tasks):
+            if index in done:
+                yield done[index]
+                continue
+            if index in remote:
+                yield remote[index]
+                continue
+            meta = next(local_results)
+            document_id = task.doc["Document_ID"]
+            if document_id in failures:
+                meta = {**meta, "engine": "local_fallback", "status": "fallback", "error": failures[document_id]}
+            yield meta
+
+    return ordered(), runs
+
+
 def build_gemimg_job(doc: dict[str, Any], out_path: Path) -> dict[str, Any]:
     return {
         "document_id": doc["Document_ID"],
@@ -675,107 +1177,99 @@ def build_gemimg_job(doc: dict[str, Any], out_path: Path) -> dict[str, Any]:
     }
 
 
-def run_gemimg_samples(jobs: list[dict[str, Any]], out_dir: Path, count: int) -> list[dict[str, Any]]:
+def run_gemimg_samples(
+    jobs: list[dict[str, Any]],
+    out_dir: Path,
+    count: int,
+    settings: GemimgSettings,
+) -> list[dict[str, Any]]:
     out_dir.mkdir(parents=True, exist_ok=True)
-    results: list[dict[str, Any]] = []
-    for job in jobs[:count]:
-        out_name = f"{job['document_id']}_gemimg_preview.webp"
-        out_path = out_dir / out_name
-        cmd = [
-            "uvx",
-            "gemimg",
-            "--webp",
-            "--force",
-            "-o",
-            out_name,
-            job["prompt"],
-        ]
-        status = {"document_id": job["document_id"], "output_file": str(out_path), "status": "ok"}
-        try:
-            proc = subprocess.run(
-                cmd,
-                check=True,
-                capture_output=True,
-                text=True,
-                timeout=240,
-                cwd=out_dir,
-                env=os.environ.copy(),
-            )
-            status["stdout"] = proc.stdout.strip()
-        except Exception as exc:  # pragma: no cover - best-effort supplemental output
-            status["status"] = "failed"
-            status["error"] = str(exc)
-        results.append(status)
-    return results
+    sample_jobs = [
+        GemimgJob(job["document_id"], job["prompt"], out_dir / f"{job['document_id']}_gemimg_preview.webp")
+        for job in jobs[:count]
+    ]
+    return run_jobs(sample_jobs, **settings.runner_kwargs())
 
 
-def make_contact_sheet(image_paths: list[Path], out_path: Path) -> None:
-    if not image_paths:
-        return
-    cols = 4
-    cell_w, cell_h = 360, 500
-    rows = math.ceil(len(image_paths) / cols)
-    sheet = Image.new("RGB", (cols * cell_w, rows * cell_h + 50), (246, 246, 246))
-    draw = ImageDraw.Draw(sheet)
-    font = choose_font(20, bold=True)
-    small = choose_font(16)
-    draw.text((20, 14), "Synthetic Scan-Style Preview (local renderer)", fill=(20, 20, 20), font=font)
-
-    for i, path in enumerate(image_paths):
-        row = i // cols
-        col = i % cols
-        x0 = col * cell_w + 12
-        y0 = row * cell_h + 56
+def write_manifest(path: Path, payload: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+    tmp.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+@dataclass(frozen=True)
+class Shard:
+    """One of `count` deterministic slices of the applicant list; `index` is 1-based."""
+
+    index: int
+    count: int
+
+    @classmethod
+    def parse(cls, value: str) -> Shard:
         try:
-            img = Image.open(path).convert("RGB")
-        except Exception:
-            continue
-        thumb = ImageOps.contain(img, (cell_w - 24, cell_h - 78))
-        card = Image.new("RGB", (cell_w - 18, cell_h - 26), "white")
-        card_draw = ImageDraw.Draw(card)
-        card_draw.rectangle((0, 0, card.width - 1, card.height - 1), outline=(180, 180, 180))
-        card.paste(thumb, ((card.width - thumb.width) // 2, 8))
-        label = path.name[:38]
-        card_draw.text((10, card.height - 42), label, fill=(40, 40, 40), font=small)
-        sheet.paste(card, (x0, y0))
+            index, count = (int(part) for part in value.split("/"))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"expected i/N, got {value!r}") from None
+        if not 1 <= index <= count:
+            raise argparse.ArgumentTypeError(f"shard index must be between 1 and {count}, got {index}")
+        return cls(index, count)
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    sheet.save(out_path, format="WEBP", quality=88, method=6)
+    def owns(self, applicant_index: int) -> bool:
+        return applicant_index % self.count == self.index - 1
 
+    @property
+    def label(self) -> str:
+        return f"{self.index:03d}-of-{self.count:03d}"
 
-def write_manifest(path: Path, payload: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
 
+def shard_manifest_path(manifests_dir: Path, shard: Shard) -> Path:
+    return manifests_dir / "shards" / f"render_manifest.shard-{shard.label}.json"
 
-def main() -> None:
-    args = parse_args()
-    data = load_json(args.input)
-    rng = random.Random(args.seed)
-    applicants_dir = args.output_dir
-    data_root = applicants_dir.parent
-    manifests_dir = data_root / "manifests"
-    previews_dir = data_root / "previews"
 
-    applicants_dir.mkdir(parents=True, exist_ok=True)
-    manifests_dir.mkdir(parents=True, exist_ok=True)
-    previews_dir.mkdir(parents=True, exist_ok=True)
+def journal_path(manifests_dir: Path, shard: Shard | None) -> Path:
+    suffix = f".shard-{shard.label}" if shard else ""
+    return manifests_dir / f"render_journal{suffix}.jsonl"
 
-    total_docs_expected = sum(len(a["Document_Bundle"]) for a in data["applicants"])
 
-    manifest: dict[str, Any] = {
-        "dataset_id": data["dataset_id"],
-        "generated_on": data["generated_on"],
-        "rendered_to": str(applicants_dir),
-        "manifests_dir": str(manifests_dir),
-        "previews_dir": str(previews_dir),
-        "webp_backend": args.webp_backend,
-        "applicants": [],
-    }
+def classify_bundle(format_counts: dict[str, int]) -> str:
+    if set(format_counts) == {"pdf"}:
+        return "pdf_only"
+    if set(format_counts) == {"webp"}:
+        return "image_only"
+    if set(format_counts) == {"txt"}:
+        return "text_only"
+    return "mixed"
+
+
+def render_applicants(
+    args: argparse.Namespace,
+    data: dict[str, Any],
+    applicant_indices: list[int],
+    jobs: int,
+    gemimg_settings: GemimgSettings,
+    journal: RenderJournal,
+    quiet: bool = False,
+    gemimg_failures: dict[str, str | None] | None = None,
+) -> dict[str, Any]:
+    """Render the given applicants and return a partial manifest that `write_render_outputs` can merge.
+
+    Every finished document is appended to `journal`; documents it already holds with matching
+    output hashes are skipped, so an interrupted run picks up where it stopped. `quiet` reports
+    only the documents actually rendered. `gemimg_failures` is passed to `run_all_render_tasks`.
+    """
+    applicants_dir = args.output_dir
+    previews_dir = applicants_dir.parent / "previews"
+    applicants = [data["applicants"][index] for index in applicant_indices]
+    total_docs_expected = sum(len(a["Document_Bundle"]) for a in applicants)
+
     gemimg_jobs: list[dict[str, Any]] = []
-    scan_images_for_preview: list[Path] = []
+    scan_images: list[str] = []
     total_docs = 0
     render_engine_counts: dict[str, int] = {}
+    render_samples: list[tuple[str, dict[str, Any]]] = []
+    cache_counts = {"hits": 0, "misses": 0}
+    cache = None if args.no_cache else RenderCache(args.cache_dir)
     bundle_mix_summary = {
         "pdf_only": 0,
         "image_only": 0,
@@ -783,11 +1277,51 @@ def main() -> None:
         "mixed": 0,
         "contains_txt": 0,
     }
+    app_records: list[dict[str, Any]] = []
 
-    for applicant_index, applicant in enumerate(data["applicants"], start=1):
+    folders: list[Path] = []
+    tasks: list[RenderTask] = []
+    for applicant in applicants:
         name_slug = slugify(applicant["Persona"]["full_name"])
         folder = applicants_dir / f"{applicant['Applicant_ID']}_{name_slug}"
         folder.mkdir(parents=True, exist_ok=True)
+        folders.append(folder)
+        for doc in applicant["Document_Bundle"]:
+            tasks.append(
+                RenderTask(
+                    doc=doc,
+                    out_path=folder / doc["Output_File_Name"],
+                    seed=args.seed,
+                    webp_backend=args.webp_backend,
+                    gemimg_timeout_sec=args.gemimg_timeout_sec,
+                    cache=cache,
+                    thumbnail_path=(
+                        previews_dir / "thumbnails" / f"{doc['Document_ID']}.webp"
+                        if args.thumbnails and doc["Rendering_Method"] in SCAN_METHODS
+                        else None
+                    ),
+                )
+            )
+
+    keys = [render_key(task) for task in tasks]
+    done = journal.resume(keys)
+    if done and not quiet:
+        print(f"Resuming: {len(done)}/{len(tasks)} documents verified from {journal.path.relative_to(ROOT)}")
+    if args.daemon:
+        print(f"Rendering {total_docs_expected - len(done)} documents via the render daemon at {args.daemon}")
+    elif jobs > 1:
+        print(f"Rendering {total_docs_expected - len(done)} documents with {jobs} worker processes")
+    results, gemimg_runs = run_all_render_tasks(
+        tasks,
+        jobs,
+        gemimg_settings if args.webp_backend in BACKENDS else None,
+        done,
+        args.daemon,
+        gemimg_failures,
+    )
+    results = iter(results)
+
+    for applicant_number, (applicant, folder) in enumerate(zip(applicants, folders), start=1):
         app_record = {
             "Applicant_ID": applicant["Applicant_ID"],
             "Archetype_Code": applicant["Archetype_Code"],
@@ -797,60 +1331,163 @@ def main() -> None:
         }
         format_counts: dict[str, int] = {}
         for doc in applicant["Document_Bundle"]:
-            out_path = folder / doc["Output_File_Name"]
+            task_index = total_docs
+            task = tasks[task_index]
+            out_path = task.out_path
+            render_meta = next(results)
             total_docs += 1
-            print(
-                f"[{total_docs}/{total_docs_expected}] Rendering {applicant['Applicant_ID']} "
-                f"{doc['Document_ID']} -> {out_path.name}"
-            )
-            render_meta = render_document(
-                doc,
-                out_path,
-                rng,
-                webp_backend=args.webp_backend,
-                gemimg_timeout_sec=args.gemimg_timeout_sec,
-            )
+            if task_index in done:
+                note = " (resumed)"
+            else:
+                note = " (cached)" if render_meta.get("cache") == "hit" else ""
+                # Fallbacks are finished too: a resumed run must not send them back to gemimg.
+                if render_meta.get("status") in {"ok", "fallback"}:
+                    try:
+                        journal.record(keys[task_index], render_outputs(task, render_meta), render_meta)
+                    except MissingOutputError as exc:
+                        raise SystemExit(f"{doc['Document_ID']}: {exc}") from None
+            if not (quiet and task_index in done):
+                print(
+                    f"[{total_docs}/{total_docs_expected}] Rendered {applicant['Applicant_ID']} "
+                    f"{doc['Document_ID']} -> {out_path.name}{note}"
+                )
+            tally(cache_counts, render_meta)
             engine_key = str(render_meta.get("engine", "local"))
             render_engine_counts[engine_key] = render_engine_counts.get(engine_key, 0) + 1
 
             fmt = doc["Document_Format"]
             format_counts[fmt] = format_counts.get(fmt, 0) + 1
-            app_record["Documents"].append(
-                {
-                    "Document_ID": doc["Document_ID"],
-                    "Document_Type": doc["Document_Type"],
-                    "Document_Format": doc["Document_Format"],
-                    "Rendering_Method": doc["Rendering_Method"],
-                    "Render_Engine": render_meta.get("engine"),
-                    "Render_Status": render_meta.get("status"),
-                    "Output_File": str(out_path.relative_to(ROOT)),
-                }
-            )
+            doc_record = {
+                "Document_ID": doc["Document_ID"],
+                "Document_Type": doc["Document_Type"],
+                "Document_Format": doc["Document_Format"],
+                "Rendering_Method": doc["Rendering_Method"],
+                "Render_Engine": render_meta.get("engine"),
+                "Render_Status": render_meta.get("status"),
+                "Output_File": str(out_path.relative_to(ROOT)),
+            }
+            local_task = replace(task, webp_backend="local") if engine_key.startswith("local") else task
+            page_files = [str(path.relative_to(ROOT)) for path in scan_series_paths(local_task) if path.exists()]
+            if page_files:
+                doc_record["Page_Files"] = page_files
+            if task.thumbnail_path and task.thumbnail_path.exists():
+                doc_record["Thumbnail_File"] = str(task.thumbnail_path.relative_to(ROOT))
+            if "metrics" in render_meta:
+                doc_record["Render_Metrics"] = render_meta["metrics"]
+                if render_meta.get("cache") != "hit":
+                    render_samples.append((doc["Rendering_Method"], render_meta["metrics"]))
+            app_record["Documents"].append(doc_record)
             if doc["Document_Format"] == "webp":
-                scan_images_for_preview.append(out_path)
+                scan_images.extend([str(out_path.relative_to(ROOT)), *page_files])
             if doc["Rendering_Method"] == "gemimg_scan_webp" and doc.get("Gemimg_Prompt"):
                 gemimg_jobs.append(build_gemimg_job(doc, out_path))
         app_record["Format_Counts"] = format_counts
         app_record["Format_Mix"] = sorted(format_counts.keys())
         if "txt" in format_counts:
             bundle_mix_summary["contains_txt"] += 1
-        if set(format_counts) == {"pdf"}:
-            bundle_mix_summary["pdf_only"] += 1
-        elif set(format_counts) == {"webp"}:
-            bundle_mix_summary["image_only"] += 1
-        elif set(format_counts) == {"txt"}:
-            bundle_mix_summary["text_only"] += 1
-        else:
-            bundle_mix_summary["mixed"] += 1
+        bundle_mix_summary[classify_bundle(format_counts)] += 1
 
         pdf_count = format_counts.get("pdf", 0)
         webp_count = format_counts.get("webp", 0)
         txt_count = format_counts.get("txt", 0)
-        print(
-            f"  -> mix for {applicant['Applicant_ID']} (applicant {applicant_index}/{len(data['applicants'])}): "
-            f"pdf={pdf_count}, webp={webp_count}, txt={txt_count}"
-        )
-        manifest["applicants"].append(app_record)
+        if not quiet:
+            print(
+                f"  -> mix for {applicant['Applicant_ID']} (applicant {applicant_number}/{len(applicants)}): "
+                f"pdf={pdf_count}, webp={webp_count}, txt={txt_count}"
+            )
+        app_records.append(app_record)
+
+    return {
+        "applicant_indices": applicant_indices,
+        "applicants": app_records,
+        "total_documents": total_docs,
+        "resumed_documents": len(done),
+        "gemimg_jobs": gemimg_jobs,
+        "scan_images": scan_images,
+        "bundle_mix_summary": bundle_mix_summary,
+        "render_engine_counts": render_engine_counts,
+        "render_cache": {"enabled": cache is not None, **cache_counts},
+        "render_samples": render_samples,
+        "gemimg_runs": gemimg_runs,
+    }
+
+
+def load_shard_manifests(manifests_dir: Path) -> list[dict[str, Any]]:
+    """Read every shard's partial manifest, checking that exactly one complete set is present."""
+    paths = sorted((manifests_dir / "shards").glob("render_manifest.shard-*.json"))
+    if not paths:
+        raise SystemExit(f"No shard manifests under {manifests_dir / 'shards'}")
+    partials = [load_json(path) for path in paths]
+    counts = {partial["shard"]["count"] for partial in partials}
+    if len(counts) != 1:
+        raise SystemExit(f"Shard manifests from different shard counts {sorted(counts)}; remove the stale ones first")
+    count = counts.pop()
+    missing = sorted(set(range(1, count + 1)) - {partial["shard"]["index"] for partial in partials})
+    if missing:
+        raise SystemExit(f"Missing shard manifests for shard(s) {', '.join(f'{i}/{count}' for i in missing)}")
+    return partials
+
+
+def merge_partials(partials: list[dict[str, Any]]) -> dict[str, Any]:
+    """Combine partial manifests into one, restoring the input order of applicants and their jobs."""
+    records = [
+        (index, record)
+        for partial in partials
+        for index, record in zip(partial["applicant_indices"], partial["applicants"])
+    ]
+    records.sort(key=lambda item: item[0])
+    documents = [doc for _, record in records for doc in record["Documents"]]
+    jobs_by_document = {job["document_id"]: job for partial in partials for job in partial["gemimg_jobs"]}
+
+    merged: dict[str, Any] = {
+        "applicants": [record for _, record in records],
+        "total_documents": sum(partial["total_documents"] for partial in partials),
+        "gemimg_jobs": [jobs_by_document[doc["Document_ID"]] for doc in documents if doc["Document_ID"] in jobs_by_document],
+        "scan_images": [
+            path
+            for doc in documents
+            if doc["Document_Format"] == "webp"
+            for path in [doc["Output_File"], *doc.get("Page_Files", [])]
+        ],
+        "bundle_mix_summary": {},
+        "render_engine_counts": {},
+        "render_cache": {"enabled": all(p["render_cache"]["enabled"] for p in partials), "hits": 0, "misses": 0},
+        "render_samples": [sample for partial in partials for sample in partial["render_samples"]],
+        "gemimg_runs": [run for partial in partials for run in partial["gemimg_runs"]],
+    }
+    for partial in partials:
+        for field in ("bundle_mix_summary", "render_engine_counts"):
+            for key, value in partial[field].items():
+                merged[field][key] = merged[field].get(key, 0) + value
+        merged["render_cache"]["hits"] += partial["render_cache"]["hits"]
+        merged["render_cache"]["misses"] += partial["render_cache"]["misses"]
+    return merged
+
+
+def write_render_outputs(
+    args: argparse.Namespace,
+    data: dict[str, Any],
+    rendered: dict[str, Any],
+    jobs: int,
+    gemimg_settings: GemimgSettings,
+) -> None:
+    """Write gemimg_jobs.json, preview sheets and render_manifest.json for a complete (or merged) render."""
+    applicants_dir = args.output_dir
+    data_root = applicants_dir.parent
+    manifests_dir = data_root / "manifests"
+    previews_dir = data_root / "previews"
+    gemimg_jobs = rendered["gemimg_jobs"]
+
+    manifest: dict[str, Any] = {
+        "dataset_id": data["dataset_id"],
+        "generated_on": data["generated_on"],
+        "rendered_to": str(applicants_dir),
+        "manifests_dir": str(manifests_dir),
+        "previews_dir": str(previews_dir),
+        "webp_backend": args.webp_backend,
+        "webp_profile": args.webp_profile,
+        "applicants": rendered["applicants"],
+    }
 
     gemimg_jobs_path = manifests_dir / "gemimg_jobs.json"
     write_manifest(gemimg_jobs_path, {"jobs": gemimg_jobs})
@@ -869,31 +1506,188 @@ def main() -> None:
     helper.chmod(0o755)
 
     preview_path = previews_dir / "scan_contact_sheet.webp"
-    make_contact_sheet(scan_images_for_preview[:12], preview_path)
+    preview_sheets = build_contact_sheets([ROOT / path for path in rendered["scan_images"]], preview_path, jobs=jobs)
 
     gemimg_results: list[dict[str, Any]] = []
     if args.gemimg_samples > 0 and gemimg_jobs:
-        gemimg_results = run_gemimg_samples(gemimg_jobs, previews_dir / "gemimg_samples", args.gemimg_samples)
+        gemimg_results = run_gemimg_samples(
+            gemimg_jobs,
+            previews_dir / "gemimg_samples",
+            args.gemimg_samples,
+            gemimg_settings,
+        )
 
-    manifest["total_applicants"] = len(data["applicants"])
-    manifest["total_documents"] = total_docs
+    manifest["total_applicants"] = len(rendered["applicants"])
+    manifest["total_documents"] = rendered["total_documents"]
     manifest["gemimg_job_count"] = len(gemimg_jobs)
-    manifest["bundle_mix_summary"] = bundle_mix_summary
-    manifest["render_engine_counts"] = render_engine_counts
-    manifest["preview_contact_sheet"] = str(preview_path.relative_to(ROOT)) if preview_path.exists() else None
+    manifest["bundle_mix_summary"] = rendered["bundle_mix_summary"]
+    manifest["render_engine_counts"] = rendered["render_engine_counts"]
+    manifest["render_cache"] = rendered["render_cache"]
+    # Cache hits only time a file copy, so they are left out of the per-method table.
+    manifest["render_metrics_by_method"] = aggregate(rendered["render_samples"])
+    manifest["preview_contact_sheet"] = str(preview_sheets[0].relative_to(ROOT)) if preview_sheets else None
+    manifest["preview_contact_sheets"] = [str(path.relative_to(ROOT)) for path in preview_sheets]
+    if rendered["gemimg_runs"]:
+        manifest["gemimg_runner"] = gemimg_settings.runner_kwargs()
+        manifest["gemimg_runs"] = rendered["gemimg_runs"]
     if gemimg_results:
         manifest["gemimg_sample_results"] = gemimg_results
 
-    write_manifest(manifests_dir / "render_manifest.json", manifest)
+    manifest_path = manifests_dir / "render_manifest.json"
+    write_manifest(manifest_path, manifest)
+    update_catalog(None if args.no_catalog else args.catalog, manifest, manifest["applicants"], "render", manifest_path)
 
-    print(f"Rendered {total_docs} documents for {len(data['applicants'])} applicants -> {applicants_dir.relative_to(ROOT)}")
+    print(
+        f"Rendered {rendered['total_documents']} documents for {len(rendered['applicants'])} applicants "
+        f"-> {applicants_dir.relative_to(ROOT)}"
+    )
     print(f"Gemimg-ready scan jobs: {len(gemimg_jobs)} (see {gemimg_jobs_path.relative_to(ROOT)})")
-    if preview_path.exists():
-        print(f"Preview contact sheet: {preview_path.relative_to(ROOT)}")
+    if preview_sheets:
+        print(f"Preview contact sheets: {len(preview_sheets)} starting at {preview_sheets[0].relative_to(ROOT)}")
     if gemimg_results:
         ok_count = sum(1 for r in gemimg_results if r.get('status') == 'ok')
         print(f"Gemimg sample renders: {ok_count}/{len(gemimg_results)} succeeded")
 
 
+def document_records(data: dict[str, Any]) -> dict[str, Any]:
+    """Document_ID -> everything its output files depend on: the document and its applicant folder."""
+    return {
+        doc["Document_ID"]: {"folder": [applicant["Applicant_ID"], applicant["Persona"]["full_name"]], "doc": doc}
+        for applicant in data["applicants"]
+        for doc in applicant["Document_Bundle"]
+    }
+
+
+def applicant_records(data: dict[str, Any]) -> dict[str, Any]:
+    return {
+        applicant["Applicant_ID"]: {key: value for key, value in applicant.items() if key != "Document_Bundle"}
+        for applicant in data["applicants"]
+    }
+
+
+def rendered_outputs(rendered: dict[str, Any]) -> set[Path]:
+    return {
+        ROOT / path
+        for record in rendered["applicants"]
+        for doc in record["Documents"]
+        for path in [doc["Output_File"], *doc.get("Page_Files", []), *filter(None, [doc.get("Thumbnail_File")])]
+    }
+
+
+def watch_input(
+    args: argparse.Namespace,
+    data: dict[str, Any],
+    rendered: dict[str, Any],
+    jobs: int,
+    gemimg_settings: GemimgSettings,
+    journal: RenderJournal,
+    gemimg_failures: dict[str, str | None],
+) -> None:
+    """Re-render after every structural change to --input until interrupted.
+
+    Unchanged documents resume from `journal` (gemimg fallbacks included), so each change costs
+    only the documents it touches plus rewriting the manifest and contact sheets (whose thumbnails
+    are cached by content). A scan gemimg already failed on this session, e.g. a document edited
+    back to an earlier version, falls back locally without retrying. Outputs of removed or renamed
+    documents are deleted.
+    """
+    watcher = ManifestWatcher([args.input], args.watch_interval)
+    print(f"Watching {args.input} every {args.watch_interval:g}s (Ctrl-C to stop)")
+    changes = 0
+    for _, saved_at in watcher.changes():
+        new_data = load_json_if_valid(args.input)
+        if new_data is None:
+            print(f"{args.input.name} is not valid JSON yet; waiting for the next save")
+            continue
+        if new_data == data:
+            print(f"{args.input.name} saved without structural changes")
+            continue
+        changes += 1
+        started = time.perf_counter()
+        documents = diff_records(document_records(data), document_records(new_data))
+        applicants = diff_records(applicant_records(data), applicant_records(new_data))
+        indices = list(range(len(new_data["applicants"])))
+        new_rendered = render_applicants(
+            args, new_data, indices, jobs, gemimg_settings, journal, quiet=True, gemimg_failures=gemimg_failures
+        )
+        for stale in rendered_outputs(rendered) - rendered_outputs(new_rendered):
+            stale.unlink(missing_ok=True)
+        write_render_outputs(args, new_data, new_rendered, jobs, gemimg_settings)
+        data, rendered = new_data, new_rendered
+        rerendered = rendered["total_documents"] - rendered["resumed_documents"]
+        print(
+            f"Change {changes}: documents {documents.summary()}; applicants {applicants.summary()} -> "
+            f"{rerendered} document(s) rendered, outputs updated in {time.perf_counter() - started:.2f}s "
+            f"({time.time() - saved_at:.2f}s after save)"
+        )
+
+
+def main() -> None:
+    args = parse_args()
+    TEMPLATES.configure(args.template_dir)
+    IR_CACHE.configure(None if args.no_cache else IR_CACHE_DIR)
+    WEBP.configure(args.webp_profile)
+    GEOMETRY.configure(args.distort_budget_mb)
+    data = load_json(args.input)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    manifests_dir = args.output_dir.parent / "manifests"
+    for path in (args.output_dir, manifests_dir, args.output_dir.parent / "previews"):
+        path.mkdir(parents=True, exist_ok=True)
+
+    gemimg_settings = GemimgSettings(
+        backend=args.webp_backend if args.webp_backend in BACKENDS else "gemimg",
+        concurrency=args.gemimg_concurrency,
+        rate_per_sec=args.gemimg_rate,
+        timeout_sec=args.gemimg_timeout_sec,
+        retries=args.gemimg_retries,
+    )
+
+    if args.merge_shards and args.shard:
+        raise SystemExit("--merge-shards combines finished shards; run it without --shard")
+    if args.watch and (args.shard or args.merge_shards):
+        raise SystemExit("--watch re-renders the whole input; run it without --shard or --merge-shards")
+    if args.merge_shards:
+        partials = load_shard_manifests(manifests_dir)
+        print(f"Merging {len(partials)} shard manifests from {(manifests_dir / 'shards').relative_to(ROOT)}")
+        write_render_outputs(args, data, merge_partials(partials), jobs, gemimg_settings)
+        return
+
+    indices = list(range(len(data["applicants"])))
+    if args.shard:
+        indices = [index for index in indices if args.shard.owns(index)]
+    journal = RenderJournal(journal_path(manifests_dir, args.shard))
+    if args.fresh:
+        journal.discard()
+    # A watch session remembers gemimg failures so edits never wait on the same failing scan twice.
+    gemimg_failures: dict[str, str | None] = {}
+    rendered = render_applicants(
+        args, data, indices, jobs, gemimg_settings, journal, gemimg_failures=gemimg_failures if args.watch else None
+    )
+
+    cache_counts = rendered["render_cache"]
+    if cache_counts["enabled"]:
+        print(f"Render cache: {cache_counts['hits']} hits, {cache_counts['misses']} misses ({args.cache_dir})")
+    if jobs <= 1 and not args.daemon:
+        print(f"Font registry: {FONT_REGISTRY.hits} hits, {FONT_REGISTRY.misses} misses")
+        print(f"Page templates: {TEMPLATES.hits} hits, {TEMPLATES.misses} misses ({TEMPLATES.disk_hits} from disk)")
+        print(f"Document IR: {IR_CACHE.hits} hits, {IR_CACHE.misses} misses ({IR_CACHE.disk_hits} from disk)")
+
+    if args.shard:
+        shard_path = shard_manifest_path(manifests_dir, args.shard)
+        write_manifest(shard_path, {"shard": {"index": args.shard.index, "count": args.shard.count}, **rendered})
+        print(
+            f"Shard {args.shard.index}/{args.shard.count}: rendered {rendered['total_documents']} documents for "
+            f"{len(indices)} applicants -> {shard_path.relative_to(ROOT)}; run --merge-shards once every shard is done"
+        )
+    else:
+        write_render_outputs(args, data, rendered, jobs, gemimg_settings)
+    if args.watch:
+        try:
+            watch_input(args, data, rendered, jobs, gemimg_settings, journal, gemimg_failures)
+        except KeyboardInterrupt:
+            print("Stopped watching")
+    journal.discard()
+
+
 if __name__ == "__main__":
     main()
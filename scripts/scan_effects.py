@@ -0,0 +1,266 @@
+"""Array-based scan and photo degradation effects applied in one banded pass over a uint8 buffer.
+
+Effects are small frozen dataclasses describing *what* to draw. `apply_effects` walks the image in
+horizontal bands, promotes only the current band to float32, applies every effect that touches it
+in list order and writes the band back, so peak memory is one uint8 copy plus one float band
+regardless of how many effects are stacked.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Protocol
+
+import numpy as np
+from PIL import Image
+
+BAND_ROWS = 256
+RGB = tuple[int, int, int]
+Box = tuple[int, int, int, int]
+LUMA = np.asarray([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+class Effect(Protocol):
+    def apply(self, band: np.ndarray, top: int, gen: np.random.Generator) -> None: ...
+
+
+def clip_rows(band: np.ndarray, top: int, y0: int, y1: int) -> tuple[int, int] | None:
+    lo, hi = max(y0, top), min(y1, top + band.shape[0])
+    return (lo - top, hi - top) if lo < hi else None
+
+
+NOISE_TILE_SHAPE = (1024, 2048)
+_noise_tiles: dict[str, np.ndarray] = {}
+
+
+def noise_tile(kind: str) -> np.ndarray:
+    """Per-process tile of uniform [0, 1) or standard-normal noise; bands sample it at random offsets.
+
+    Grain and sensor noise are independent per pixel, so reusing one tile at random offsets is
+    indistinguishable from fresh noise and skips generating millions of variates per page.
+    """
+    if kind not in _noise_tiles:
+        gen = np.random.default_rng(0x5CA7)
+        shape = (*NOISE_TILE_SHAPE, 1)
+        tile = gen.random(shape, dtype=np.float32) if kind == "uniform" else gen.standard_normal(shape, dtype=np.float32)
+        _noise_tiles[kind] = tile
+    return _noise_tiles[kind]
+
+
+def noise_window(kind: str, rows: int, cols: int, gen: np.random.Generator) -> np.ndarray:
+    tile = noise_tile(kind)
+    if rows > tile.shape[0] or cols > tile.shape[1]:
+        shape = (rows, cols, 1)
+        return gen.random(shape, dtype=np.float32) if kind == "uniform" else gen.standard_normal(shape, dtype=np.float32)
+    y = int(gen.integers(0, tile.shape[0] - rows + 1))
+    x = int(gen.integers(0, tile.shape[1] - cols + 1))
+    return tile[y : y + rows, x : x + cols]
+
+
+@dataclass(frozen=True)
+class PaperTexture:
+    """Multiply by per-pixel uniform grain in [low, high] (0-255 scale), like paper fibre."""
+
+    low: float = 209.8
+    high: float = 230.2
+
+    def apply(self, band: np.ndarray, top: int, gen: np.random.Generator) -> None:
+        grain = noise_window("uniform", *band.shape[:2], gen) * ((self.high - self.low) / 255.0)
+        grain += self.low / 255.0
+        band *= grain
+
+
+@dataclass(frozen=True)
+class Brightness:
+    factor: float
+
+    def apply(self, band: np.ndarray, top: int, gen: np.random.Generator) -> None:
+        band *= self.factor
+
+
+def ellipse_spans(box: Box, y: int, inset: float = 0.0) -> tuple[int, int] | None:
+    """Inclusive x-range covered by row `y` of the ellipse inscribed in `box`, shrunk by `inset` px."""
+    x0, y0, x1, y1 = box
+    rx, ry = (x1 - x0) / 2 - inset, (y1 - y0) / 2 - inset
+    if rx <= 0 or ry <= 0:
+        return None
+    dy = (y - (y0 + y1) / 2) / ry
+    if abs(dy) > 1.0:
+        return None
+    half = rx * math.sqrt(1.0 - dy * dy)
+    cx = (x0 + x1) / 2
+    return math.ceil(cx - half), math.floor(cx + half)
+
+
+def blend_span(row: np.ndarray, xa: int, xb: int, color: np.ndarray, keep: float) -> None:
+    xa, xb = max(xa, 0), min(xb + 1, row.shape[0])
+    if xa < xb:
+        span = row[xa:xb]
+        span *= keep
+        span += color
+
+
+@dataclass(frozen=True)
+class EllipseFill:
+    box: Box
+    color: RGB
+    alpha: float
+
+    def apply(self, band: np.ndarray, top: int, gen: np.random.Generator) -> None:
+        rows = clip_rows(band, top, self.box[1], self.box[3] + 1)
+        if rows is None:
+            return
+        color = np.asarray(self.color, dtype=np.float32) * self.alpha
+        for r in range(*rows):
+            if (span := ellipse_spans(self.box, r + top)) is not None:
+                blend_span(band[r], span[0], span[1], color, 1.0 - self.alpha)
+
+    def coverage(self, size: tuple[int, int], stride: int = 8) -> float:
+        """Fraction of an image of `size` covered by the ellipse, sampled every `stride` rows."""
+        w, h = size
+        rows = range(max(self.box[1], 0), min(self.box[3] + 1, h), stride)
+        covered = 0
+        for y in rows:
+            if (span := ellipse_spans(self.box, y)) is not None:
+                covered += max(0, min(span[1], w - 1) - max(span[0], 0) + 1)
+        return covered * stride / (w * h)
+
+
+@dataclass(frozen=True)
+class EllipseRing:
+    """Outline of `width` px drawn inward from the bounding box, as ImageDraw.ellipse(outline=...)."""
+
+    box: Box
+    color: RGB
+    alpha: float
+    width: int = 1
+
+    def apply(self, band: np.ndarray, top: int, gen: np.random.Generator) -> None:
+        rows = clip_rows(band, top, self.box[1], self.box[3] + 1)
+        if rows is None:
+            return
+        color = np.asarray(self.color, dtype=np.float32) * self.alpha
+        keep = 1.0 - self.alpha
+        for r in range(*rows):
+            outer = ellipse_spans(self.box, r + top)
+            if outer is None:
+                continue
+            inner = ellipse_spans(self.box, r + top, inset=self.width)
+            if inner is None or inner[0] > inner[1]:
+                blend_span(band[r], outer[0], outer[1], color, keep)
+            else:
+                blend_span(band[r], outer[0], inner[0] - 1, color, keep)
+                blend_span(band[r], inner[1] + 1, outer[1], color, keep)
+
+
+@dataclass(frozen=True)
+class RectOutline:
+    box: Box
+    color: RGB
+    alpha: float
+
+    def apply(self, band: np.ndarray, top: int, gen: np.random.Generator) -> None:
+        x0, y0, x1, y1 = self.box
+        rows = clip_rows(band, top, y0, y1 + 1)
+        if rows is None:
+            return
+        color = np.asarray(self.color, dtype=np.float32) * self.alpha
+        keep = 1.0 - self.alpha
+        edges = [band[rows[0] : rows[1], x0], band[rows[0] : rows[1], x1]]
+        for y in (y0, y1):
+            if rows[0] <= y - top < rows[1]:
+                edges.append(band[y - top, x0 + 1 : x1])
+        for edge in edges:
+            edge *= keep
+            edge += color
+
+
+@dataclass(frozen=True)
+class Line:
+    """One-pixel line between two points, as used for fax transmission streaks."""
+
+    x0: int
+    y0: int
+    x1: int
+    y1: int
+    color: RGB
+    alpha: float
+
+    def apply(self, band: np.ndarray, top: int, gen: np.random.Generator) -> None:
+        if clip_rows(band, top, min(self.y0, self.y1), max(self.y0, self.y1) + 1) is None:
+            return
+        xs = np.arange(self.x0, self.x1 + 1)
+        ys = np.rint(self.y0 + (self.y1 - self.y0) * (xs - self.x0) / max(self.x1 - self.x0, 1)).astype(int) - top
+        keep = (ys >= 0) & (ys < band.shape[0])
+        ys, xs = ys[keep], xs[keep]
+        band[ys, xs] = band[ys, xs] * (1.0 - self.alpha) + np.asarray(self.color, dtype=np.float32) * self.alpha
+
+
+@dataclass(frozen=True)
+class Speckles:
+    """Opaque gray dust pixels; coordinates are image-absolute."""
+
+    xs: np.ndarray
+    ys: np.ndarray
+    values: np.ndarray
+
+    @classmethod
+    def random(cls, size: tuple[int, int], count: int, gen: np.random.Generator, low: int = 140, high: int = 210) -> Speckles:
+        w, h = size
+        return cls(gen.integers(0, w, count), gen.integers(0, h, count), gen.integers(low, high + 1, count))
+
+    def apply(self, band: np.ndarray, top: int, gen: np.random.Generator) -> None:
+        keep = (self.ys >= top) & (self.ys < top + band.shape[0])
+        band[self.ys[keep] - top, self.xs[keep]] = self.values[keep, None]
+
+
+@dataclass(frozen=True)
+class Monochrome:
+    """Grayscale, then stretch contrast around `pivot` (PIL's ImageEnhance.Contrast uses the image mean)."""
+
+    contrast: float = 1.0
+    pivot: float = 128.0
+
+    def apply(self, band: np.ndarray, top: int, gen: np.random.Generator) -> None:
+        gray = band @ LUMA
+        if self.contrast != 1.0:
+            gray *= self.contrast
+            gray += self.pivot * (1.0 - self.contrast)
+        for channel in range(3):
+            band[..., channel] = gray
+
+
+@dataclass(frozen=True)
+class GaussianNoise:
+    """Blend toward monochrome gaussian noise centred on mid-gray, like Image.effect_noise + Image.blend."""
+
+    sigma: float
+    blend: float
+
+    def apply(self, band: np.ndarray, top: int, gen: np.random.Generator) -> None:
+        noise = noise_window("normal", *band.shape[:2], gen) * (self.sigma * self.blend)
+        noise += 128.0 * self.blend
+        band *= 1.0 - self.blend
+        band += noise
+
+
+def apply_effects(img: Image.Image, effects: list[Effect], seed: int | None = None) -> Image.Image:
+    if not effects:
+        return img
+    arr = np.array(img if img.mode == "RGB" else img.convert("RGB"), dtype=np.uint8)
+    gen = np.random.default_rng(seed)
+    for top in range(0, arr.shape[0], BAND_ROWS):
+        band = arr[top : top + BAND_ROWS].astype(np.float32)
+        for effect in effects:
+            effect.apply(band, top, gen)
+        band += 0.5
+        np.clip(band, 0, 255, out=band)
+        arr[top : top + BAND_ROWS] = band
+    return Image.fromarray(arr)
+
+
+def mean_luma(img: Image.Image, stride: int = 8) -> float:
+    """Cheap strided estimate of the mean grayscale value, for Monochrome pivots."""
+    sample = np.asarray(img if img.mode == "RGB" else img.convert("RGB"))[::stride, ::stride].astype(np.float32)
+    return float((sample @ LUMA).mean())
@@ -0,0 +1,255 @@
+"""Single-pass geometric distortion of rendered pages: rotation, crop-to-fit, perspective skew and blur.
+
+The whole chain is folded into one output-to-source projective matrix and resampled once. The
+output is produced in horizontal strips: each strip crops just the source region it maps to,
+blurs that region (with a margin so the result matches blurring the whole page first) and
+resamples it into place. Peak extra memory is therefore one strip plus its source window,
+bounded by a configurable budget, instead of the blurred, rotated, expanded and re-fitted
+full-page copies the step-by-step PIL chain allocates.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+from PIL import Image, ImageFilter
+
+DEFAULT_BUDGET_MB = 8
+MIN_STRIP_ROWS = 32
+FIXED_ONE = 65536  # PIL's NEAREST affine path steps through the output in 16.16 fixed point
+RGB = tuple[int, int, int]
+
+
+class GeometrySettings:
+    def __init__(self, budget_mb: float = DEFAULT_BUDGET_MB) -> None:
+        self.budget_bytes = int(budget_mb * 2**20)
+
+    def configure(self, budget_mb: float = DEFAULT_BUDGET_MB) -> None:
+        """Set the per-warp working-memory budget; also used from ProcessPoolExecutor initializers."""
+        self.budget_bytes = int(budget_mb * 2**20)
+
+
+GEOMETRY = GeometrySettings()
+
+
+@dataclass(frozen=True)
+class Distortion:
+    """Scan-style distortion applied in the order blur, perspective skew, rotation, crop-to-fit."""
+
+    rotation_degrees: float = 0.0
+    skew: float = 0.0  # keystone: the top edge is narrowed by this fraction of the page width
+    blur_px: float = 0.0
+
+    def matrix(self, size: tuple[int, int]) -> np.ndarray:
+        """Output-to-source matrix for a page of `size` that keeps its size after distortion."""
+        matrix = np.eye(3)
+        if self.rotation_degrees:
+            matrix = fit_rotation_matrix(size, self.rotation_degrees)
+        if self.skew:
+            matrix = keystone_matrix(size, self.skew) @ matrix
+        return matrix
+
+
+def translation(dx: float, dy: float) -> np.ndarray:
+    return np.array([[1.0, 0.0, dx], [0.0, 1.0, dy], [0.0, 0.0, 1.0]])
+
+
+def rotation_matrix(size: tuple[int, int], degrees: float) -> tuple[np.ndarray, tuple[int, int]]:
+    """Output-to-source matrix and canvas size of `Image.rotate(degrees, expand=True)`, computed as PIL does."""
+    w, h = size
+    angle = -math.radians(degrees % 360.0)
+    cos, sin = round(math.cos(angle), 15), round(math.sin(angle), 15)
+    linear = np.array([[cos, sin], [-sin, cos]])
+    offset = linear @ np.array([-w / 2, -h / 2]) + np.array([w / 2, h / 2])
+    corners = np.array([[0, 0], [w, 0], [w, h], [0, h]], dtype=float) @ linear.T + offset
+    nw = math.ceil(corners[:, 0].max()) - math.floor(corners[:, 0].min())
+    nh = math.ceil(corners[:, 1].max()) - math.floor(corners[:, 1].min())
+    offset = linear @ np.array([-(nw - w) / 2.0, -(nh - h) / 2.0]) + offset
+    matrix = np.eye(3)
+    matrix[:2, :2] = linear
+    matrix[:2, 2] = offset
+    return matrix, (nw, nh)
+
+
+def fit_rotation_matrix(size: tuple[int, int], degrees: float) -> np.ndarray:
+    """Rotate with expand, then scale the centred crop back to `size` (as ImageOps.fit does)."""
+    w, h = size
+    rotate, (nw, nh) = rotation_matrix(size, degrees)
+    scale = min(nw / w, nh / h)
+    fit = translation(nw / 2, nh / 2) @ np.diag([scale, scale, 1.0]) @ translation(-w / 2, -h / 2)
+    return rotate @ fit
+
+
+def homography(src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """Projective matrix mapping each of four `src` points onto the matching `dst` point."""
+    rows, rhs = [], []
+    for (x, y), (u, v) in zip(src, dst):
+        rows.append([x, y, 1, 0, 0, 0, -u * x, -u * y])
+        rows.append([0, 0, 0, x, y, 1, -v * x, -v * y])
+        rhs.extend([u, v])
+    coeffs = np.linalg.solve(np.array(rows, dtype=float), np.array(rhs, dtype=float))
+    return np.append(coeffs, 1.0).reshape(3, 3)
+
+
+def keystone_matrix(size: tuple[int, int], skew: float) -> np.ndarray:
+    """Map a page whose top edge is narrowed by `skew` (a fraction of its width) back to the flat page."""
+    w, h = size
+    inset = w * skew / 2
+    trapezoid = np.array([[inset, 0], [w - inset, 0], [w, h], [0, h]], dtype=float)
+    page = np.array([[0, 0], [w, 0], [w, h], [0, h]], dtype=float)
+    return homography(trapezoid, page)
+
+
+def fix(value: float) -> int:
+    """`value` in 16.16 fixed point, rounded as PIL's affine_fixed() rounds it."""
+    return math.floor(value * FIXED_ONE + 0.5)
+
+
+def nearest_affine_data(matrix: np.ndarray, start: tuple[int, int], window: tuple[int, int]) -> tuple[float, ...]:
+    """AFFINE data for one strip that samples exactly as a single NEAREST transform through `matrix` would.
+
+    That transform starts at its output origin and adds the fixed-point column and row steps pixel
+    by pixel, so re-deriving a strip's constant terms in floating point rounds differently. The
+    strip (starting `start` = (columns, rows) from the origin, sampling a crop whose top-left is
+    `window` in source pixels) instead gets constants that land on the same fixed-point values.
+    """
+    a0, a1, a2, a3, a4, a5 = (float(value) for value in (matrix / matrix[2, 2])[:2].ravel())
+    column, row = start
+    x = fix(a2 + a0 * 0.5 + a1 * 0.5) + row * fix(a1) + column * fix(a0) - window[0] * FIXED_ONE
+    y = fix(a5 + a3 * 0.5 + a4 * 0.5) + row * fix(a4) + column * fix(a3) - window[1] * FIXED_ONE
+    return (a0, a1, x / FIXED_ONE - a0 * 0.5 - a1 * 0.5, a3, a4, y / FIXED_ONE - a3 * 0.5 - a4 * 0.5)
+
+
+def project(matrix: np.ndarray, points: np.ndarray) -> np.ndarray:
+    homogeneous = np.c_[points, np.ones(len(points))] @ matrix.T
+    return homogeneous[:, :2] / homogeneous[:, 2:]
+
+
+def source_window(
+    matrix: np.ndarray,
+    box: tuple[int, int, int, int],
+    src_size: tuple[int, int],
+    margin: int,
+) -> tuple[int, int, int, int] | None:
+    """Bounding box of the source pixels that output `box` samples, widened by `margin` and clipped."""
+    x0, y0, x1, y1 = box
+    corners = project(matrix, np.array([[x0, y0], [x1, y0], [x0, y1], [x1, y1]], dtype=float))
+    left = max(0, math.floor(corners[:, 0].min()) - margin)
+    top = max(0, math.floor(corners[:, 1].min()) - margin)
+    right = min(src_size[0], math.ceil(corners[:, 0].max()) + margin)
+    bottom = min(src_size[1], math.ceil(corners[:, 1].max()) + margin)
+    return (left, top, right, bottom) if left < right and top < bottom else None
+
+
+def strip_rows(
+    matrix: np.ndarray,
+    box: tuple[int, int, int, int],
+    src_size: tuple[int, int],
+    margin: int,
+    blur: bool,
+    bytes_per_pixel: int,
+    budget: int,
+) -> int:
+    """Tallest strip whose output, source window and (if blurring) blurred copy fit in `budget` bytes."""
+    x0, y0, x1, y1 = box
+    rows = y1 - y0
+    while rows > MIN_STRIP_ROWS:
+        window = source_window(matrix, (x0, y0, x1, y0 + rows), src_size, margin)
+        window_px = 0 if window is None else (window[2] - window[0]) * (window[3] - window[1])
+        cost = ((x1 - x0) * rows + window_px * (2 if blur else 1)) * bytes_per_pixel
+        if cost <= budget:
+            break
+        rows //= 2
+    return max(rows, 1)
+
+
+def warp_into(
+    dst: Image.Image,
+    src: Image.Image,
+    matrix: np.ndarray,
+    box: tuple[int, int, int, int],
+    *,
+    fillcolor: RGB,
+    resample: Image.Resampling = Image.Resampling.BICUBIC,
+    blur_px: float = 0.0,
+    budget: int | None = None,
+    origin: tuple[int, int] = (0, 0),
+) -> None:
+    """Fill `box` of `dst` by sampling (optionally blurred) `src` through `matrix`, strip by strip.
+
+    `matrix` maps `dst` pixel coordinates, taken relative to `origin`, to `src` coordinates; pixels
+    that map outside `src` get `fillcolor`. NEAREST affine warps match one PIL transform of the
+    whole output anchored at `origin` pixel for pixel, however the box is split into strips.
+    """
+    budget = GEOMETRY.budget_bytes if budget is None else budget
+    margin = (math.ceil(3 * blur_px) + 3) if blur_px > 0 else 3
+    bytes_per_pixel = 1 if src.mode in {"1", "L", "P"} else 4  # PIL stores multi-band pixels in 32 bits
+    x0, y0, x1, y1 = box
+    placed = matrix @ translation(-origin[0], -origin[1])
+    rows = strip_rows(placed, box, src.size, margin, blur_px > 0, bytes_per_pixel, budget)
+    for top in range(y0, y1, rows):
+        bottom = min(y1, top + rows)
+        window = source_window(placed, (x0, top, x1, bottom), src.size, margin)
+        if window is None:
+            dst.paste(fillcolor, (x0, top, x1, bottom))
+            continue
+        region = src.crop(window)
+        if blur_px > 0:
+            region = region.filter(ImageFilter.GaussianBlur(radius=blur_px))
+        local = translation(-window[0], -window[1]) @ placed @ translation(x0, top)
+        local /= local[2, 2]
+        if np.allclose(local[2, :2], 0.0) and resample == Image.Resampling.NEAREST:
+            start = (x0 - origin[0], top - origin[1])
+            method, data = Image.Transform.AFFINE, nearest_affine_data(matrix, start, window[:2])
+        elif np.allclose(local[2, :2], 0.0):
+            method, data = Image.Transform.AFFINE, tuple(local[:2].ravel())
+        else:
+            method, data = Image.Transform.PERSPECTIVE, tuple(local.ravel()[:8])
+        strip = region.transform((x1 - x0, bottom - top), method, data, resample, fillcolor=fillcolor)
+        dst.paste(strip, (x0, top))
+
+
+def distort(img: Image.Image, distortion: Distortion, *, fillcolor: RGB, budget: int | None = None) -> Image.Image:
+    """Apply `distortion` to `img` in one strip-wise resampling pass; the result keeps `img.size`."""
+    if not (distortion.rotation_degrees or distortion.skew):
+        if distortion.blur_px > 0:
+            return img.filter(ImageFilter.GaussianBlur(radius=distortion.blur_px))
+        return img
+    out = Image.new(img.mode, img.size, fillcolor)
+    warp_into(
+        out,
+        img,
+        distortion.matrix(img.size),
+        (0, 0, *img.size),
+        fillcolor=fillcolor,
+        blur_px=distortion.blur_px,
+        budget=budget,
+    )
+    return out
+
+
+def paste_rotated(
+    dst: Image.Image,
+    layer: Image.Image,
+    degrees: float,
+    *,
+    fillcolor: RGB,
+    resample: Image.Resampling = Image.Resampling.NEAREST,
+    budget: int | None = None,
+) -> None:
+    """Paste `layer.rotate(degrees, expand=True, fillcolor=...)` centred on `dst` without building the rotated layer.
+
+    With the default NEAREST resampling the result is pixel-identical to that rotate and paste.
+    """
+    if degrees % 90 == 0:
+        # PIL copies or transposes quarter turns instead of resampling; that costs no extra memory either.
+        turned = layer.rotate(degrees, expand=True, fillcolor=fillcolor)
+        dst.paste(turned, ((dst.width - turned.width) // 2, (dst.height - turned.height) // 2))
+        return
+    rotate, (nw, nh) = rotation_matrix(layer.size, degrees)
+    x = (dst.width - nw) // 2
+    y = (dst.height - nh) // 2
+    box = (max(x, 0), max(y, 0), min(x + nw, dst.width), min(y + nh, dst.height))
+    warp_into(dst, layer, rotate, box, fillcolor=fillcolor, resample=resample, budget=budget, origin=(x, y))
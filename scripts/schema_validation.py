@@ -0,0 +1,238 @@
+"""Compiled, disk-cached JSON Schema validation for applicant datasets, one applicant at a time.
+
+Building a `Draft202012Validator` is cheap; checking the schema itself against the 2020-12
+meta-schema is not, and it used to happen on every generator run. `SCHEMAS` compiles a schema
+once per process, keyed by a SHA-256 digest of its canonical JSON, and records each schema that
+passed the meta-schema check under `.cache/schema/<digest>.json`, so later runs skip that check
+(pool workers trust the schema their parent checked). An edited schema gets a new digest and is
+checked again.
+
+A dataset schema is split into an envelope (header fields and the applicant count, with the
+applicant items left open) and an item schema, so applicants can be checked independently:
+`StreamingValidator` checks them as they flow to a writer, in batches spread over a worker pool
+with `jobs > 1`, and collects every error with its JSON path (e.g.
+`$.applicants[3].Document_Bundle[0].Rendering_Method`) instead of stopping at the first one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from copy import deepcopy
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import ValidationError
+
+from dataset_stream import APPLICANTS_KEY
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMA_CACHE_DIR = ROOT / ".cache" / "schema"
+BATCH_SIZE = 64
+REPORT_LIMIT = 25
+
+
+@dataclass(frozen=True)
+class SchemaIssue:
+    path: str  # JSON path into the dataset, e.g. $.applicants[3].Applicant_ID
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+
+class DatasetValidationError(ValueError):
+    def __init__(self, issues: list[SchemaIssue]) -> None:
+        self.issues = issues
+        shown = [f"  {issue}" for issue in issues[:REPORT_LIMIT]]
+        if len(issues) > REPORT_LIMIT:
+            shown.append(f"  ... and {len(issues) - REPORT_LIMIT} more")
+        super().__init__(f"{len(issues)} schema error(s):\n" + "\n".join(shown))
+
+
+class SchemaCache:
+    def __init__(self, root: Path | None = SCHEMA_CACHE_DIR) -> None:
+        self.root = root
+        self.validators: dict[str, Draft202012Validator] = {}
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+    def configure(self, root: Path | None = SCHEMA_CACHE_DIR) -> None:
+        """Set persistence (None keeps compiled schemas in memory only); also used by pool initializers."""
+        self.root = root
+
+    @staticmethod
+    def key(schema: dict[str, Any]) -> str:
+        payload = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> Path | None:
+        return self.root / f"{key}.json" if self.root else None
+
+    def compile(self, schema: dict[str, Any], checked: bool = False) -> tuple[str, Draft202012Validator]:
+        """(digest, validator) for `schema`; the meta-schema check runs only for digests not seen before.
+
+        `checked=True` skips the check for schemas derived from one that already passed it.
+        """
+        key = self.key(schema)
+        validator = self.validators.get(key)
+        if validator is not None:
+            self.hits += 1
+            return key, validator
+        self.misses += 1
+        path = self.path(key)
+        if path is not None and path.exists():
+            self.disk_hits += 1
+        elif not checked:
+            Draft202012Validator.check_schema(schema)
+            self.save(key, schema)
+        validator = self.validators[key] = Draft202012Validator(schema)
+        return key, validator
+
+    def save(self, key: str, schema: dict[str, Any]) -> None:
+        path = self.path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+        tmp.write_text(json.dumps(schema, sort_keys=True, separators=(",", ":")) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+
+    def stats(self) -> dict[str, Any]:
+        return {"hits": self.hits, "misses": self.misses, "disk_hits": self.disk_hits}
+
+
+SCHEMAS = SchemaCache()
+
+
+def split_schema(schema: dict[str, Any], key: str = APPLICANTS_KEY) -> tuple[dict[str, Any], dict[str, Any]]:
+    """(envelope, item schema): the dataset schema with `key` items left open, and the items' schema."""
+    envelope = deepcopy(schema)
+    items = envelope["properties"][key].pop("items")
+    item_schema = {"$schema": schema["$schema"], **items}
+    if "$defs" in schema:
+        item_schema["$defs"] = schema["$defs"]
+    return envelope, item_schema
+
+
+def issue(error: ValidationError, prefix: str) -> SchemaIssue:
+    return SchemaIssue(prefix + error.json_path[1:], error.message)
+
+
+def issues_for(validator: Draft202012Validator, instance: Any, prefix: str = "$") -> list[SchemaIssue]:
+    errors = sorted(validator.iter_errors(instance), key=lambda error: list(error.absolute_path))
+    return [issue(error, prefix) for error in errors]
+
+
+def init_worker(item_schema: dict[str, Any]) -> None:
+    SCHEMAS.compile(item_schema, checked=True)
+
+
+def check_batch(digest: str, prefix: str, start: int, batch: list[Any]) -> list[SchemaIssue]:
+    validator = SCHEMAS.validators[digest]
+    found: list[SchemaIssue] = []
+    for offset, record in enumerate(batch):
+        found.extend(issues_for(validator, record, f"{prefix}[{start + offset}]"))
+    return found
+
+
+class StreamingValidator:
+    """Check applicants on their way to a writer; raises DatasetValidationError with every issue at the end.
+
+    Wrap the iterable handed to `write_ndjson`/`write_dataset_stream`: records are passed through
+    in order once their batch has been checked, and because the error is raised from inside the
+    writer's loop, the atomic writers discard the partial file. With `jobs > 1` batches are checked
+    in a process pool with at most `2 * jobs` batches in flight, so memory stays flat.
+    """
+
+    def __init__(
+        self,
+        schema: dict[str, Any],
+        *,
+        key: str = APPLICANTS_KEY,
+        jobs: int = 1,
+        batch_size: int = BATCH_SIZE,
+    ) -> None:
+        self.key = key
+        self.envelope, self.item_schema = split_schema(schema, key)
+        SCHEMAS.compile(schema)
+        self.digest, _ = SCHEMAS.compile(self.item_schema, checked=True)
+        self.batch_size = max(1, batch_size)
+        self.jobs = jobs
+        self.issues: list[SchemaIssue] = []
+        self.count = 0
+        self.pool: ProcessPoolExecutor | None = None
+        if jobs > 1:
+            self.pool = ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=init_worker,
+                initargs=(self.item_schema,),
+            )
+
+    def __enter__(self) -> StreamingValidator:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.shutdown(cancel_futures=True)
+            self.pool = None
+
+    def check_header(self, header: dict[str, Any], count: int) -> None:
+        """Check header fields and the applicant count against the envelope (json layout only)."""
+        _, validator = SCHEMAS.compile(self.envelope, checked=True)
+        for found in issues_for(validator, {**header, self.key: [None] * count}):
+            if found.path == f"$.{self.key}":
+                # The placeholder list only carries the count; don't print it back.
+                found = SchemaIssue(found.path, f"{count} records do not satisfy the schema's item count limits")
+            self.issues.append(found)
+
+    def batches(self, records: Iterable[Any]) -> Iterator[list[Any]]:
+        iterator = iter(records)
+        while batch := list(islice(iterator, self.batch_size)):
+            yield batch
+
+    def check(self, records: Iterable[Any]) -> Iterator[Any]:
+        prefix = f"$.{self.key}"
+        if self.pool is None:
+            for batch in self.batches(records):
+                self.issues.extend(check_batch(self.digest, prefix, self.count, batch))
+                self.count += len(batch)
+                yield from batch
+        else:
+            pending: deque[tuple[list[Any], Future[list[SchemaIssue]]]] = deque()
+            for batch in self.batches(records):
+                pending.append((batch, self.pool.submit(check_batch, self.digest, prefix, self.count, batch)))
+                self.count += len(batch)
+                while len(pending) >= 2 * self.jobs:
+                    done, future = pending.popleft()
+                    self.issues.extend(future.result())
+                    yield from done
+            while pending:
+                done, future = pending.popleft()
+                self.issues.extend(future.result())
+                yield from done
+        self.raise_for_issues()
+
+    def raise_for_issues(self) -> None:
+        if self.issues:
+            raise DatasetValidationError(self.issues)
+
+
+def validate_dataset(schema: dict[str, Any], dataset: dict[str, Any], jobs: int = 1, key: str = APPLICANTS_KEY) -> None:
+    """Check an in-memory dataset; DatasetValidationError lists every issue, header ones first."""
+    header = {name: value for name, value in dataset.items() if name != key}
+    records = dataset.get(key, [])
+    with StreamingValidator(schema, key=key, jobs=jobs) as validator:
+        validator.check_header(header, len(records))
+        for _ in validator.check(records):
+            pass
@@ -0,0 +1,136 @@
+"""Line wrapping by measured advance width, shared by the PDF (reportlab) and raster (PIL) renderers.
+
+Widths come from the real font metrics: reportlab `stringWidth` for PDF base fonts and PIL
+`getlength` for TrueType fonts. Each font gets a `GlyphWidths` table that measures a character the
+first time it is seen and sums cached advances after that, so wrapping a long transcript costs a
+dictionary lookup per character rather than a font call per candidate line. Kerning is ignored,
+which matches reportlab exactly and PIL's basic layout to within a pixel or so per line.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Iterable, Iterator
+
+from PIL import ImageFont
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+WHITESPACE = re.compile(r"(\s+)")
+
+
+class GlyphWidths:
+    """Advance width of each character of one font at one size, measured once and memoized."""
+
+    def __init__(self, measure: Callable[[str], float]) -> None:
+        self.measure = measure
+        self.widths: dict[str, float] = {}
+
+    def width(self, text: str) -> float:
+        widths = self.widths
+        total = 0.0
+        for ch in text:
+            advance = widths.get(ch)
+            if advance is None:
+                advance = widths[ch] = self.measure(ch)
+            total += advance
+        return total
+
+
+class MetricsRegistry:
+    """One GlyphWidths table per PDF font name/size and per PIL font object."""
+
+    def __init__(self) -> None:
+        self.tables: dict[tuple[Any, ...], GlyphWidths] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: tuple[Any, ...], measure: Callable[[str], float]) -> GlyphWidths:
+        table = self.tables.get(key)
+        if table is None:
+            self.misses += 1
+            table = self.tables[key] = GlyphWidths(measure)
+        else:
+            self.hits += 1
+        return table
+
+    def pdf(self, font_name: str, font_size: float) -> GlyphWidths:
+        return self.lookup(("pdf", font_name, font_size), lambda ch: stringWidth(ch, font_name, font_size))
+
+    def pil(self, font: ImageFont.ImageFont | ImageFont.FreeTypeFont) -> GlyphWidths:
+        key = ("pil", getattr(font, "path", None) or id(font), getattr(font, "size", None))
+        return self.lookup(key, font.getlength)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "fonts": len(self.tables),
+            "glyphs": sum(len(table.widths) for table in self.tables.values()),
+        }
+
+
+METRICS = MetricsRegistry()
+
+
+def split_long(word: str, max_width: float, metrics: GlyphWidths) -> list[str]:
+    """Break a single word that is wider than the line at character boundaries."""
+    pieces: list[str] = []
+    current = ""
+    for ch in word:
+        if current and metrics.width(current + ch) > max_width:
+            pieces.append(current)
+            current = ch
+        else:
+            current += ch
+    return [*pieces, current]
+
+
+def wrap(text: str, max_width: float, metrics: GlyphWidths) -> list[str]:
+    """Greedy word wrap of `text` into lines no wider than `max_width` (font units: points or pixels).
+
+    Runs of spaces inside a line are kept so column-aligned text stays aligned; whitespace where a
+    line breaks is dropped. An empty string yields one empty line.
+    """
+    if not text or metrics.width(text) <= max_width:
+        return [text]
+    lines: list[str] = []
+    current = ""
+    current_width = 0.0
+    for token in WHITESPACE.split(text):
+        if not token:
+            continue
+        token_width = metrics.width(token)
+        if current_width + token_width <= max_width:
+            current += token
+            current_width += token_width
+            continue
+        if token.isspace():
+            lines.append(current.rstrip())
+            current, current_width = "", 0.0
+            continue
+        if current.strip():
+            lines.append(current.rstrip())
+        if token_width > max_width:
+            *full, token = split_long(token, max_width, metrics)
+            lines.extend(full)
+        current, current_width = token, metrics.width(token)
+    if current.strip() or not lines:
+        lines.append(current.rstrip())
+    return lines
+
+
+def wrap_all(lines: Iterable[str], max_width: float, metrics: GlyphWidths) -> list[str]:
+    return [chunk for line in lines for chunk in wrap(str(line), max_width, metrics)]
+
+
+def paginate(rows: Iterable[Any], per_page: int, first_page: int | None = None) -> Iterator[list[Any]]:
+    """Split laid-out rows into pages of `per_page` (the first page may hold `first_page` instead)."""
+    capacity = per_page if first_page is None else first_page
+    page: list[Any] = []
+    for row in rows:
+        if len(page) >= capacity:
+            yield page
+            page, capacity = [], per_page
+        page.append(row)
+    if page:
+        yield page
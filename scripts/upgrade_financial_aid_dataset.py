@@ -6,9 +6,12 @@
 from __future__ import annotations
 
 import json
+from copy import deepcopy
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+from dataset_stream import open_dataset, write_dataset_stream
 
 ROOT = Path(__file__).resolve().parents[1]
 DATA_ROOT = ROOT / "financial-aid" / "data"
@@ -929,108 +932,131 @@ def append_doc_if_missing(app: dict[str, Any], doc: dict[str, Any]) -> None:
         docs.append(doc)
 
 
-def main() -> None:
-    data = json.loads(DATA_FILE.read_text(encoding="utf-8"))
+CHAT_BUILDERS = {
+    "FA-001": make_fa001_chat,
+    "FA-003": make_fa003_chat,
+    "FA-005": make_fa005_chat,
+    "FA-007": make_fa007_chat,
+    "FA-009": make_fa009_chat,
+    "FA-010": make_fa010_chat,
+    "FA-011": make_fa011_chat,
+}
+
+# Extra webp docs for longer-chat profiles where helpful.
+EXTRA_DOCS: dict[str, dict[str, Any]] = {
+    "FA-003": {
+        "doc_id": "FA003-D5",
+        "doc_type": "Self_Support_Note_Photo",
+        "title": "Self Support Expense Note (Phone Photo)",
+        "file_name": "05_self_support_note_phone_photo.webp",
+        "format": "webp",
+        "document_role": "student_upload",
+        "issuer": "Student Provided",
+        "issue_date": "2026-03-02",
+        "render_template": "handwritten_note_photo",
+        "quality_flags": ["2_degree_skew", "blurry", "low_light", "compression_noise"],
+        "structured_fields": {
+            "student_name": "Carlos Mendoza",
+            "monthly_rent": "$1,050",
+            "food_transport": "$410",
+            "note": "Self-supported with hourly construction income",
+        },
+        "body_lines": [
+            "Handwritten personal budget note attached as supplemental evidence.",
+            "Used by AI to enrich separation and self-support details.",
+        ],
+        "file_link": "./05_self_support_note_phone_photo.webp",
+    },
+    "FA-011": {
+        "doc_id": "FA011-D4",
+        "doc_type": "Household_Budget_Note_Photo",
+        "title": "Household Budget Notes (Mobile Photo)",
+        "file_name": "04_household_budget_note_photo.webp",
+        "format": "webp",
+        "document_role": "student_upload",
+        "issuer": "Student Provided",
+        "issue_date": "2026-03-02",
+        "render_template": "budget_note_photo",
+        "quality_flags": ["2_degree_skew", "shadow_glare", "compression_noise"],
+        "structured_fields": {
+            "student_name": "Fatima Al-Khalil",
+            "rent": "$1,840",
+            "utilities": "$290",
+            "childcare": "$460",
+        },
+        "body_lines": [
+            "Photo of handwritten budget notes to support consortium planning.",
+            "Used to contextualize relocation cash-flow constraints.",
+        ],
+        "file_link": "./04_household_budget_note_photo.webp",
+    },
+}
+
+# Outcomes where turn counts/flow changed.
+OUTCOME_UPDATES = {
+    "FA-005": "submitted_after_signature",
+    "FA-011": "escalated_and_submitted_for_coordinator_review",
+}
 
-    by_id = {app["applicant_id"]: app for app in data["applicants"]}
 
-    # Extend / revise long-form chats.
-    for app_id, builder in {
-        "FA-001": make_fa001_chat,
-        "FA-003": make_fa003_chat,
-        "FA-005": make_fa005_chat,
-        "FA-007": make_fa007_chat,
-        "FA-009": make_fa009_chat,
-        "FA-010": make_fa010_chat,
-        "FA-011": make_fa011_chat,
-    }.items():
-        app = by_id[app_id]
+def upgrade_applicant(app: dict[str, Any]) -> dict[str, Any]:
+    app_id = app["applicant_id"]
+    if app_id in CHAT_BUILDERS:
+        # Extend / revise long-form chats.
         first_ts = app["chat_conversation"][0]["timestamp"]
-        app["chat_conversation"] = stamp(builder(), first_ts)
+        app["chat_conversation"] = stamp(CHAT_BUILDERS[app_id](), first_ts)
+    if app_id in EXTRA_DOCS:
+        append_doc_if_missing(app, deepcopy(EXTRA_DOCS[app_id]))
+    if app_id in OUTCOME_UPDATES:
+        app["conversation_outcome"]["status"] = OUTCOME_UPDATES[app_id]
 
-    # Add extra webp docs for longer-chat profiles where helpful.
-    append_doc_if_missing(
-        by_id["FA-003"],
-        {
-            "doc_id": "FA003-D5",
-            "doc_type": "Self_Support_Note_Photo",
-            "title": "Self Support Expense Note (Phone Photo)",
-            "file_name": "05_self_support_note_phone_photo.webp",
-            "format": "webp",
-            "document_role": "student_upload",
-            "issuer": "Student Provided",
-            "issue_date": "2026-03-02",
-            "render_template": "handwritten_note_photo",
-            "quality_flags": ["2_degree_skew", "blurry", "low_light", "compression_noise"],
-            "structured_fields": {
-                "student_name": "Carlos Mendoza",
-                "monthly_rent": "$1,050",
-                "food_transport": "$410",
-                "note": "Self-supported with hourly construction income",
-            },
-            "body_lines": [
-                "Handwritten personal budget note attached as supplemental evidence.",
-                "Used by AI to enrich separation and self-support details.",
-            ],
-            "file_link": "./05_self_support_note_phone_photo.webp",
-        },
-    )
+    # Keep folder links aligned.
+    app["chat_conversation"] = sorted(app["chat_conversation"], key=lambda x: x["turn"])
+    for doc in app["document_bundle"]:
+        doc["file_link"] = f"./{doc['file_name']}"
+    return app
 
-    append_doc_if_missing(
-        by_id["FA-011"],
-        {
-            "doc_id": "FA011-D4",
-            "doc_type": "Household_Budget_Note_Photo",
-            "title": "Household Budget Notes (Mobile Photo)",
-            "file_name": "04_household_budget_note_photo.webp",
-            "format": "webp",
-            "document_role": "student_upload",
-            "issuer": "Student Provided",
-            "issue_date": "2026-03-02",
-            "render_template": "budget_note_photo",
-            "quality_flags": ["2_degree_skew", "shadow_glare", "compression_noise"],
-            "structured_fields": {
-                "student_name": "Fatima Al-Khalil",
-                "rent": "$1,840",
-                "utilities": "$290",
-                "childcare": "$460",
-            },
-            "body_lines": [
-                "Photo of handwritten budget notes to support consortium planning.",
-                "Used to contextualize relocation cash-flow constraints.",
-            ],
-            "file_link": "./04_household_budget_note_photo.webp",
-        },
-    )
 
-    # Update outcomes where turn counts/flow changed.
-    by_id["FA-005"]["conversation_outcome"]["status"] = "submitted_after_signature"
-    by_id["FA-011"]["conversation_outcome"]["status"] = "escalated_and_submitted_for_coordinator_review"
+def manifest_entry(app: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "applicant_id": app["applicant_id"],
+        "full_name": app["profile"]["full_name"],
+        "folder": app["folder_name"],
+        "documents": [d["file_name"] for d in app["document_bundle"]],
+        "chat_turns": len(app["chat_conversation"]),
+        "outcome": app["conversation_outcome"]["status"],
+    }
+
 
-    # Keep folder links aligned and write data.
-    for app in data["applicants"]:
-        app["chat_conversation"] = sorted(app["chat_conversation"], key=lambda x: x["turn"])
-        for doc in app["document_bundle"]:
-            doc["file_link"] = f"./{doc['file_name']}"
+def main() -> None:
+    # Applicants are read, upgraded and written back one at a time, so memory does not grow with
+    # the dataset; a first pass over the ids checks every upgrade target exists before rewriting.
+    _, applicants = open_dataset(DATA_FILE)
+    seen = {app["applicant_id"] for app in applicants}
+    missing = sorted((CHAT_BUILDERS.keys() | EXTRA_DOCS.keys() | OUTCOME_UPDATES.keys()) - seen)
+    if missing:
+        raise SystemExit(f"Applicants missing from {DATA_FILE}: {', '.join(missing)}")
 
-    DATA_FILE.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    header, applicants = open_dataset(DATA_FILE)
+    entries: list[dict[str, Any]] = []
 
+    def upgraded() -> Iterator[dict[str, Any]]:
+        for app in applicants:
+            app = upgrade_applicant(app)
+            entries.append(manifest_entry(app))
+            yield app
+
+    write_dataset_stream(DATA_FILE, header, upgraded(), ensure_ascii=False, newline=False)
+
+    # The generator records which WEBP profile rendered the scans; the documents are unchanged here.
+    previous = json.loads(MANIFEST_FILE.read_text(encoding="utf-8")) if MANIFEST_FILE.exists() else {}
     manifest = {
-        "dataset_id": data["dataset_id"],
-        "generated_on": data["generated_on"],
-        "notes": data.get("notes", []),
-        "applicant_count": len(data["applicants"]),
-        "applicants": [
-            {
-                "applicant_id": a["applicant_id"],
-                "full_name": a["profile"]["full_name"],
-                "folder": a["folder_name"],
-                "documents": [d["file_name"] for d in a["document_bundle"]],
-                "chat_turns": len(a["chat_conversation"]),
-                "outcome": a["conversation_outcome"]["status"],
-            }
-            for a in data["applicants"]
-        ],
+        "dataset_id": header["dataset_id"],
+        "generated_on": header["generated_on"],
+        "notes": header.get("notes", []),
+        "applicant_count": len(entries),
+        **({"webp_profile": previous["webp_profile"]} if "webp_profile" in previous else {}),
+        "applicants": entries,
     }
     MANIFEST_FILE.write_text(json.dumps(manifest, indent=2, ensure_ascii=False), encoding="utf-8")
 
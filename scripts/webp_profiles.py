@@ -0,0 +1,59 @@
+"""Named WEBP encoder profiles shared by the renderers.
+
+`archival` reproduces the release settings (libwebp method 6 at each caller's quality) and is the
+default, so release renders are unchanged. `balanced` trades a little size for a much faster
+method, and `draft` also drops quality for quick iteration. Use `scripts/webp_sweep.py` to check
+the trade-offs on the current corpus before changing a profile.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Any
+
+from PIL import Image
+
+
+@dataclass(frozen=True)
+class WebpProfile:
+    name: str
+    method: int
+    quality: int | None = None  # None keeps the quality each renderer asks for
+    lossless: bool = False
+
+    def options(self, quality: int) -> dict[str, Any]:
+        return {
+            "quality": quality if self.quality is None else self.quality,
+            "method": self.method,
+            "lossless": self.lossless,
+        }
+
+
+PROFILES = {
+    "draft": WebpProfile("draft", method=0, quality=70),
+    "balanced": WebpProfile("balanced", method=4),
+    "archival": WebpProfile("archival", method=6),
+}
+DEFAULT_PROFILE = "archival"
+
+
+class WebpEncoder:
+    def __init__(self, profile: str = DEFAULT_PROFILE) -> None:
+        self.profile = PROFILES[profile]
+
+    def configure(self, profile: str = DEFAULT_PROFILE) -> None:
+        """Select the profile for this process; also used from ProcessPoolExecutor initializers."""
+        self.profile = PROFILES[profile]
+
+    @property
+    def is_default(self) -> bool:
+        return self.profile.name == DEFAULT_PROFILE
+
+    def encode(self, img: Image.Image, quality: int) -> bytes:
+        buf = BytesIO()
+        img.save(buf, format="WEBP", **self.profile.options(quality))
+        return buf.getvalue()
+
+
+WEBP = WebpEncoder()
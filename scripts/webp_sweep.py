@@ -0,0 +1,130 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.12"
+# dependencies = ["numpy>=1.26", "pillow>=10.4.0"]
+# ///
+
+"""Sweep WEBP encoder settings over the rendered corpus to choose encode profiles from data.
+
+Every source image is decoded once, then re-encoded with each combination of quality and method
+(plus lossless variants and the named profiles in webp_profiles). Each setting reports total
+encode and decode time, mean bytes per image and PSNR against the decoded source. Sources are
+already-encoded renders, so PSNR measures the extra loss from re-encoding, which is enough for
+comparing settings with each other.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from PIL import Image
+
+from contact_sheets import collect_images
+from webp_profiles import PROFILES
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_SOURCES = [ROOT / "credit-checking" / "data" / "applicants", ROOT / "financial-aid" / "data"]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("sources", nargs="*", type=Path, default=DEFAULT_SOURCES, help="Images or directories.")
+    parser.add_argument("--qualities", type=int, nargs="+", default=[60, 70, 80, 85, 90])
+    parser.add_argument("--methods", type=int, nargs="+", default=[0, 2, 4, 6])
+    parser.add_argument("--lossless", action="store_true", help="Also try lossless encoding at each method.")
+    parser.add_argument("--limit", type=int, default=0, help="Use at most this many source images (0 = all).")
+    parser.add_argument("-o", "--output", type=Path, help="Write the sweep results as JSON.")
+    return parser.parse_args()
+
+
+@dataclass(frozen=True)
+class Setting:
+    label: str
+    quality: int
+    method: int
+    lossless: bool = False
+
+
+def sweep_settings(qualities: list[int], methods: list[int], lossless: bool) -> list[Setting]:
+    settings = [
+        Setting(f"profile:{name}", profile.quality if profile.quality is not None else 85, profile.method, profile.lossless)
+        for name, profile in PROFILES.items()
+    ]
+    settings += [Setting(f"q{q}/m{m}", q, m) for q in qualities for m in methods]
+    if lossless:
+        settings += [Setting(f"lossless/m{m}", 100, m, True) for m in methods]
+    return settings
+
+
+def psnr(reference: np.ndarray, candidate: np.ndarray) -> float:
+    mse = float(np.mean((reference.astype(np.float32) - candidate.astype(np.float32)) ** 2))
+    return 99.0 if mse == 0 else round(10 * np.log10(255.0**2 / mse), 2)
+
+
+def run_setting(setting: Setting, images: list[tuple[Image.Image, np.ndarray]]) -> dict[str, Any]:
+    encode_sec = decode_sec = 0.0
+    sizes: list[int] = []
+    scores: list[float] = []
+    for img, reference in images:
+        start = time.perf_counter()
+        buf = BytesIO()
+        img.save(buf, format="WEBP", quality=setting.quality, method=setting.method, lossless=setting.lossless)
+        encode_sec += time.perf_counter() - start
+        data = buf.getvalue()
+        start = time.perf_counter()
+        decoded = Image.open(BytesIO(data))
+        decoded.load()
+        decode_sec += time.perf_counter() - start
+        sizes.append(len(data))
+        scores.append(psnr(reference, np.asarray(decoded.convert("RGB"))))
+    megapixels = sum(img.width * img.height for img, _ in images) / 1e6
+    return {
+        "quality": setting.quality,
+        "method": setting.method,
+        "lossless": setting.lossless,
+        "encode_ms_per_mp": round(encode_sec * 1000 / megapixels, 2),
+        "decode_ms_per_mp": round(decode_sec * 1000 / megapixels, 2),
+        "mean_bytes": round(sum(sizes) / len(sizes)),
+        "total_bytes": sum(sizes),
+        "mean_psnr_db": round(sum(scores) / len(scores), 2),
+        "min_psnr_db": min(scores),
+    }
+
+
+def main() -> None:
+    args = parse_args()
+    paths = [path for path in collect_images(args.sources) if path.suffix.lower() == ".webp"]
+    if args.limit:
+        paths = paths[: args.limit]
+    if not paths:
+        raise SystemExit("No WEBP sources found; render the corpus first or pass image paths.")
+    images = []
+    for path in paths:
+        img = Image.open(path).convert("RGB")
+        images.append((img, np.asarray(img)))
+    print(f"Sweeping {len(images)} images ({sum(i.width * i.height for i, _ in images) / 1e6:.1f} MP)")
+
+    results: dict[str, dict[str, Any]] = {}
+    print(f"{'setting':18} {'enc ms/MP':>10} {'dec ms/MP':>10} {'mean KB':>9} {'PSNR dB':>8} {'min dB':>7}")
+    for setting in sweep_settings(args.qualities, args.methods, args.lossless):
+        r = results[setting.label] = run_setting(setting, images)
+        print(
+            f"{setting.label:18} {r['encode_ms_per_mp']:10.1f} {r['decode_ms_per_mp']:10.1f} "
+            f"{r['mean_bytes'] / 1024:9.1f} {r['mean_psnr_db']:8.2f} {r['min_psnr_db']:7.2f}"
+        )
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"sources": [str(path) for path in paths], "settings": results}
+        args.output.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()